@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""End-to-end benchmark of the plugin's load and publish flows against the local stub server.
+
+Run it with the Python that ships with QGIS, from the plugin directory:
+
+    python3 benchmark/bench_e2e.py --maps 3000 --features 20000 --latency 50 --bandwidth 2000
+
+It starts stub_server.py in this process, then runs each scenario in a fresh child process. Each child
+drives a real ScribbleMapsConnector headlessly with an offscreen QGIS, a throwaway profile and a mocked
+iface. Running scenarios separately keeps them from sharing caches, and gives each its own peak RSS. For
+every scenario the benchmark reports wall time, requests made, bytes sent and received (as counted by the
+stub server), and the child's peak RSS. Only the measured step is timed: signing in and fetching the list
+before a load, for example, is set-up.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import importlib
+import subprocess
+import urllib.request
+from optparse import OptionParser
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, BENCHMARK_DIR)
+
+import stub_server
+
+SCENARIOS = ['map list', 'load smjson', 'load kml', 'load repeat', 'load early', 'publish local', 'publish server', 'republish']
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024.0 * 1024.0) if sys.platform == 'darwin' else peak / 1024.0
+
+
+def stub_call(site_url, path, data=None):
+    with urllib.request.urlopen(urllib.request.Request(site_url + path, data=data)) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def run_child(scenario, site_url, options):
+    """Runs one scenario inside QGIS and returns its measurements."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    from qgis.core import QgsApplication, QgsProject
+    from qgis.PyQt.QtCore import QCoreApplication, QEventLoop, QSettings, QItemSelectionModel
+    from qgis.PyQt.QtWidgets import QMessageBox
+
+    app = QgsApplication([], True, tempfile.mkdtemp(prefix='scribblemaps_bench_'))
+    app.initQgis()
+    QCoreApplication.setOrganizationName('ScribbleMapsBenchmark')
+    QCoreApplication.setApplicationName('ScribbleMapsBenchmark')
+
+    settings = QSettings()
+    settings.setValue('scribblemaps/siteUrl', site_url)
+    settings.setValue('scribblemaps/authUrl', site_url + '/auth/')
+    settings.setValue('scribblemaps/serverSideConversion', scenario == 'publish server')
+    settings.setValue('scribblemaps/addLayersEarly', scenario == 'load early')
+
+    sys.path.insert(0, os.path.dirname(PLUGIN_DIR))
+    plugin = importlib.import_module(os.path.basename(PLUGIN_DIR) + '.scribblemaps_connector')
+    smjson = importlib.import_module(os.path.basename(PLUGIN_DIR) + '.scribblemaps_smjson')
+    layers = importlib.import_module(os.path.basename(PLUGIN_DIR) + '.scribblemaps_layers')
+    from qgis.testing.mocked import get_iface
+
+    # Message boxes would wait forever for a click; record them instead
+    messages = []
+
+    class RecordingMessageBox(QMessageBox):
+        @staticmethod
+        def information(parent, title, text, *args):
+            messages.append(title + ': ' + text)
+            return QMessageBox.Ok
+
+    plugin.QMessageBox = RecordingMessageBox
+
+    connector = plugin.ScribbleMapsConnector(get_iface())
+    connector.loadDlg.chbRequestThumbs.setChecked(options.thumbnails)
+
+    def idle():
+        return (not connector.tasks.tasks and connector.pendingAuthCallbacks is None and not connector.mapListRefreshing
+                and not connector.mapLoads)
+
+    def wait(condition, timeout=600):
+        deadline = time.time() + timeout
+        while not condition():
+            if time.time() > deadline:
+                raise RuntimeError('Timed out in scenario ' + scenario)
+            QCoreApplication.processEvents(QEventLoop.AllEvents, 50)
+            time.sleep(0.001)
+        # Let any follow-up work queued by the last callback run too
+        QCoreApplication.processEvents(QEventLoop.AllEvents, 50)
+
+    def list_maps():
+        connector.authAndRefreshMapList()
+        wait(lambda: idle() and connector.mapListModel.rowCount() > 0)
+
+    def select_maps(prefix):
+        table = connector.loadDlg.tblMaps
+        table.clearSelection()
+        rows = [row for row, entry in enumerate(connector.mapListModel.entries) if entry.mapCode.startswith(prefix)][:options.load_maps]
+        for row in rows:
+            table.selectionModel().select(connector.mapListModel.index(row, 0), QItemSelectionModel.Select | QItemSelectionModel.Rows)
+
+    def load_maps():
+        connector.authAndLoadSelectedMap()
+        wait(lambda: idle() and (QgsProject.instance().count() > 0 or messages))
+
+    def add_publish_layers():
+        document = stub_server.synthetic_smjson('publish', options.features)
+        fields = smjson.smjsonFields()
+        QgsProject.instance().addMapLayers(layers.createMemoryLayers('Benchmark', fields, smjson.smjsonToFeatures(document, fields)))
+        connector.checkAuth(lambda: None)
+        wait(idle)
+
+    def publish():
+        connector.showPublishDlg()
+        connector.publishDlg.txtMapTitle.setText('Benchmark')
+        connector.successDialog.hide()
+        connector.publishMap()
+        wait(lambda: idle() and (connector.successDialog.isVisible() or messages))
+
+    # Set-up, not measured:
+    if scenario.startswith('load'):
+        list_maps()
+        select_maps('k' if scenario == 'load kml' else 'm')
+        if scenario == 'load repeat':
+            load_maps()
+            QgsProject.instance().removeAllMapLayers()
+    elif scenario.startswith('publish') or scenario == 'republish':
+        add_publish_layers()
+        if scenario == 'republish':
+            publish()
+
+    del messages[:]
+    stub_call(site_url, '/_stats/reset', b'')
+    start = time.perf_counter()
+
+    if scenario == 'map list':
+        list_maps()
+    elif scenario.startswith('load'):
+        load_maps()
+    else:
+        publish()
+
+    elapsed = time.perf_counter() - start
+    stats = stub_call(site_url, '/_stats')
+    result = {
+        'scenario': scenario,
+        'wall': elapsed,
+        'requests': stats['requests'],
+        'bytesIn': stats['bytesIn'],
+        'bytesOut': stats['bytesOut'],
+        'peakRssMB': peak_rss_mb(),
+        'messages': messages
+    }
+
+    connector.unload()
+    app.exitQgis()
+    return result
+
+
+def run(options, scenarios):
+    server = stub_server.start(0, options.maps, options.features, options.latency, options.bandwidth)
+    site_url = 'http://%s:%d' % server.server_address[:2]
+
+    print('%d maps of %d features, %.0f ms latency, %s' % (options.maps, options.features, options.latency,
+          ('%.0f KB/s' % options.bandwidth) if options.bandwidth else 'unlimited bandwidth'))
+    print('%-16s %9s %9s %12s %12s %10s' % ('scenario', 'wall (s)', 'requests', 'sent (KB)', 'recv (KB)', 'peak MB'))
+
+    failed = False
+    for scenario in scenarios:
+        command = [sys.executable, os.path.abspath(__file__), '--child', scenario, '--site', site_url,
+                   '--features', str(options.features), '--load-maps', str(options.load_maps)]
+        if options.thumbnails:
+            command.append('--thumbnails')
+        child = subprocess.run(command, stdout=subprocess.PIPE, universal_newlines=True)
+        lines = [line for line in child.stdout.splitlines() if line.startswith('RESULT ')]
+        if child.returncode != 0 or not lines:
+            print('%-16s failed (exit code %d)' % (scenario, child.returncode))
+            failed = True
+            continue
+
+        result = json.loads(lines[-1][len('RESULT '):])
+        peak = '%10.1f' % result['peakRssMB'] if result['peakRssMB'] is not None else '%10s' % '-'
+        # bytesIn is what the server received, i.e. what the plugin sent
+        print('%-16s %9.3f %9d %12.1f %12.1f %s' % (scenario, result['wall'], result['requests'],
+              result['bytesIn'] / 1024.0, result['bytesOut'] / 1024.0, peak))
+        for message in result['messages']:
+            print('    ' + message)
+            failed = True
+
+    server.shutdown()
+    return not failed
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('-m', '--maps', dest='maps', type='int', default=100, help='Maps in the stub account')
+    parser.add_option('-n', '--features', dest='features', type='int', default=3000,
+                      help='Overlays per map, and in the project that gets published')
+    parser.add_option('-l', '--latency', dest='latency', type='float', default=0, help='Added latency per request, in ms')
+    parser.add_option('-b', '--bandwidth', dest='bandwidth', type='float', default=0, help='Response bandwidth in KB/s (0 for unlimited)')
+    parser.add_option('-k', '--load-maps', dest='load_maps', type='int', default=1, help='Maps selected in the load scenarios')
+    parser.add_option('-t', '--thumbnails', dest='thumbnails', action='store_true', default=False, help='Fetch thumbnails with the map list')
+    parser.add_option('-s', '--scenario', dest='scenarios', action='append', help='Scenario to run (repeatable): ' + ', '.join(SCENARIOS))
+    parser.add_option('--child', dest='child', help='Run one scenario in this process (used internally)')
+    parser.add_option('--site', dest='site', help='Stub server URL (used internally)')
+    (options, args) = parser.parse_args()
+
+    if options.child:
+        print('RESULT ' + json.dumps(run_child(options.child, options.site, options)))
+        sys.exit(0)
+
+    scenarios = options.scenarios or SCENARIOS
+    unknown = [scenario for scenario in scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error('Unknown scenario: ' + ', '.join(unknown))
+    sys.exit(0 if run(options, scenarios) else 1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Compares the ways loadSelectedMap can turn downloaded map data into layers.
+
+Run it with the Python that ships with QGIS, from the plugin directory:
+
+    python3 benchmark/bench_map_load.py --features 100000
+
+It builds a synthetic map with the requested number of points, lines and
+polygons, encodes it both as SMJSON and as KML, and times each path from
+the raw downloaded bytes through to filled memory layers.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from optparse import OptionParser
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qgis.core import QgsApplication, QgsVectorLayer, QgsWkbTypes
+
+from scribblemaps_smjson import smjsonFields, smjsonToFeatures
+from scribblemaps_layers import createMemoryLayers, partitionFeatures
+
+# The same synthetic maps the stub server serves, so both benchmarks measure the same data
+from stub_server import synthetic_smjson, smjson_to_kml
+
+
+def load_smjson(payload):
+    """The SMJSON path: parse, convert overlays straight to features, bulk insert."""
+    document = json.loads(payload)
+    fields = smjsonFields()
+    return createMemoryLayers('Benchmark', fields, smjsonToFeatures(document, fields))
+
+
+def load_kml_per_feature(payload):
+    """The original KML path: temp file, OGR, one addFeatures call per feature."""
+    with tempfile.NamedTemporaryFile(suffix='.kml', delete=False) as handle:
+        handle.write(payload)
+    try:
+        src = QgsVectorLayer(handle.name, 'data', 'ogr')
+        layers = {}
+        for geometry_type in ('Point', 'LineString', 'Polygon'):
+            layer = QgsVectorLayer(geometry_type + '?crs=epsg:4326', geometry_type, 'memory')
+            layer.dataProvider().addAttributes(src.dataProvider().fields().toList())
+            layer.updateFields()
+            layers[geometry_type] = layer
+
+        for feat in src.getFeatures():
+            if QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.Point:
+                layers['Point'].dataProvider().addFeatures([feat])
+            elif QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.LineString:
+                layers['LineString'].dataProvider().addFeatures([feat])
+            elif QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.Polygon:
+                layers['Polygon'].dataProvider().addFeatures([feat])
+        del src
+        return list(layers.values())
+    finally:
+        os.unlink(handle.name)
+
+
+def load_kml_partitioned(payload):
+    """The current KML path: temp file, OGR, one pass to partition, one addFeatures call per layer."""
+    with tempfile.NamedTemporaryFile(suffix='.kml', delete=False) as handle:
+        handle.write(payload)
+    try:
+        src = QgsVectorLayer(handle.name, 'data', 'ogr')
+        fields = src.fields()
+        (features, multi_families) = partitionFeatures(src.getFeatures())
+        del src
+        return createMemoryLayers('Benchmark', fields, features, multi_families)
+    finally:
+        os.unlink(handle.name)
+
+
+SCENARIOS = [
+    ('smjson', 'smjson', load_smjson),
+    ('kml (per feature)', 'kml', load_kml_per_feature),
+    ('kml (partitioned bulk)', 'kml', load_kml_partitioned),
+]
+
+
+def run(feature_count, repeats):
+    document = synthetic_smjson('Benchmark', feature_count)
+    payloads = {'smjson': json.dumps(document).encode('utf-8'), 'kml': smjson_to_kml(document)}
+    del document
+
+    print('%d features, smjson %.1f MB, kml %.1f MB' % (
+        feature_count, len(payloads['smjson']) / 1e6, len(payloads['kml']) / 1e6))
+    print('%-24s %10s %12s %12s' % ('path', 'best (s)', 'features', 'features/s'))
+
+    for name, payload_key, loader in SCENARIOS:
+        best = None
+        loaded = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            layers = loader(payloads[payload_key])
+            elapsed = time.perf_counter() - start
+            loaded = sum(layer.featureCount() for layer in layers)
+            best = elapsed if best is None else min(best, elapsed)
+            del layers
+        print('%-24s %10.3f %12d %12.0f' % (name, best, loaded, loaded / best if best else 0))
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('-n', '--features', dest='features', type='int', default=100000,
+                      help='Number of overlays in the synthetic map')
+    parser.add_option('-r', '--repeats', dest='repeats', type='int', default=3,
+                      help='Runs per path; the best time is reported')
+    (options, args) = parser.parse_args()
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        run(options.features, options.repeats)
+    finally:
+        app.exitQgis()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Times plugin startup: importing the package, classFactory() and initGui().
+
+Run it with the Python that ships with QGIS, from the plugin directory:
+
+    python3 benchmark/bench_startup.py --runs 15 --budget-ms 150 --compare-forms
+
+Each run is a fresh child process with an offscreen QGIS, a throwaway profile and a mocked iface, so
+nothing is already imported or cached. That is what QGIS does at startup for every session, whether or
+not the plugin is then used, so none of it should build dialogs, load .ui files or import QtWebKit, GDAL
+or the SMJSON conversion code. The benchmark exits non-zero if any of those modules gets imported, if the
+median startup exceeds --budget-ms, or if it is more than --tolerance slower than a baseline saved
+earlier with --save-baseline.
+
+After startup each run also opens the three dialogs once, timed separately (they are first built when
+the user opens them, not at startup). With --compare-forms the dialogs are timed a second time with the
+forms generated from the .ui files at runtime instead of the precompiled form modules, to show the saving.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import importlib
+import statistics
+import subprocess
+from optparse import OptionParser
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCHMARK_DIR)
+PACKAGE = os.path.basename(PLUGIN_DIR)
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, 'startup_baseline.json')
+
+# Modules that must not be imported until the plugin is actually used
+FORBIDDEN_MODULES = [
+    'PyQt5.QtWebKit',
+    'PyQt5.QtWebKitWidgets',
+    'osgeo',
+    PACKAGE + '.scribblemaps_connector_dialog',
+    PACKAGE + '.scribblemaps_publish_dialog',
+    PACKAGE + '.scribblemaps_shareview_dialog',
+    PACKAGE + '.scribblemaps_webview_dialog',
+    PACKAGE + '.scribblemaps_smjson',
+    PACKAGE + '.scribblemaps_layers',
+    # Icons are read from the plugin directory; the old compiled-in resources module must not come back
+    PACKAGE + '.resources',
+]
+
+
+DIALOGS = ['loadDlg', 'publishDlg', 'successDialog']
+
+
+def run_child(compiled_forms):
+    """Starts the plugin once and returns the timings of each step, the modules it imported, and how long
+    each dialog then takes to build."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    from qgis.core import QgsApplication
+    from qgis.testing.mocked import get_iface
+
+    app = QgsApplication([], True, tempfile.mkdtemp(prefix='scribblemaps_startup_'))
+    app.initQgis()
+    iface = get_iface()
+    sys.path.insert(0, os.path.dirname(PLUGIN_DIR))
+
+    before = set(sys.modules)
+    start = time.perf_counter()
+    package = importlib.import_module(PACKAGE)
+    imported = time.perf_counter()
+    connector = package.classFactory(iface)
+    constructed = time.perf_counter()
+    connector.initGui()
+    finished = time.perf_counter()
+    loaded = sorted(set(sys.modules) - before)
+
+    forms = importlib.import_module(PACKAGE + '.scribblemaps_forms')
+    forms.USE_COMPILED_FORMS = compiled_forms
+    dialogs = {}
+    for name in DIALOGS:
+        dialog_start = time.perf_counter()
+        getattr(connector, name)
+        dialogs[name] = (time.perf_counter() - dialog_start) * 1000
+
+    connector.unload()
+    app.exitQgis()
+    return {
+        'importMs': (imported - start) * 1000,
+        'classFactoryMs': (constructed - imported) * 1000,
+        'initGuiMs': (finished - constructed) * 1000,
+        'totalMs': (finished - start) * 1000,
+        'modules': loaded,
+        'dialogsMs': dialogs
+    }
+
+
+def forbidden(modules):
+    return [module for module in modules
+            if any(module == name or module.startswith(name + '.') for name in FORBIDDEN_MODULES)]
+
+
+def run_children(runs, forms):
+    results = []
+    for i in range(runs):
+        child = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', '--forms', forms],
+                               stdout=subprocess.PIPE, universal_newlines=True)
+        lines = [line for line in child.stdout.splitlines() if line.startswith('RESULT ')]
+        if child.returncode != 0 or not lines:
+            print('run %d failed (exit code %d)' % (i + 1, child.returncode))
+            return None
+        results.append(json.loads(lines[-1][len('RESULT '):]))
+    return results
+
+
+def print_timing(label, values):
+    print('  %-14s %8.1f ms (%.1f - %.1f)' % (label, statistics.median(values), min(values), max(values)))
+
+
+def print_dialogs(results, forms):
+    for name in DIALOGS:
+        print_timing(name, [result['dialogsMs'][name] for result in results])
+    total = statistics.median([sum(result['dialogsMs'].values()) for result in results])
+    print('  %-14s %8.1f ms (%s forms)' % ('all dialogs', total, forms))
+    return total
+
+
+def run(options):
+    results = run_children(options.runs, 'compiled')
+    if results is None:
+        return False
+
+    print('%d runs, median (min - max):' % options.runs)
+    for key, label in (('importMs', 'import'), ('classFactoryMs', 'classFactory'), ('initGuiMs', 'initGui'), ('totalMs', 'total')):
+        print_timing(label, [result[key] for result in results])
+    median = statistics.median([result['totalMs'] for result in results])
+    print('  %-14s %8d' % ('modules loaded', len(results[0]['modules'])))
+
+    print('first open of each dialog:')
+    compiled = print_dialogs(results, 'compiled')
+    if options.compare_forms:
+        uic_results = run_children(options.runs, 'uic')
+        if uic_results is None:
+            return False
+        runtime = print_dialogs(uic_results, 'runtime uic')
+        print('  %-14s %8.1f ms' % ('saving', runtime - compiled))
+
+    passed = True
+    loaded = forbidden(set(module for result in results for module in result['modules']))
+    if loaded:
+        print('FAIL: imported at startup: ' + ', '.join(sorted(loaded)))
+        passed = False
+
+    if options.budget_ms and median > options.budget_ms:
+        print('FAIL: median startup %.1f ms is over the %.1f ms budget' % (median, options.budget_ms))
+        passed = False
+
+    if options.save_baseline:
+        with open(options.baseline, 'w') as baseline_file:
+            json.dump({'totalMs': median, 'runs': options.runs}, baseline_file, indent=2)
+        print('saved baseline to ' + options.baseline)
+    elif os.path.exists(options.baseline):
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['totalMs']
+        limit = baseline * (1 + options.tolerance)
+        print('  %-14s %8.1f ms (limit %.1f ms)' % ('baseline', baseline, limit))
+        if median > limit:
+            print('FAIL: median startup %.1f ms regressed past the baseline' % median)
+            passed = False
+
+    return passed
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('-r', '--runs', dest='runs', type='int', default=11, help='Fresh processes to time')
+    parser.add_option('-b', '--budget-ms', dest='budget_ms', type='float', default=0,
+                      help='Fail if the median startup takes longer than this (0 for no budget)')
+    parser.add_option('--baseline', dest='baseline', default=BASELINE_FILE, help='Baseline file to compare against')
+    parser.add_option('--save-baseline', dest='save_baseline', action='store_true', default=False,
+                      help='Save this run as the baseline instead of comparing against it')
+    parser.add_option('--tolerance', dest='tolerance', type='float', default=0.25,
+                      help='Allowed slowdown against the baseline, as a fraction')
+    parser.add_option('--compare-forms', dest='compare_forms', action='store_true', default=False,
+                      help='Also time the dialogs with forms generated from the .ui files at runtime')
+    parser.add_option('--child', dest='child', action='store_true', default=False, help='Time one startup in this process (used internally)')
+    parser.add_option('--forms', dest='forms', default='compiled', help='compiled or uic (used internally)')
+    (options, args) = parser.parse_args()
+
+    if options.child:
+        print('RESULT ' + json.dumps(run_child(options.forms == 'compiled')))
+        sys.exit(0)
+    sys.exit(0 if run(options) else 1)
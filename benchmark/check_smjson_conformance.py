@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Checks the local layer-to-SMJSON converter against the server's KML import.
+
+Run it with the Python that ships with QGIS, from the plugin directory,
+passing any number of sample vector files:
+
+    python3 benchmark/check_smjson_conformance.py samples/points.gpkg samples/roads.shp
+
+Each layer is exported to KML and posted to /api/import/kml, exactly as
+publishing used to do, and also converted locally with layerToSmJson.
+Both documents are read back through smjsonToFeatures, so differences
+in overlay layout don't matter, and the script compares feature counts
+per geometry type, coordinates (to 1e-6 degrees) and titles. It exits
+non-zero if any layer differs.
+"""
+
+import os
+import sys
+import json
+import uuid
+import tempfile
+import urllib.request
+from optparse import OptionParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qgis.core import (QgsApplication, QgsVectorLayer, QgsVectorFileWriter,
+                       QgsCoordinateTransformContext)
+
+from scribblemaps_smjson import layerToSmJson, smjsonToFeatures
+
+IMPORT_URL = 'https://www.scribblemaps.com/api/import/kml'
+
+
+def server_import(kml_path, url):
+    """Posts the KML file the same way the plugin does and returns the parsed SMJSON."""
+    boundary = uuid.uuid4().hex
+    with open(kml_path, 'rb') as handle:
+        kml = handle.read()
+    body = (('--%s\r\nContent-Disposition: form-data; name="file"; filename="data.kml"\r\n'
+             'Content-Type: application/vnd.google-earth.kml+xml\r\n\r\n' % boundary).encode('utf-8')
+            + kml + ('\r\n--%s--\r\n' % boundary).encode('utf-8'))
+    request = urllib.request.Request(url, data=body, headers={
+        'Content-Type': 'multipart/form-data; boundary=%s' % boundary})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def summarise(document):
+    """Reduces an SMJSON document to comparable (geometry type, title, rounded WKT) tuples."""
+    summary = {}
+    for geometry_type, features in smjsonToFeatures(document).items():
+        rows = []
+        for feature in features:
+            geometry = feature.geometry()
+            rows.append(((feature['name'] or '').strip(), geometry.asWkt(6)))
+        summary[geometry_type] = sorted(rows)
+    return summary
+
+
+def compare(path, url):
+    layer = QgsVectorLayer(path, os.path.basename(path), 'ogr')
+    if not layer.isValid():
+        print('%s: could not open' % path)
+        return False
+
+    kml_path = os.path.join(tempfile.mkdtemp(), 'layer.kml')
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = 'KML'
+    error_code, error_message = QgsVectorFileWriter.writeAsVectorFormatV2(
+        layer, kml_path, QgsCoordinateTransformContext(), options)[:2]
+    if error_code != QgsVectorFileWriter.NoError:
+        print('%s: KML export failed: %s' % (path, error_message))
+        return False
+
+    try:
+        server = summarise(server_import(kml_path, url))
+    finally:
+        os.unlink(kml_path)
+    local = summarise({'overlays': [layerToSmJson(layer.name(), layer, layer.fields(),
+                                                  QgsCoordinateTransformContext())]})
+
+    matches = True
+    for geometry_type in ('Point', 'LineString', 'Polygon'):
+        server_rows = server.get(geometry_type, [])
+        local_rows = local.get(geometry_type, [])
+        if len(server_rows) != len(local_rows):
+            print('%s: %s count differs - server %d, local %d' % (
+                path, geometry_type, len(server_rows), len(local_rows)))
+            matches = False
+            continue
+        for server_row, local_row in zip(server_rows, local_rows):
+            if server_row != local_row:
+                print('%s: %s differs\n  server: %s\n  local:  %s' % (
+                    path, geometry_type, server_row, local_row))
+                matches = False
+                break
+
+    print('%s: %s' % (path, 'OK' if matches else 'MISMATCH'))
+    return matches
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage='%prog [options] layer [layer ...]')
+    parser.add_option('-u', '--url', dest='url', default=IMPORT_URL,
+                      help='KML import endpoint to compare against')
+    (options, args) = parser.parse_args()
+    if not args:
+        parser.print_help()
+        sys.exit(2)
+
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        results = [compare(path, options.url) for path in args]
+    finally:
+        app.exitQgis()
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""A local stand-in for the Scribble Maps endpoints the plugin uses.
+
+It needs nothing beyond the standard library, so it can be run on its own:
+
+    python3 benchmark/stub_server.py --port 8765 --maps 3000 --features 20000 --latency 50 --bandwidth 2000
+
+and the plugin pointed at it through QGIS settings:
+
+    scribblemaps/siteUrl = http://127.0.0.1:8765
+    scribblemaps/authUrl = http://127.0.0.1:8765/auth/
+
+Every map's data is generated from its map code, so it is the same on every request. Maps whose code starts
+with "k" only offer KML, which exercises the plugin's fallback path. The list, map data and thumbnails are
+served with ETags and answer conditional requests with 304. Latency (ms per request) and bandwidth
+(KB/s per response) are applied to every request.
+
+GET /_stats returns request and byte counts since the last POST /_stats/reset; bench_e2e.py reads them.
+"""
+
+import re
+import sys
+import json
+import gzip
+import time
+import uuid
+import zlib
+import random
+import struct
+import hashlib
+import threading
+from optparse import OptionParser
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+def synthetic_smjson(map_code, feature_count, vertices=20):
+    """Returns the SMJSON document for a map: a third each of markers, lines and polygons, seeded by the map code."""
+    rng = random.Random(map_code)
+    overlays = []
+    for i in range(feature_count):
+        lat = rng.uniform(-60, 60)
+        lng = rng.uniform(-170, 170)
+        kind = i % 3
+        if kind == 0:
+            overlays.append({'type': 'marker', 'coords': [lat, lng], 'title': 'Marker %d' % i, 'description': ''})
+        else:
+            ring = [[lat + rng.uniform(-0.1, 0.1), lng + rng.uniform(-0.1, 0.1)] for _ in range(vertices)]
+            if kind == 1:
+                overlays.append({'type': 'line', 'coords': ring, 'title': 'Line %d' % i, 'description': ''})
+            else:
+                overlays.append({'type': 'polygon', 'coords': ring + [ring[0]], 'title': 'Polygon %d' % i, 'description': ''})
+    return {'overlays': [{'type': 'layer', 'title': map_code, 'overlays': overlays}], 'view': {'zoom': 4, 'center': [0, 0]}}
+
+
+def smjson_to_kml(document):
+    """Encodes a synthetic SMJSON document as KML, the way the /kml endpoint would."""
+    def coords(points):
+        return ' '.join('%f,%f' % (lng, lat) for lat, lng in points)
+
+    placemarks = []
+    for overlay in document['overlays'][0]['overlays']:
+        if overlay['type'] == 'marker':
+            geometry = '<Point><coordinates>%s</coordinates></Point>' % coords([overlay['coords']])
+        elif overlay['type'] == 'line':
+            geometry = '<LineString><coordinates>%s</coordinates></LineString>' % coords(overlay['coords'])
+        else:
+            geometry = '<Polygon><outerBoundaryIs><LinearRing><coordinates>%s</coordinates></LinearRing></outerBoundaryIs></Polygon>' % coords(overlay['coords'])
+        placemarks.append('<Placemark><name>%s</name><description></description>%s</Placemark>' % (overlay['title'], geometry))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?><kml xmlns="http://www.opengis.net/kml/2.2"><Document>%s</Document></kml>'
+            % ''.join(placemarks)).encode('utf-8')
+
+
+PLACEMARK = re.compile(rb'<Placemark>.*?</Placemark>', re.S)
+NAME = re.compile(rb'<name>(.*?)</name>', re.S)
+GEOMETRY = re.compile(rb'<(Point|LineString|Polygon)>.*?<coordinates>(.*?)</coordinates>', re.S)
+
+
+def kml_to_smjson(kml):
+    """A rough /api/import/kml: one overlay per Placemark's first geometry, which is all the plugin's exports contain."""
+    overlays = []
+    for placemark in PLACEMARK.findall(kml):
+        geometry = GEOMETRY.search(placemark)
+        if not geometry:
+            continue
+        points = []
+        for coord in geometry.group(2).split():
+            parts = coord.split(b',')
+            points.append([float(parts[1]), float(parts[0])])
+        name = NAME.search(placemark)
+        title = name.group(1).decode('utf-8') if name else ''
+        kind = geometry.group(1)
+        if kind == b'Point':
+            overlays.append({'type': 'marker', 'coords': points[0], 'title': title, 'description': ''})
+        elif kind == b'LineString':
+            overlays.append({'type': 'line', 'coords': points, 'title': title, 'description': ''})
+        else:
+            overlays.append({'type': 'polygon', 'coords': points, 'title': title, 'description': ''})
+    return {'overlays': [{'type': 'layer', 'title': 'Imported', 'overlays': overlays}]}
+
+
+def thumbnail_png(map_code, size=160):
+    """A flat-coloured PNG, coloured by the map code."""
+    colour = hashlib.sha1(map_code.encode('utf-8')).digest()[:3]
+    raw = b''.join(b'\x00' + colour * size for _ in range(size))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b''))
+
+
+class StubState:
+    def __init__(self, maps, features, latency, bandwidth):
+        self.map_count = maps
+        self.features = features
+        self.latency = latency / 1000.0
+        self.bandwidth = bandwidth * 1024
+        self.lock = threading.Lock()
+        self.payloads = {}
+        self.next_code = 0
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.by_endpoint = {}
+
+    def count(self, endpoint, bytes_in, bytes_out):
+        with self.lock:
+            self.requests += 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            return {'requests': self.requests, 'bytesIn': self.bytes_in, 'bytesOut': self.bytes_out, 'byEndpoint': dict(self.by_endpoint)}
+
+    def map_codes(self):
+        return [('k' if i % 10 == 9 else 'm') + '%05d' % i for i in range(self.map_count)]
+
+    def payload(self, map_code, format):
+        # Generated once per map and format, then served from memory
+        key = (map_code, format)
+        with self.lock:
+            if key in self.payloads:
+                return self.payloads[key]
+        document = synthetic_smjson(map_code, self.features)
+        data = json.dumps(document).encode('utf-8') if format == 'smjson' else smjson_to_kml(document)
+        with self.lock:
+            self.payloads[key] = data
+        return data
+
+    def new_code(self):
+        with self.lock:
+            self.next_code += 1
+            return 'p%05d' % self.next_code
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if self.headers.get('Content-Encoding') == 'gzip':
+            return (len(body), gzip.decompress(body))
+        return (len(body), body)
+
+    def send(self, endpoint, status, body=b'', content_type='application/json', etag=None, bytes_in=0):
+        if etag and self.headers.get('If-None-Match') == etag:
+            status, body = 304, b''
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.write_throttled(body)
+        self.state.count(endpoint, bytes_in, len(body))
+
+    def send_json(self, endpoint, value, status=200, etag=False, bytes_in=0):
+        body = json.dumps(value).encode('utf-8')
+        self.send(endpoint, status, body, etag='"%s"' % hashlib.sha1(body).hexdigest() if etag else None, bytes_in=bytes_in)
+
+    def write_throttled(self, body):
+        if not self.state.bandwidth:
+            self.wfile.write(body)
+            return
+        # Ten slices a second, each a tenth of the bandwidth
+        slice_size = max(int(self.state.bandwidth / 10), 1)
+        for offset in range(0, len(body), slice_size):
+            self.wfile.write(body[offset:offset + slice_size])
+            time.sleep(0.1)
+
+    def do_GET(self):
+        time.sleep(self.state.latency)
+        url = urlparse(self.path)
+        path = url.path
+        host = 'http://%s:%d' % self.server.server_address[:2]
+
+        if path == '/_stats':
+            return self.send_json('stats', self.state.stats())
+        if path.startswith('/auth/'):
+            return self.send_json('auth', {'validToken': True, 'token': 'stub-token-' + path[len('/auth/'):], 'expiresIn': 3600})
+        if path == '/api/user/maps/':
+            if not self.authorised():
+                return self.send_json('maps', {'error': 'unauthorised'}, status=401)
+            mapList = [{
+                'mapCode': code,
+                'title': 'Stub map ' + code,
+                'description': 'Generated by the stub server',
+                'created': '2020-01-01T00:00:00Z',
+                'thumbUrl': host + '/thumbs/' + code + '.png',
+                'shareUrl': host + '/maps/view/' + code
+            } for code in self.state.map_codes()]
+            return self.send_json('maps', {'mapList': mapList}, etag=True)
+        if path.startswith('/thumbs/'):
+            code = path[len('/thumbs/'):-len('.png')]
+            return self.send('thumbnail', 200, thumbnail_png(code), 'image/png', etag='"thumb-%s"' % code)
+        if path == '/api/maps/newCode':
+            return self.send_json('newCode', self.state.new_code())
+
+        match = re.match(r'^/api/maps/([^/]+)/(smjson|kml)$', path)
+        if match:
+            (code, format) = match.groups()
+            if not self.authorised():
+                return self.send_json(format, {'error': 'unauthorised'}, status=401)
+            if format == 'smjson' and code.startswith('k'):
+                return self.send_json(format, {'error': 'not available'}, status=404)
+            data = self.state.payload(code, format)
+            etag = '"%s-%s"' % (code, format)
+            return self.send(format, 200, data, 'application/json' if format == 'smjson' else 'application/vnd.google-earth.kml+xml', etag=etag)
+
+        self.send_json('unknown', {'error': 'not found'}, status=404)
+
+    def do_POST(self):
+        time.sleep(self.state.latency)
+        url = urlparse(self.path)
+        path = url.path
+        (bytes_in, body) = self.read_body()
+
+        if path == '/_stats/reset':
+            self.state.reset()
+            return self.send_json('stats', {})
+        if path == '/api/import/kml':
+            return self.send_json('import', kml_to_smjson(body), bytes_in=bytes_in)
+
+        match = re.match(r'^/api/maps/([^/]+)/stream(/new)?$', path)
+        if match:
+            if not self.authorised():
+                return self.send_json('stream', {'error': 'unauthorised'}, status=401, bytes_in=bytes_in)
+            if match.group(2):
+                return self.send_json('stream/new', {'streamCode': str(uuid.uuid4())}, bytes_in=bytes_in)
+
+            # Any of the plugin's upload formats: raw or gzipped JSON with the stream code in the query string, or
+            # the original form-encoded fields
+            if self.headers.get('Content-Type', '').startswith('application/x-www-form-urlencoded'):
+                fields = parse_qs(body.decode('ascii'))
+                data = fields.get('data', [''])[0]
+            else:
+                data = body.decode('utf-8')
+            try:
+                json.loads(data)
+            except ValueError:
+                return self.send_json('stream', {'error': 'invalid SMJSON'}, status=400, bytes_in=bytes_in)
+            return self.send_json('stream', True, bytes_in=bytes_in)
+
+        self.send_json('unknown', {'error': 'not found'}, status=404, bytes_in=bytes_in)
+
+    def authorised(self):
+        return self.headers.get('Authorization', '').startswith('Bearer stub-token-')
+
+
+def start(port=0, maps=100, features=3000, latency=0, bandwidth=0):
+    """Starts the server on a background thread and returns it; server.server_address has the port it got."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(maps, features, latency, bandwidth)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage='%prog [options]')
+    parser.add_option('-p', '--port', dest='port', type='int', default=8765, help='Port to listen on')
+    parser.add_option('-m', '--maps', dest='maps', type='int', default=100, help='Maps in the account')
+    parser.add_option('-n', '--features', dest='features', type='int', default=3000, help='Overlays per map')
+    parser.add_option('-l', '--latency', dest='latency', type='float', default=0, help='Added latency per request, in ms')
+    parser.add_option('-b', '--bandwidth', dest='bandwidth', type='float', default=0, help='Response bandwidth in KB/s (0 for unlimited)')
+    (options, args) = parser.parse_args()
+
+    server = start(options.port, options.maps, options.features, options.latency, options.bandwidth)
+    print('Stub Scribble Maps API on http://%s:%d' % server.server_address[:2])
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        sys.exit(0)
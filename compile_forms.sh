@@ -0,0 +1,4 @@
+# Regenerates the form modules the dialogs import (see scribblemaps_forms.py) - run after editing any .ui file
+for ui in scribblemaps_*_dialog_base.ui; do
+    pyuic5 -o "${ui%.ui}.py" "$ui"
+done
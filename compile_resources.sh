@@ -1 +0,0 @@
-pyrcc5 -o resources.py resources.qrc
@@ -1,773 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.14.1)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02\xea\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x8c\x49\x44\x41\x54\x78\xda\xdc\
-\x55\x4d\x68\x13\x41\x14\xfe\x92\xa6\x49\xd3\xf4\x67\x6d\x35\x60\
-\xb4\x9a\x55\x2b\x28\x39\x54\x41\x3c\x88\xc4\x86\x8a\xe0\xa9\x07\
-\x2f\xbd\x08\x3d\xaa\x97\x9e\xbc\x36\xc5\x5b\xef\xea\xb1\xe2\xc5\
-\x8b\x87\x9c\x04\x41\x1a\x03\x7a\x10\xb1\xe6\x10\x02\xd2\x96\x0d\
-\xa6\x6a\x49\x4c\xba\xb5\x69\x37\x26\xdd\xc4\x79\x93\xdd\xb0\xd9\
-\xec\xa6\xb1\x37\x7d\x30\xcc\xee\x9b\xc7\xf7\x66\xbe\xf9\xde\x1b\
-\xe0\x5f\x37\xc7\x41\x01\x6f\xd2\x0f\xa7\xd9\x14\x66\x63\xc2\xb4\
-\x94\x64\x23\x31\x75\x71\x31\x76\xa8\x04\x0c\xf8\x06\x9b\x96\xd8\
-\x08\xea\x3e\x77\xcf\x30\x82\xc3\xb7\x91\xd9\x7e\x85\x8a\xba\xcd\
-\x7d\x65\xa5\x9a\xc9\x4a\x85\xd9\x7b\x77\x9e\xbf\xb5\xc2\x71\xda\
-\x80\x47\xd9\x14\x37\x82\x93\x79\x58\x82\x41\xf7\x18\xc6\x86\x22\
-\x4d\xdf\xe6\x86\x4c\x31\xf1\xa7\x2f\xef\x46\xbb\x4a\xa0\x81\xcf\
-\x5b\x05\xef\x54\xbe\xb2\x91\x85\xe0\x19\x67\x89\x4e\x41\x2e\xee\
-\xa1\x5a\x55\xf5\xe5\x79\xab\x24\x0e\x0b\x5a\xe2\x46\x1f\xd1\x12\
-\x18\xb8\x06\xa1\x6f\x1c\x3d\x0e\x4f\xd3\x4f\x14\xc5\xde\x3d\x42\
-\x4d\xad\x99\x31\x27\x8d\x74\xb9\x4c\x8b\x4b\xc6\x9f\xfe\x5e\x3f\
-\xce\x8f\xcc\xb4\x00\xeb\x26\xef\xfc\xb4\x02\xd7\x31\xc4\x36\x8a\
-\x34\xb5\xb4\x5c\xa8\x0e\x4e\xbb\xa5\x8b\xfd\xb4\xb9\x88\xbd\xfd\
-\x1c\x5f\x4f\x49\xaf\xed\xf4\x11\x64\x54\x4d\x5b\xdd\x41\xd8\x18\
-\x45\xb4\xe8\xe0\xe9\xc2\x33\x14\x94\x14\x46\xbd\x21\xf4\xbb\xfc\
-\x90\x7e\x7c\x44\x6e\x6b\x0d\x47\x06\x4e\x20\x72\xf9\x01\xae\x5e\
-\x98\x31\x27\x09\x5b\x25\x68\xd1\x39\x71\x4e\xf6\xbd\xf4\x1e\x6a\
-\xed\xb7\x76\xc9\x59\xac\xe7\xe2\xf8\xbc\xda\x90\xbe\x30\x18\x80\
-\x5f\x38\x8b\x93\xc7\x42\xe6\x04\x13\x1d\x65\x4a\xa6\xf3\x4e\x3b\
-\x37\x5e\x6c\xf2\x0b\xab\x81\x7d\x85\xff\xd3\x49\xc8\x7a\x5d\x5e\
-\xdb\x42\x73\xfe\x4d\xd9\x17\xf3\x25\xa3\x2c\xbb\x32\xdb\x04\x6a\
-\xbd\x41\x0b\xf1\xce\xf5\x5c\x77\x43\x1c\xbd\x09\x5f\xdf\x48\x33\
-\x46\x3c\x7e\x85\xcf\x55\xed\x44\x07\x25\x48\xb6\xc8\xb0\xbc\xca\
-\x39\x57\x34\xd5\x9c\x16\xa6\x70\x2e\x70\x1d\x3e\x6f\x23\x81\x9b\
-\xd1\x12\x12\x6f\xf1\xef\x8d\x7c\x0a\x16\x7d\xaa\xad\x0e\x12\x6c\
-\xcc\xe9\x3f\x24\x4b\xdd\xa8\x6a\xe9\x24\x39\x79\x9d\xab\x87\x76\
-\x4e\xe0\x74\x1a\xda\xbd\x85\x64\x13\x76\x95\x2c\x99\xfb\x0f\x19\
-\xd5\x03\xf5\x20\xb3\x11\xf8\xf2\xca\x13\x6c\x95\xbe\x19\xdd\x19\
-\x56\xc9\xa2\x5d\x25\xcf\x9a\x5b\xc5\x2f\x59\x81\x53\xf0\xb5\x01\
-\x13\x2d\xb4\xf3\xdd\x72\x11\x16\x18\xf6\xed\xda\xd8\xec\x6a\x6a\
-\x1d\xd2\x5a\x1e\x47\x87\xce\x20\x72\xe9\x3e\xa7\x68\x79\xe5\x71\
-\x27\xd1\x2c\xb0\xdd\x47\x3b\xaa\x88\x3d\x20\x14\xb0\xc0\x2f\xba\
-\xb8\xcb\xfb\x0d\xf1\x4e\xe0\x54\x54\x54\xbd\xdd\x82\xdb\xca\x54\
-\x4b\x32\x59\xc8\x97\x32\xba\xef\x43\xfa\x05\x4f\x52\x69\x97\x64\
-\x46\xeb\xa0\xd1\x43\x3d\x99\x5a\xe3\xb2\x7d\x32\x19\x70\x0c\xff\
-\xb5\xfd\x11\x60\x00\x49\xd0\x0a\x68\x53\x36\x8a\x19\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0a\x9f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x78\
-\x65\x58\x49\x66\x4d\x4d\x00\x2a\x00\x00\x00\x08\x00\x05\x01\x12\
-\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
-\x00\x01\x00\x00\x00\x4a\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
-\x00\x52\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\x69\
-\x00\x04\x00\x00\x00\x01\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x00\
-\x00\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\x00\x02\
-\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00\x18\xa0\x03\x00\x04\
-\x00\x00\x00\x01\x00\x00\x00\x18\x00\x00\x00\x00\x5e\xc7\x90\x1c\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x02\x38\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\
-\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\
-\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x34\x2e\x30\x22\x3e\
-\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\
-\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\
-\x6e\x73\x23\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\x66\x66\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\x2f\x22\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x65\x78\x69\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
-\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x65\x78\x69\
-\x66\x2f\x31\x2e\x30\x2f\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\
-\x69\x6f\x6e\x3e\x31\x3c\x2f\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\
-\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x74\x69\x66\x66\x3a\x52\x65\x73\x6f\x6c\x75\x74\x69\
-\x6f\x6e\x55\x6e\x69\x74\x3e\x32\x3c\x2f\x74\x69\x66\x66\x3a\x52\
-\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x55\x6e\x69\x74\x3e\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x65\x78\x69\x66\x3a\x50\x69\
-\x78\x65\x6c\x58\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\x32\x34\
-\x3c\x2f\x65\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x58\x44\x69\x6d\
-\x65\x6e\x73\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x65\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\
-\x65\x6e\x73\x69\x6f\x6e\x3e\x32\x34\x3c\x2f\x65\x78\x69\x66\x3a\
-\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\
-\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x3c\x2f\x72\
-\x64\x66\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x3e\x0a\xf2\x97\x05\x8b\x00\x00\x07\x4d\x49\x44\x41\
-\x54\x48\x0d\x6d\x55\x0b\x50\x94\xd7\x15\x3e\xf7\x7f\xee\x2e\xbb\
-\x0b\xcb\x1b\x76\x79\x8a\x5b\x0a\x62\xb0\xe8\xa8\x68\x86\xa5\x36\
-\x11\xac\xa9\xd8\x06\x9b\xd8\x68\x33\x75\xc4\x99\x58\xa6\xa9\x9d\
-\x36\xda\x24\xcd\x36\x29\x1d\x93\x69\xe2\xb4\xda\x14\xe9\x44\x9c\
-\x5a\x93\x0c\xd6\x60\x22\xa9\x32\x13\xc3\x9a\x20\x0d\x0c\xe0\x03\
-\x57\x42\x90\x87\x0a\x2e\x66\x61\xd9\xf7\xeb\x7f\xf5\xde\x7f\x9b\
-\x0c\x99\xe9\x9d\xb9\xff\x3d\xff\xb9\xf7\x7c\xe7\x9e\xd7\x3d\x08\
-\x96\x0e\xbb\x9d\x02\xbb\x5d\x26\xac\x4d\xfb\x47\xad\x2e\xb7\xef\
-\x55\xc4\xc8\x59\x1b\x6a\xd6\xd7\xb4\xed\x03\xb1\xa4\xfe\x36\xc7\
-\xeb\xaf\x2a\x64\x3f\xc3\x9d\x21\x3b\x1c\xb5\x12\x26\xd5\x7f\xc2\
-\xfb\x7f\x03\x7d\xcd\xb4\x2b\x18\x1c\xc9\xc5\x8d\x83\xc9\x3a\x26\
-\xfa\x6a\x54\xa0\xf7\x25\xe9\x32\x40\x51\x34\x40\xcb\x33\x87\xae\
-\x9e\x5e\x77\xf8\xeb\xb3\x4b\x08\x9b\xad\x87\x71\xd8\x2e\xcb\x5f\
-\x5d\x6c\xc9\x96\x4a\x7e\xa5\x00\x41\x23\x56\x70\x06\x49\xa5\xdb\
-\xbb\x4f\x42\x8a\xf5\xa7\x7a\xda\x23\x5b\xad\x16\xc1\xe7\x8e\xf0\
-\xa3\xe3\x73\xf3\xbc\x4e\x6a\xf5\xfa\xc3\xf9\x1c\x20\x51\x91\x03\
-\x77\xa9\x58\xb0\x7f\xfa\xd2\x2e\x07\x46\x89\x12\xa4\xf2\xc6\x0e\
-\xce\x79\x66\x47\x9c\xd0\x4b\x07\xa5\xfe\xd8\xed\x88\x80\xaf\xb7\
-\x80\x56\x94\xe8\x5a\x5e\xf6\x42\x46\xba\x4e\x10\x63\x31\xde\x94\
-\xae\x97\xd2\x33\x92\xd3\xe3\x31\xe5\x20\x87\xc0\x28\x23\x94\x4a\
-\xd3\xc9\xb5\x28\x29\xe7\x6f\x96\x86\xf3\xe3\x05\xf5\xef\x1c\x2d\
-\x06\x48\x26\xe0\x55\x4d\x83\xec\x52\x70\x42\x33\x2a\xc3\x59\xa6\
-\x5a\xe2\xaf\x3c\x6c\xa5\x28\x4d\x1e\xcf\x20\x10\x22\x11\x36\x10\
-\x97\xc0\x98\xc2\x42\x76\xa6\x01\xbc\xa1\x05\x5f\xcd\x96\xbc\xdd\
-\x27\xf6\x94\x06\x54\x19\x45\x41\x39\x4f\x5e\xde\xc8\x80\xe1\x00\
-\xf5\xd8\x87\x63\xc5\xc1\xc9\xfd\x43\x6d\xab\xcf\xaa\x2e\x73\xd4\
-\x8a\xea\x19\xfc\x51\x2d\xa8\x9a\x5c\x54\x57\x91\xca\xa9\xa0\x74\
-\x26\xc4\x6b\x39\x41\x56\x10\x25\x08\x22\x84\x82\x3e\x5a\xab\xa1\
-\xe2\x66\x73\x71\xda\xc0\x25\x7f\x1b\x11\x2c\x7c\xba\x47\x03\x08\
-\x29\xae\x77\x6d\x9f\x4e\x9f\xb3\x6d\x97\x78\x4b\xa3\x6c\x28\x39\
-\x96\xf3\xc8\x9f\x0f\xe0\xc0\x8b\x4b\x2d\x49\xc4\xe0\x7f\x01\xb6\
-\x6e\xe9\xe8\x64\x33\x1f\x6a\xa0\x21\x20\xc4\x62\x02\xcb\xe2\x5d\
-\xbd\x86\x85\x24\xa3\x01\x44\x85\x51\xe6\x17\x43\x28\x49\x1b\x59\
-\x33\x70\x7c\xed\x60\x79\xa3\x93\x73\x9a\x22\x4a\xf9\xe2\x24\x52\
-\x7d\xff\x8c\xa2\x2f\x98\xb9\x70\x0d\x16\xc6\x5e\xba\x73\xe5\x97\
-\xa7\xab\xaa\x8e\xb3\x43\x43\xfb\x04\x86\x68\x1b\xb2\x23\x21\xef\
-\xf1\x9b\x4f\xa0\xb8\xab\x81\xf1\x4f\x48\x41\x94\xc5\xc6\xa4\x18\
-\x60\x23\xc0\x13\x16\x80\xf6\x08\x90\xa4\xe5\x25\x4d\x72\x1a\x13\
-\x0d\xcb\x7f\xc0\x46\xd4\x39\xcb\xcb\x44\x9c\x75\x8a\x13\xa7\xa9\
-\xa5\xb1\x4f\x3b\xf3\x26\x0a\xf2\xbb\xe7\x6b\x44\x49\xe8\xd1\x5a\
-\xc0\x81\xc1\x67\x01\xec\x14\x85\xfd\x26\x10\xb3\x41\xf1\x1c\x0b\
-\xc4\xee\x9c\x60\x83\x63\x87\xb5\x46\x13\x20\x96\x11\x88\x05\x1c\
-\x8d\xfd\x48\x4b\x10\x13\x62\x74\x34\xe2\x95\x29\xce\xb8\xb9\x66\
-\xaf\xb3\x9e\xa4\x74\x55\x93\xa2\xc6\x70\xe6\x4c\x75\x84\xb8\xed\
-\x8b\x7f\xa4\xcf\xca\x1a\xfd\x91\x8c\xb2\xf6\x16\x02\x59\xd5\xb4\
-\x95\x56\x5d\x64\x79\x62\x68\x3b\x13\x9f\x7b\x6f\xfa\xbd\xef\x67\
-\x62\x7e\x68\xc5\xe3\x5d\x0f\x22\x4c\xb6\x5e\x10\xc2\x32\x45\xb3\
-\x48\x96\x24\x05\x01\xa2\xf4\x2c\x25\xb0\xba\x74\x56\x11\x82\xfd\
-\xd7\x4f\xad\x5a\x47\x40\xf0\xcd\x30\x06\xfa\x46\xb1\x15\xd5\x9d\
-\xbd\xe0\x99\x3a\xf7\x8c\x6f\xec\xd4\x94\x1a\x5c\x56\x08\x3f\xc9\
-\x06\xbc\x9f\xe0\xd3\x6e\x3c\xc3\x7c\x70\xaa\x45\xab\xd5\x03\x62\
-\xf8\xb8\x8e\xa1\x11\xc7\xea\xa8\xa8\x2c\xca\xce\x79\x81\x1d\x75\
-\xbb\x44\xa3\x5e\xb7\xb6\x72\xcf\xc4\x4e\x02\x5f\xd5\x34\x94\xc8\
-\x44\xf2\x83\x8b\x8e\x2c\x0a\xc5\x5d\xd6\xe7\xac\xdf\x4c\x68\x55\
-\x01\xbe\xf4\x43\x82\xec\xbb\x48\x18\x80\x03\x3e\x74\xb1\xf9\x0d\
-\x08\x3a\x6f\xeb\x8d\x85\x1a\x26\x12\xec\x4d\x8a\xfa\xee\x25\xeb\
-\x53\xa8\xbd\xab\x28\xb9\x65\xeb\x22\x7a\xf4\x5b\x83\xa0\x45\xfe\
-\xdf\xe3\xb3\x4c\xc2\xc5\xc4\x0a\x3c\x32\xdc\xaa\x25\x3c\x4d\x0f\
-\xf0\x40\x15\x12\x16\x55\xd2\xac\xf0\x38\x45\x8c\x52\xfc\xcb\x51\
-\xc2\x28\x74\x9c\xe4\xf0\x12\xa7\xdc\xe3\x2f\xea\x44\x2f\xa4\x64\
-\x65\x9c\xbb\x7e\xee\x67\xfb\x6b\x2b\xf4\xf0\xec\xde\x22\xf9\x3b\
-\x56\x8e\xce\x35\x79\x84\xd5\x79\x9e\x92\x65\xe3\x9f\xff\x82\xc8\
-\x94\x37\xde\x4a\x14\x58\xf9\x2d\x55\x01\x62\xb8\x19\x9c\x20\x2a\
-\x8f\xd2\x79\x81\xc1\x2f\x96\x24\x28\xb4\x97\x1c\x9e\x86\x3b\x6a\
-\x91\xdc\x70\x1c\xfc\x57\xf4\xde\xeb\x2b\x3f\x69\xad\x78\x1d\x60\
-\xea\xfc\xf1\x77\xfb\x2f\xce\x47\xf5\x4c\xae\x25\x3f\x9e\x92\x62\
-\xa6\xbf\x9d\x3b\x05\xcb\xd3\x3d\x07\x61\x93\x92\xe6\x3c\x53\x1e\
-\x57\xdd\x63\x27\x08\xf8\x76\x8c\x12\x95\x90\xa8\x26\x0f\x73\xe3\
-\x14\x0a\x15\x34\x7c\x18\x2c\xad\x58\x28\xf9\xf9\xf3\x3f\xdc\x28\
-\x4a\xd7\x2a\xd0\xaf\xb7\x29\x34\x45\xdf\x54\x28\xd7\xe9\x91\x8f\
-\x88\x5f\x71\x65\x0e\xef\x7c\xf6\x9d\xce\xde\x9b\xcf\x37\xad\xe4\
-\xf2\x73\xa3\x32\x05\xf1\xb8\x6d\x79\x38\x7d\xca\x77\xed\xb9\x31\
-\x80\xdf\x34\x59\x0d\xa8\xcd\x86\xd1\xed\x38\xe4\x31\x89\x03\x85\
-\xf3\xe1\xbf\x44\x0c\x8a\x96\x4f\x47\x36\x3e\x72\xef\x4f\xb1\xa8\
-\xf0\x4a\xd8\x1b\xdd\x11\x5a\x8c\xfd\x98\xd0\x52\x9c\xea\x7d\xe1\
-\xfd\x23\xdf\x03\xe8\x20\x6e\x1b\x6b\x7d\xe9\x4a\xcb\x84\x0b\xc1\
-\xb2\xc2\x7c\xc9\x64\xc8\x63\x0a\x33\x3d\x60\x33\x7b\x9a\xa1\x72\
-\xb1\xb0\x0d\xa7\x7b\xd5\xfd\xad\x38\xa9\xb1\x82\x70\x28\x1d\xc5\
-\x03\x24\x61\x80\xb2\x77\xfd\xa8\x78\x43\xb5\x63\x59\x2c\x14\x4c\
-\x76\x4d\x2d\x82\xe7\x41\x40\x9d\x73\x53\x5e\x08\x79\x63\xb9\x38\
-\x89\xde\x7a\xa1\xf3\xed\x3c\x72\x18\xe0\xb9\x97\xff\xde\xf1\xd9\
-\x18\xf0\xa9\xac\x25\xdf\xac\xa4\xa5\xa5\x09\xd5\x65\x92\x66\xd3\
-\xc3\xa3\x2f\x92\xdd\x6a\xbe\x2f\xf1\xe4\x70\xee\xa2\x08\xe5\x51\
-\x63\x4a\x7f\x77\xa7\xb5\x59\x92\x22\x9b\x0b\xf9\xb5\xb0\xae\xa4\
-\x1e\x16\x42\x73\x60\xd0\x99\x60\x6b\xe5\x1e\x80\x18\x0b\x1e\xe9\
-\xae\x81\xe7\xe8\x05\xbf\xfe\x40\x9f\x6b\xa8\x4b\x1a\xe9\xfd\xcf\
-\x78\x6d\xdd\x0f\x9e\x5a\x51\x9a\x05\x42\x54\xa4\x65\xd1\x8d\x68\
-\x45\x5a\xe5\x36\xdb\x3f\xea\x6a\xad\x9f\xc2\xc5\xc7\x46\x67\xaf\
-\x3c\x3c\xfb\xe9\x6f\x3f\xc0\x3a\x65\x0a\x3f\x6a\x2b\x22\x21\x01\
-\x82\x51\x2f\x54\xe4\x55\xc3\xee\x8d\x87\x60\xd7\x86\x83\xb0\x3c\
-\xbb\x12\x66\xef\xcf\x42\x70\x31\x8a\x4b\x09\x95\x0d\xb5\xed\x13\
-\x7a\x7a\x48\xe5\xde\xee\x7e\xed\x64\xdf\xdb\x51\x5a\x4b\x99\xf3\
-\xb2\x62\xa9\x19\x39\x62\x79\x81\x06\x72\x38\xdf\x1a\x62\x85\x34\
-\xf1\x57\x1b\xf2\xbb\xaf\x61\x52\xb0\xd9\xec\x0c\x85\x40\x91\x69\
-\xc4\xc0\x98\x6b\x18\x46\x66\xfa\x20\x89\x4f\x56\xe7\xc0\xe7\x1f\
-\xc3\xf5\xdb\xfd\x20\xaa\xed\x84\x88\xe2\x50\xd7\xd6\xaa\xeb\xc7\
-\xed\x4f\xfd\xea\x83\x8b\xc3\x11\x93\x29\x4d\x63\xc9\xca\x12\xb2\
-\x33\x4d\xb0\x32\x57\xd0\xe2\x4d\x04\x71\x97\x6e\xf2\x7a\x4b\x2f\
-\x39\xe8\x70\xd8\x45\x0a\x21\xb8\xa5\xd5\xb3\xb8\x35\xca\xd0\xf7\
-\x45\x17\x44\xc5\x30\x04\x22\x5e\xb8\x34\xdc\xa9\x82\x19\x52\x35\
-\x78\xa5\x54\x7f\x62\x11\xd1\x66\x57\xab\x75\xee\xe9\x6d\xed\xbb\
-\xde\xef\x1e\x5c\x48\xcb\x36\x6b\xf3\x8b\xd2\xa0\xbc\x94\xdf\x06\
-\x50\x50\xf8\xc7\x43\xfe\x44\xc1\x12\x65\x44\x52\x06\xe6\x9f\x14\
-\x43\xdd\x4f\xc9\xd4\xc3\x9c\xef\x0e\x38\x9c\x9d\xd0\xfd\x59\x07\
-\xb8\xe6\xef\x42\x6e\xb1\x09\xb4\x06\xee\x3e\xee\x2d\xa7\x48\x85\
-\xab\xcd\xc4\xee\x56\x9a\xff\xf2\x6f\x1e\xe0\xd8\xd9\x86\xba\x35\
-\xab\xfb\x6f\x8c\xb8\xcc\xd9\xb9\xa0\x61\x32\xb3\x01\xda\xbe\xdc\
-\xb2\xe5\x68\x0c\x40\xbd\x44\xa2\xe8\x88\x96\xdf\x75\x6d\xdb\x8c\
-\x9f\xbd\xb7\xa4\xb8\x6c\x0e\xfa\xa3\x10\x09\xc4\xc1\x98\xaa\x03\
-\x46\xa3\x0f\x4e\x8e\xe7\xbe\x3c\x7c\x82\x6f\x1d\x1b\x7b\x2d\xd1\
-\xc9\x88\x00\x1e\x4d\xf6\xf3\x3a\x61\x21\x92\xd4\x7e\x74\x47\x72\
-\x6b\xfb\x85\x37\xfa\x27\x72\xd6\xb6\x8f\x42\x1d\x9c\xad\xbc\x0a\
-\xc4\x4a\x7b\xa2\xab\x25\xde\x10\x2c\xf0\x4a\xf7\x63\x45\x48\x66\
-\x7f\x22\x4a\xf2\x4a\xdc\xac\x64\x96\xa1\x6f\x0e\x0c\xaf\x1b\x18\
-\xb9\x6c\x2d\x02\x25\xa8\x97\x14\x4d\x58\x52\x62\x11\x24\x05\x43\
-\xf8\x75\x0d\x06\x05\x7f\xc8\x88\x1e\x2c\xdc\xbd\x72\x04\xb7\x04\
-\xb5\x9e\xb0\x55\x10\xc1\xf3\x1b\xe3\xbf\x23\x52\x3d\x29\xe9\xf4\
-\xb0\x9b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0a\x62\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x78\
-\x65\x58\x49\x66\x4d\x4d\x00\x2a\x00\x00\x00\x08\x00\x05\x01\x12\
-\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
-\x00\x01\x00\x00\x00\x4a\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
-\x00\x52\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\x69\
-\x00\x04\x00\x00\x00\x01\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x00\
-\x00\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\x00\x02\
-\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00\x18\xa0\x03\x00\x04\
-\x00\x00\x00\x01\x00\x00\x00\x18\x00\x00\x00\x00\x5e\xc7\x90\x1c\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x02\x38\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\
-\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\
-\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x34\x2e\x30\x22\x3e\
-\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\
-\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\
-\x6e\x73\x23\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\x66\x66\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\x2f\x22\
-\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x65\x78\x69\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
-\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x65\x78\x69\
-\x66\x2f\x31\x2e\x30\x2f\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\
-\x69\x6f\x6e\x3e\x31\x3c\x2f\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\
-\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x3c\x74\x69\x66\x66\x3a\x52\x65\x73\x6f\x6c\x75\x74\x69\
-\x6f\x6e\x55\x6e\x69\x74\x3e\x32\x3c\x2f\x74\x69\x66\x66\x3a\x52\
-\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x55\x6e\x69\x74\x3e\x0a\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x65\x78\x69\x66\x3a\x50\x69\
-\x78\x65\x6c\x58\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\x32\x34\
-\x3c\x2f\x65\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x58\x44\x69\x6d\
-\x65\x6e\x73\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x3c\x65\x78\x69\x66\x3a\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\
-\x65\x6e\x73\x69\x6f\x6e\x3e\x32\x34\x3c\x2f\x65\x78\x69\x66\x3a\
-\x50\x69\x78\x65\x6c\x59\x44\x69\x6d\x65\x6e\x73\x69\x6f\x6e\x3e\
-\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\
-\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x3c\x2f\x72\
-\x64\x66\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x3e\x0a\xf2\x97\x05\x8b\x00\x00\x07\x10\x49\x44\x41\
-\x54\x48\x0d\x55\x55\x7d\x50\x54\xd7\x15\x3f\xf7\x7d\xee\x2e\xbb\
-\xb0\xc0\x2e\x2c\x2c\xbb\x2c\xba\x82\x82\x26\x76\xb0\x63\x94\x18\
-\x57\x49\x6a\x63\x44\xa5\x48\x4b\x33\xd3\x0f\x9b\x19\xf8\xc3\xd0\
-\x74\x3a\xd3\xc6\x34\x49\xb3\x93\xd6\xc9\x47\xb5\x5f\x33\x9d\x41\
-\x92\xb6\x4c\x5b\x63\x06\xdb\xaa\x68\x11\x66\x92\x62\x68\xe2\xd8\
-\x2a\x05\x35\x0c\x31\x11\x44\x08\xa0\xb2\x2c\x2c\xfb\xfd\xde\xbb\
-\xef\xf6\xde\xb7\x60\xc3\x99\x79\xef\x9e\x7b\xee\xb9\xe7\xbc\xdf\
-\x3d\xbf\x73\x1f\x82\x2f\x4a\x30\xc8\x41\x30\xa8\x33\x53\xed\xa1\
-\x91\xf2\x99\xd9\xc8\x1b\x48\xd0\x0b\x6b\xb6\x6f\xd9\xde\xde\x02\
-\x9a\xff\xc9\x5b\x92\x6c\x1d\x24\x6c\xdd\x39\xeb\xd4\x6b\x5a\x7f\
-\xe1\x36\x99\x4c\x5f\x25\x40\x7c\xc0\x01\x20\x40\xe3\x58\x53\x2f\
-\x04\xeb\xce\x4d\x30\x1f\x26\x28\x33\xd0\x77\x90\xd0\xe0\x48\x5f\
-\xd5\x78\x35\xc7\x22\xa4\xde\x48\xa9\x7c\x4b\x96\xc5\x09\x84\x98\
-\x80\xd7\x3f\x7f\x61\xf0\xc4\x23\xaf\x3f\xf0\xa5\xca\x4f\xbb\xf6\
-\xb5\x08\x22\x1f\xd4\x55\xec\x4a\xa7\x15\x50\x53\x18\xcc\x56\x13\
-\x48\x26\xe1\xae\xaa\xe3\xe0\xab\x4f\x9d\x3d\xce\xfc\x97\x13\x20\
-\x68\xa4\x09\x4e\x21\xbc\xb6\xbe\xb7\x03\xec\xe5\xdf\xb1\xf2\x61\
-\xbd\xbc\xbc\x44\x8d\xcc\x26\xe5\x91\xcf\xee\x86\x64\x0b\x6e\x5b\
-\x58\x4c\x78\x25\x40\xda\x96\x9a\xf7\x0b\xd6\x6d\xf8\x64\x77\x3c\
-\x92\xe2\x22\x73\x71\xb0\x4b\x2e\x88\x86\x93\x70\x3f\x32\x05\x2e\
-\x9f\x1d\x0a\x3c\x36\x4c\x74\x38\xf4\xca\xde\xb3\xc7\x29\x30\x2a\
-\xc1\x20\x62\xc1\xb7\x94\x80\x59\xc3\xfc\x0e\x59\x5f\x00\xa7\xc3\
-\xa2\x6a\xe9\xb4\x9c\xeb\xb0\x62\x87\x33\xc7\xa1\xa4\xc9\x61\x09\
-\x41\xb6\xdd\xb9\xe0\x5e\x5d\x31\xb6\x2b\x1e\x49\x72\xe1\x7b\x51\
-\x90\x79\x0b\x1c\x78\xe4\x10\x3c\xbd\xb3\x15\x24\xce\x0c\x93\x37\
-\xe7\xe0\xfe\x44\x94\x07\x1e\x7e\x1e\x3c\x57\xe7\xcd\x24\x18\xae\
-\x34\x90\x2c\x6e\x7c\xbd\x9c\xe3\x4c\x1e\x59\x40\xa0\x26\x93\x62\
-\x74\x7e\x11\xd4\xb4\x0a\xae\x02\x1b\xf0\x32\x44\x6a\xf7\x7b\xbe\
-\xdd\xf0\xb5\x3f\x9d\x11\xc4\x94\x18\x9d\x4b\x81\x4e\x30\x54\x97\
-\xed\x84\xc2\x1c\x2f\x78\x0b\xfd\xb0\xb9\x72\x27\x10\xc0\x34\xc1\
-\x22\x68\x8a\xee\xe0\x38\x61\xb7\x91\xa0\x7a\x6c\xde\x18\x35\xae\
-\x68\x03\x67\xc9\x45\xb2\x59\x52\x75\x82\x38\x55\xd5\x20\x1e\x8b\
-\xf0\x66\x13\xa7\xb8\xdd\xab\xf2\xff\xf3\xfe\x62\x3b\x70\xa8\x14\
-\x2b\x18\x34\xac\x41\x41\x76\x09\x6c\x2a\xab\x05\x5d\xc7\xb4\x56\
-\x3a\x6c\x7f\xf8\x29\x28\xc8\x2d\x06\x55\x55\x41\x49\x6a\xc0\x71\
-\x7a\xa9\x11\x78\xa0\xae\x19\xb3\x93\x22\x9a\xb9\x81\x97\x04\x88\
-\xc4\x12\x30\x35\x9b\x82\xbb\x73\x49\x08\x85\x62\x10\x9a\x8b\x4a\
-\xba\x92\x24\x44\x30\x35\x25\xe2\x0e\x17\xf3\x45\x88\x83\xad\xfe\
-\xdd\x60\xb7\x14\x50\x24\x1a\x60\x5d\x03\x67\x4e\x31\xec\xd8\xb8\
-\x9f\x16\x5a\x04\x51\xe6\x69\x62\x00\xbe\xba\xf9\xaa\x38\x73\xcc\
-\x8d\x3d\x07\x3e\x6e\x92\x88\xf6\x92\xa4\x86\x70\x5c\xb1\x0a\x49\
-\x25\x01\x49\x8d\x40\x24\xa9\xc2\xfc\x82\x02\x8a\xa2\x61\xd9\x96\
-\xcb\x89\x24\x22\x39\x0a\xc7\x9c\xbc\x92\x05\x35\x6b\xf6\x42\x28\
-\xfa\x39\x74\x5f\xeb\x80\x91\xe9\x2b\x90\x6f\x75\x81\x2b\xcf\x03\
-\xa3\xf3\x83\x60\xce\xa5\xa4\xd5\xb9\x77\x96\x59\x04\x9e\x86\xfe\
-\x10\x8e\x7d\x7a\xb6\x98\x44\x67\x52\xee\x7d\x2f\x46\x62\xd3\x2a\
-\x8f\x75\x91\xf1\x8c\x50\x92\x73\x88\x27\x72\x96\x85\xe4\xd9\x31\
-\xf7\x78\xed\x91\xc5\x74\x34\x99\xcd\xc5\x6d\x10\x4d\x87\x21\xa9\
-\xc4\x0d\x3e\x5a\x25\x3b\xd8\x4c\xb9\xa0\x5a\xe6\xc1\x9c\x2d\x86\
-\x52\x90\xbf\x99\x67\x70\x4b\x9a\x06\xea\x05\x1c\x3e\x38\x79\xbe\
-\x69\xd7\xf4\x68\xef\x3f\x0b\xfc\x4f\x3c\x47\x04\xbb\x19\xeb\xaa\
-\x8e\x78\x91\x9e\x2f\x61\xcd\xc5\x99\x88\xa6\xe9\x24\x97\x27\x1a\
-\x99\x2e\xf1\x8d\x67\x27\xb4\x28\x97\x4e\x2a\xc0\x73\x94\x34\xf4\
-\xc1\xa0\x00\xb2\xa6\xc1\x9a\x6b\x21\x0b\xf7\xd1\x6b\x47\xbf\x71\
-\xb2\x4b\x60\x09\x44\x35\xf1\x4d\x21\xba\xd0\x4f\xd5\x59\x36\x97\
-\x63\xb7\x8f\x40\x91\xff\x35\x8d\x60\xc5\xc2\x23\x93\xc2\xc9\x28\
-\x9a\x8e\xea\x77\x42\x48\x94\xcd\x33\x9a\x4d\xae\x2d\xcb\xc9\x0d\
-\xfd\xc1\xe3\x1b\xdc\x6d\xcd\x31\xbb\xb0\x66\x94\x10\x78\x81\x26\
-\x12\xb9\xbb\x9f\x5c\x5f\x7b\xf9\x83\x0b\x9e\x39\x80\xd3\x60\x24\
-\x00\x88\x3f\xac\xea\x91\x0e\x16\x9c\x75\xf4\x40\x10\xfd\x72\x7d\
-\xe3\xdf\x9e\xb1\xda\x1f\xf5\xf3\xa1\xe1\x0f\x45\x82\x4a\x39\x5b\
-\x9e\x67\xaf\x3f\xaa\x57\xf8\xe7\x50\x32\x39\x09\xdd\x03\x75\x8f\
-\x59\x0b\xc6\x6b\xf2\x4c\x0b\x4f\xf0\x3c\xe7\x03\xd0\x29\x52\x61\
-\x42\xd7\x94\x7f\x0c\x7c\xb8\xcd\x2f\xc3\xc4\x57\x58\x38\xc1\xdf\
-\x4a\x64\x3c\xd1\x93\x8d\x95\xfb\x23\xcc\xe0\xbb\xd8\x21\x8d\x03\
-\xa4\xb8\xd9\xcf\x5e\x96\xad\xeb\x4f\x9a\x0b\x9d\x67\xfa\xdb\xf6\
-\x7e\xda\xf2\xe6\x7b\x5d\xdf\xdf\xef\xd0\xef\x4d\x45\x85\xdb\x13\
-\x61\x75\x93\x27\xec\xef\xfa\xfb\x8f\xea\x47\x4f\xac\x3b\x56\xd5\
-\x38\x2c\x0d\x9f\xaa\x52\x68\xc3\x1a\x77\xd9\xda\xfa\xe7\x4c\x94\
-\xe5\x22\x8b\xc7\x59\x16\x40\xa0\x00\xb1\x4a\xf8\x05\x66\x18\x87\
-\x3b\x1a\x1b\xaf\x5f\x3c\xfc\xd7\xd4\xe4\xb1\x87\xfa\xdb\x36\x1c\
-\x03\xb8\x7d\xee\xf8\xbb\xff\xee\x09\xa5\xac\x42\x71\x89\x57\xb1\
-\xdb\xdd\xfc\xba\xe2\xdb\xb0\xc6\x11\x3e\x0c\xb5\x24\xdf\x08\x1e\
-\xe8\x13\x20\xc8\x76\x02\x28\x02\x49\x61\xa4\xa9\x4c\xe7\xae\xff\
-\x19\xc5\x11\xd2\x63\x1c\xe8\x36\x66\x00\x67\xa5\x71\x5b\x52\x4d\
-\xbb\xf1\x5e\xfb\x0d\x00\xba\x91\xc9\x7f\x9f\xfe\xc1\xc9\xd3\x37\
-\xb4\x2c\xab\x47\xf2\x16\x97\x42\x51\x81\x55\x09\xac\x49\x38\x2a\
-\x3c\x43\xcf\xb3\xe5\xe6\x72\x1b\x5a\x4e\x80\xd2\x58\x02\x22\x45\
-\x98\xdd\x68\x34\x8c\xd0\x14\x11\xad\x6b\x98\x01\x66\x9d\xcb\xd4\
-\x45\xd5\xcd\xc7\x29\xcc\x1d\x14\x60\xa7\x44\x57\x6e\xb6\xbd\xf2\
-\xd1\x91\xd1\x19\x04\xab\x7d\x5e\x9c\x6b\xf3\x08\xbe\x82\x30\x04\
-\xdc\xe1\x56\xd8\x38\xef\x6b\x6f\xdf\xa4\x56\x4f\xef\x31\x58\x89\
-\x68\x37\x22\x25\x6a\x10\xc6\x48\x20\x92\xec\x8b\x26\x70\x3d\xc6\
-\xe2\x07\xd8\x2b\x23\x64\xa0\xbd\x85\xc1\xa4\x88\xbe\x6e\xc0\x05\
-\x78\xfe\xd5\xb7\x3a\x2f\xdf\x04\x39\x4f\x2c\xf1\xba\x49\x7e\x7e\
-\xbe\xba\xb5\x12\x9b\x6a\xb7\x8d\xbc\xcc\xb6\x6c\x95\x2f\x19\xf1\
-\x34\x69\xb6\x8c\x5e\x85\x46\x4d\x8d\x50\xab\x9b\x6e\x79\x4a\xf7\
-\x9c\x1f\xa3\x13\xa7\x61\x58\x42\xb6\xa4\x1b\x43\x06\x0d\x53\xfd\
-\xbb\x7a\x3e\x18\x23\x89\x44\x02\xdf\xb8\x36\xac\xf7\x5c\xe8\x22\
-\xc1\xdf\xf4\x92\xaa\x67\x6e\xd5\xb0\xd5\xea\x66\x22\x96\x6d\xfb\
-\xf5\xb3\x54\xcd\x14\xb9\xaa\xb1\x53\x1a\x7d\xd7\x3f\x89\x44\x5b\
-\x6f\x69\xed\xdb\x41\xe6\xe4\xfb\x6e\x1f\x3b\x92\x15\xc2\xd0\xf4\
-\xf5\x11\x5a\x8f\x5b\xbd\x6f\x76\x5c\x7a\x27\xc5\x9b\x39\xb7\xa7\
-\x30\x9d\xe7\x2c\xd2\xaa\x4a\x4d\x50\x24\x45\xbe\xcc\x36\xe0\xd1\
-\xdf\x05\xd0\xe2\xec\x10\x55\xd5\x40\x20\xc8\xea\x47\x8c\x33\xaf\
-\x0a\x12\xa9\xb4\xee\xfc\xc7\xae\xcd\x3f\xd9\xc1\x1c\x4b\x1a\x3b\
-\xcd\x6c\x5c\x29\x81\x4c\xc1\x01\x5c\x1d\x67\x07\x12\xac\xc3\xa7\
-\x27\x27\x12\xff\xba\x74\x9d\xfc\xf0\x67\x97\x5f\xa0\xbe\x68\xe3\
-\xb6\x17\xf7\xad\xdc\x43\x67\x01\x46\x31\x2a\xde\xc6\xe1\xca\x55\
-\x7b\x4e\x5d\xf3\x3c\xf4\xad\xf5\x86\x13\x6d\xba\xea\x6a\x56\x68\
-\xca\xef\x25\x09\x04\x97\x58\x05\xcf\x36\x9c\xe9\xb9\x12\x4a\xab\
-\x98\xdc\x99\x99\x22\xbf\x3f\x35\x78\x19\xa0\xb4\xac\xbb\xbb\x55\
-\x5e\x72\x5d\x26\x4b\x66\xca\x8e\x8a\x69\xeb\xea\xaf\xac\xf7\x3f\
-\x79\xa6\xcf\x5b\xdb\x76\x60\xc9\x31\x33\xd0\x64\x99\x0f\xe9\xe4\
-\x5b\x7f\xdb\xbd\x1c\xc4\xd7\x3f\x30\x34\xad\x51\x24\x27\x4e\x4f\
-\x8d\x03\xf4\x66\x65\x9c\x97\x3f\x62\x45\x04\x56\xa0\xab\x46\x61\
-\x1c\xdf\x23\xb6\xf2\xba\xf3\x47\xcb\x76\xfd\xe5\x68\x49\xe0\xad\
-\x40\x45\xc5\x8f\x33\x3d\xf2\x05\xff\xe6\xe0\x39\xcb\xc1\xd6\x4e\
-\x46\x0a\x7f\xdb\x1f\x2f\x74\x1d\x7c\x69\xe8\x1e\x34\x0c\x7d\xc9\
-\x70\x79\x80\xf2\xff\x3f\xfd\x07\x5b\x59\x92\x01\xca\x69\x66\xf0\
-\x36\xf4\x54\x89\xf1\xd4\xa3\x40\x62\x56\x4c\x4c\x09\x4c\xd2\x49\
-\x84\x63\x71\x1d\xe3\x58\x4c\x5d\x8c\x67\xa3\x7b\x73\x13\x1f\xfd\
-\x6a\x98\xba\xb2\x23\x64\xa8\x92\xf4\x59\x21\xff\x03\x3b\x66\x0c\
-\xaf\xd1\xe0\x32\x1f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x09\x21\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x78\
-\x65\x58\x49\x66\x4d\x4d\x00\x2a\x00\x00\x00\x08\x00\x05\x01\x12\
-\x00\x03\x00\x00\x00\x01\x00\x01\x00\x00\x01\x1a\x00\x05\x00\x00\
-\x00\x01\x00\x00\x00\x4a\x01\x1b\x00\x05\x00\x00\x00\x01\x00\x00\
-\x00\x52\x01\x28\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x87\x69\
-\x00\x04\x00\x00\x00\x01\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x00\
-\x00\x48\x00\x00\x00\x01\x00\x00\x00\x48\x00\x00\x00\x01\x00\x02\
-\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x00\x18\xa0\x03\x00\x04\
-\x00\x00\x00\x01\x00\x00\x00\x18\x00\x00\x00\x00\x5e\xc7\x90\x1c\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x01\x59\x69\x54\x58\x74\x58\x4d\x4c\
-\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
-\x00\x00\x00\x3c\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\
-\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\
-\x58\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x34\x2e\x30\x22\x3e\
-\x0a\x20\x20\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\x78\x6d\x6c\
-\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\
-\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x30\
-\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\x61\x78\x2d\
-\x6e\x73\x23\x22\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x74\x69\x66\x66\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
-\x65\x2e\x63\x6f\x6d\x2f\x74\x69\x66\x66\x2f\x31\x2e\x30\x2f\x22\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x74\x69\x66\x66\
-\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\x3e\x31\x3c\x2f\
-\x74\x69\x66\x66\x3a\x4f\x72\x69\x65\x6e\x74\x61\x74\x69\x6f\x6e\
-\x3e\x0a\x20\x20\x20\x20\x20\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\
-\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x0a\x20\x20\x20\x3c\x2f\
-\x72\x64\x66\x3a\x52\x44\x46\x3e\x0a\x3c\x2f\x78\x3a\x78\x6d\x70\
-\x6d\x65\x74\x61\x3e\x0a\x4c\xc2\x27\x59\x00\x00\x06\xae\x49\x44\
-\x41\x54\x48\x0d\x6d\x55\x7b\x70\x94\xd5\x15\x3f\xf7\x7b\xed\x23\
-\xdf\x6e\x12\xb2\x1b\x12\xb2\x9b\x17\x61\xd1\x2c\x28\x74\x75\x10\
-\x94\x66\x33\x99\x8a\xd8\x30\xc2\xc0\x3a\xe8\x8c\xb6\xca\x10\x66\
-\xc4\x4c\x2d\x7f\x54\x6c\xeb\xb8\x7d\x30\x83\x1d\xad\xb5\xb5\x6d\
-\x88\x56\x99\x52\x2a\x93\x54\x89\x82\x90\xcc\xe8\x64\xc1\xc2\x00\
-\xb2\x25\x80\x6b\x9a\x92\x17\x90\x10\xe9\x86\x4d\x36\xd9\xf7\xf7\
-\xb8\xbd\xf7\x7e\x09\xb3\x99\xe9\x9d\xf9\xee\x3d\xe7\xdc\x73\x7e\
-\xf7\x9e\xd7\xfd\x10\xe4\x8f\x60\x90\x83\x60\x50\xa7\xa2\xa6\xdd\
-\xfd\x9e\x89\x68\xfc\x75\x24\xe8\x8b\x1f\x6e\x58\xdb\xd0\xbe\x0b\
-\xd4\xba\x8d\x83\x92\x49\xbe\x84\xe9\xbe\x33\xea\xd4\x43\xa1\x46\
-\x8d\x90\x8c\xa7\xb2\xff\x37\xd0\x5d\x61\x10\x13\x70\xa4\xd7\x06\
-\x2e\x16\x5a\x85\xcc\xeb\x19\x85\xdf\x55\x60\x75\x02\xc6\x66\xe0\
-\xf5\xb1\x57\x2e\x1d\x7e\x68\xff\x5d\xdd\x3c\xc2\xef\xef\x15\x42\
-\xfe\x53\xfa\xfc\xc5\xf2\xb6\x18\x39\x7f\x00\x82\x00\x39\xa0\x13\
-\x69\xf7\x6c\xe9\x39\x08\x45\x9e\x1f\xc8\x7c\x4c\xf7\x78\x5c\x4a\
-\x3c\x9a\x36\xf5\x5f\xfb\x76\xd2\x64\xd5\xda\xa6\x67\x52\x95\x12\
-\x20\x15\xeb\xb3\x37\xb8\x6c\xe2\xfc\xe8\x17\xcf\x84\x08\x4a\x86\
-\x22\x79\x03\x1d\x52\xa4\xf3\xc9\x1c\xa5\xf3\x07\xc7\x98\x60\x10\
-\x51\xf0\xb5\x2e\xb0\xa8\x1a\xdf\x68\xd2\xa7\xc1\xe9\xb0\x2a\x6a\
-\x36\x6b\x2a\x76\xc8\x9a\xc3\x59\xe8\xc8\x65\xf1\x5e\x09\x81\x5d\
-\x47\x68\x11\xcf\x17\x36\xa2\x82\xf2\x3f\xbb\x36\x1f\xbb\x56\xb5\
-\xf1\xc3\x3f\xd4\x02\x14\x52\x70\x5f\xcb\x45\x31\x1f\x9c\xd2\x02\
-\x13\x44\xea\x99\x27\x33\xab\xf6\x7b\x38\xce\xec\x36\x09\x08\x94\
-\x74\x5a\x9c\xcd\x69\x60\x2f\x12\xa1\xac\xd4\x06\xd3\xc9\x3b\xf1\
-\x86\xc7\xdd\xcf\xbe\xbf\xe3\x9e\x59\x66\x83\x31\x2a\x7f\xea\xd4\
-\x23\x02\xd8\xf6\x70\x9b\x3e\x1b\xa8\x4d\x0c\xef\x0e\xb7\x3f\xf0\
-\x11\x0b\x59\xa8\x51\x65\x3a\x64\x62\x1e\xf8\x86\xa7\xd8\xaa\x72\
-\xe5\x2b\x39\x6b\x31\x32\x59\x24\x45\xc7\x88\x53\x14\x15\x92\x89\
-\x38\x6f\x31\x73\xb9\x8a\x8a\xda\x92\x0b\x5f\xcc\xb4\x53\xc3\xea\
-\x1f\xf6\x9a\x01\x21\x3c\x71\xc4\xff\xe5\x68\x97\x7f\x8b\x66\x72\
-\x05\x74\x5b\xdd\x3b\xe5\xdf\x7b\x7b\x0f\x49\xbc\x9a\xef\x89\x91\
-\x83\xb9\x04\x7b\x1e\xef\x38\x2a\x96\xde\xbf\x99\x87\x59\x25\x9b\
-\x55\x44\x91\xec\xca\x66\x11\x0a\xec\x36\x50\xb1\x80\x27\xa7\x92\
-\xa8\xc0\x92\x7e\xf0\xc2\x81\x35\x17\xbd\x81\x88\x14\x29\x4e\x63\
-\xef\xd4\x30\x62\xb1\x7f\x01\xcb\x55\x63\x27\xfb\xe0\xce\xc0\x6b\
-\xd7\xcf\xfc\xf8\xb0\xcf\x77\x40\x0c\x87\x77\x29\x02\x3d\x2d\x1c\
-\x44\x8a\x7b\xdb\xd7\xdb\x51\x6e\x62\xb3\x30\x33\xa4\x25\xd0\x62\
-\x31\xab\x65\x81\x38\x01\xb1\x94\x02\x7c\x4c\x81\x02\x8b\x49\x33\
-\x17\x96\x08\x99\x94\xfe\x6b\xe2\xc4\x63\x11\x6f\xbd\x4a\xaa\x0e\
-\x47\x48\x99\xba\x02\x67\x2d\x63\x7f\x42\x09\xd3\xb3\x93\x0d\xaa\
-\xa6\xf4\x5a\x5c\x10\x22\xe0\xe3\x00\x41\x8e\x23\x71\x53\xa8\xdb\
-\x80\x63\xef\xcc\x66\xaf\xbf\x2f\x26\x06\xf6\x5b\xec\xc5\x80\x44\
-\x41\xa1\x1e\x48\x3c\x89\x23\xaf\x41\x56\xc9\xf2\x99\xf4\xb4\xce\
-\x49\xf6\x0d\x0d\x3b\x23\x1b\x69\x49\xfb\x5a\x30\xcb\xe1\x58\xe7\
-\xba\x34\x0d\xdb\x7f\xfe\xea\x18\xd7\xcd\xf2\x5b\xce\xfa\x0f\xf6\
-\x51\x48\x5f\x4b\x33\xcf\x42\xe4\xda\x1e\xde\x22\xe4\xbe\xfd\x78\
-\xf4\xe3\xef\x97\x12\x79\x72\xc5\xb6\xe3\xb7\xd3\x42\x99\xac\x28\
-\x29\x9d\xe3\x45\xa4\x6b\x1a\x46\x80\x38\x59\xe4\x14\xd1\xea\x10\
-\xb1\x92\x38\x7f\xf9\xd0\xea\x87\x28\x08\xb9\x19\xc1\x40\x0b\x9a\
-\xad\xe6\xb1\x8f\x4e\xc6\x46\xba\x5e\x88\x0f\x1c\x1a\x61\xc9\x15\
-\x95\xd4\x53\xe2\xec\xf4\x69\xa2\x1d\x25\x5f\xca\x94\x18\xd9\x67\
-\xb1\xc8\x80\x04\x53\xce\x2a\xf0\x48\x12\xad\x5c\x46\x57\xf5\xc8\
-\xa4\x22\xf6\x47\x27\x54\xbb\x6c\x5d\xb3\x6a\xc7\xd0\xd3\x14\xde\
-\xd7\x12\x36\x2a\x91\x32\xa4\xe9\xe8\x82\x39\xe9\x94\x5c\xbe\x76\
-\x03\xa5\xd9\x01\xe4\xd2\xf7\x2b\x7a\xbc\x9b\x0a\x80\x24\x3c\xdc\
-\xdd\xfa\x5b\x48\x44\x06\x65\x7b\xb5\x59\x48\x27\xfe\x59\x90\x89\
-\xdf\x2c\x94\x8b\xb8\x9d\xab\x39\x7d\x5f\xf3\x14\x7a\x74\xf9\x45\
-\xb0\xa0\x99\x5f\x10\x5d\xc1\x08\x31\xf5\x82\x0c\x67\x94\x79\x62\
-\xe2\xf9\x0b\x26\xe0\xaa\xa9\x88\xab\x6b\xc5\x26\x52\x22\x76\x2d\
-\xf7\xdf\x7e\x2a\xa8\x0e\x1d\x94\xc8\x92\xe3\xa2\xd7\x5e\xb5\xaa\
-\xd3\x50\xb4\xd8\xd9\x75\xb9\xeb\xf9\xdd\x8d\x2b\x65\x78\x69\x67\
-\x8d\xfe\x1d\x8f\xc4\x2f\x29\x8e\x29\x0f\xb8\x63\x75\x4b\xaf\xfd\
-\xfb\x47\xd4\xc6\x1b\xf8\xc6\x68\x30\xef\x37\xec\x00\x24\x48\x63\
-\xa4\x40\x98\x8c\xb3\x4e\x83\x40\x5e\x2c\x4d\xc1\xfc\x34\x55\x1e\
-\x85\xeb\xac\x49\xae\x84\xf6\xfe\x23\x73\xf3\xcd\xfb\x4e\xb7\xad\
-\x7c\x13\x60\xe4\xd8\x81\x23\xe7\xbb\x27\x33\xb2\xb0\xc4\x55\x99\
-\x2b\x2a\xaa\xe0\xef\x5d\x32\x02\xcb\x1c\xb1\xbd\xd0\x84\x4b\x22\
-\x9d\xde\x1c\x0b\x4f\x90\x22\x90\xdb\x09\x38\xa3\x21\x95\x15\x0f\
-\x77\xe5\x10\x4a\x22\xa4\x27\x38\xd0\x6d\x6c\xd7\x59\x3f\x9f\x30\
-\xf5\xea\xe7\xed\x57\x01\x8c\xb8\xc2\xbf\x9e\x7e\xe9\xc3\xa3\x57\
-\xd5\x02\xd9\x2d\x55\x2e\xa9\x82\xf2\x52\x39\xe7\x5f\x96\x72\x2c\
-\x77\xf7\xbd\x4c\xed\x5a\x3c\x36\x04\x41\x86\x00\x28\xab\x49\x80\
-\xa5\x38\xe5\x58\x0e\x34\x84\xc6\xb1\x28\x2f\x63\xdb\x51\xa7\x11\
-\x4f\x52\x1a\xbe\x96\x03\xc4\x4d\xfa\x24\x77\xd0\xb0\x0d\xb4\xbd\
-\x76\x66\xdf\xd0\x04\x82\xa5\xd5\x95\x5a\xb1\xcd\x2d\x54\x97\xc6\
-\xc0\x5f\x11\x6b\x85\x55\x53\xd5\xed\xa4\xdc\x7d\xb7\x9a\x49\x51\
-\x13\xc3\x54\xd2\x81\x72\xb3\xb4\x60\x8c\x03\x44\x6c\x0f\x99\xa1\
-\xec\xbb\x54\xe0\xa7\x93\x31\x70\xb8\x7d\x17\x75\x93\x78\xf4\xa4\
-\xd1\x2b\xf0\xf2\x2f\xdf\xed\x38\x37\x00\xa6\x45\xa2\xab\xb2\x02\
-\x97\x94\x94\x28\xeb\xea\x35\x73\xd3\xfa\xfe\x57\xa9\xc9\x3a\xd3\
-\x59\x76\x61\x55\x8a\xd6\xa4\xb9\x18\xcb\x29\x83\x5a\xba\x7d\xd0\
-\x5d\xd5\x7c\x7c\x98\x30\x4e\x26\xb8\x5b\x5d\x73\x1c\x59\x0c\x6f\
-\x28\x5f\xb7\xa1\xfb\xd4\x30\x4e\xa5\x52\xda\xd5\xcb\x11\xbd\xfb\
-\xe4\xa7\x38\xf8\x76\x0f\xf6\xee\x18\x7c\x98\xee\x92\xe6\x13\x6b\
-\xd6\xff\xee\x45\x42\x1a\x49\xa6\xef\xf8\xd0\x91\xba\x9b\x48\xb4\
-\xf5\x54\x35\xbd\x17\xa4\x4a\xa4\x2b\x69\x48\x16\x0c\xea\x4d\x6f\
-\x2f\xed\xdc\xc1\x9e\xdf\x1c\x3c\xfb\xf7\x0c\x6f\xe1\x2a\xdc\x8b\
-\xb3\x8b\x9c\xe5\xaa\xb7\xca\x0c\xe5\x52\xfc\x41\x6a\xa0\x0d\xfd\
-\xd1\x8f\x66\xa2\x7d\x84\x54\xfc\xfe\x20\xed\x0b\xa3\x86\xbd\x41\
-\x2c\x55\x6d\x3a\xfe\x75\xd9\x9a\x9f\x36\x52\x45\x57\xa0\xc3\x42\
-\xd7\x85\xc3\xcf\x1a\x89\xc8\xca\x0e\x7e\x12\x4e\x61\x32\x6e\xdd\
-\xbc\x91\xfa\xf2\xec\x15\xbc\xe7\x57\xe7\x5e\x21\x72\xb4\x6a\xfd\
-\xcf\x9e\x58\x68\x43\x38\xfa\x86\x53\x61\x65\x20\x52\x5f\xdb\xdc\
-\x79\xd9\x7d\xdf\x33\x2b\x98\x12\x69\x3a\xfa\x2a\xd2\x47\x8b\xf1\
-\x64\xf2\x07\xe7\xaa\x0a\x5e\xdc\xda\xd5\xfd\xd5\x64\x56\xd1\xf0\
-\xf5\x89\x71\xfc\x97\xce\x4b\xe7\x00\xaa\x6a\x4e\x9c\x68\x35\xcd\
-\xe9\xce\x17\x8b\xc1\xd2\x50\x51\xea\xde\x2d\x5f\xad\xa8\xdb\xd8\
-\xd5\x5b\xd9\xd4\xb6\x6d\x4e\xd1\x58\xc8\x61\xc6\x45\x3a\xf8\xd6\
-\xdf\x9f\x98\x07\xa9\x3e\x1d\xee\xbb\xa5\x12\x4f\x0e\x1f\x1d\x1f\
-\x05\xe8\x29\x30\x94\xe7\x2f\xb1\x00\x81\x26\xc8\xf8\xe5\x39\x9e\
-\xc7\x36\xcf\xa6\xe3\x6f\xd4\x6c\xf8\xdb\x1b\x2e\xff\xbb\xfe\xe5\
-\xcb\x7f\x62\xf4\x48\x9e\x7e\x4b\xf0\x98\xf5\xb9\xd6\x0e\x5a\x14\
-\x75\x6d\x1f\x9c\xfc\xf4\xb9\x9f\xf7\xdd\x86\xad\x7d\xab\x99\xca\
-\x5d\x2f\x49\xcc\xf2\x6c\x18\xc9\xfe\x0f\x73\x4f\x78\xe5\xd6\x6e\
-\xaf\x98\xcc\x3c\x02\x38\x21\x6b\xd8\x9c\xd2\x70\x36\x8d\xb4\x44\
-\x92\xbc\xae\x89\x84\x32\x93\xb4\xa3\xdb\x77\x6e\x9c\x79\x8b\xfc\
-\x12\x80\x86\x90\x7a\x95\x66\x20\x79\xd3\xff\x00\xeb\x97\xc6\x83\
-\xea\x9c\xf6\x4c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x02\x94\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x36\x49\x44\x41\x54\x78\xda\xd4\
-\x55\xcd\x4b\x1b\x41\x14\x7f\x46\xb7\xd1\x45\x6b\x30\x7e\x1d\xa2\
-\x28\x45\x73\x90\x62\x0e\x5e\xfc\x00\x15\x6f\x82\xb4\xbd\x78\xcf\
-\x5f\x62\x3c\xfb\x47\xa4\xf4\x50\xe8\xa1\xd4\x0f\x48\xa1\x22\x1a\
-\x54\x14\xcc\x21\x2a\x08\x51\x44\x11\xf1\xa0\x8d\xba\x0d\xdd\xb8\
-\x89\xba\x7d\x6f\xba\xb3\xcc\x6c\xbe\x56\x29\x05\x1f\x3c\x66\x66\
-\x67\xe6\xf7\x7b\x5f\xf3\x16\xe0\xa5\x4b\x55\xa5\x03\x91\xa5\x77\
-\xef\x71\x18\x45\x0d\x39\xb6\x92\xa8\xf1\xc8\xd4\xc2\xfc\xb3\x08\
-\x10\x78\x0c\x87\x28\x6a\x57\x05\x1b\x4e\x51\xc3\x48\xb4\xe6\x9a\
-\x00\xc1\x23\x38\xcc\xf0\x75\xde\x78\x00\x43\xcf\x4b\x67\xbc\xaa\
-\x02\x8a\xb7\x5a\xfc\x34\x8b\x24\x91\x8a\x04\x22\x38\x01\x6b\x57\
-\x3a\x1b\x8b\x09\x11\x34\xb6\xa8\x22\x51\x01\x49\x55\x91\xb0\xac\
-\xd2\x3c\x9b\xc9\xc1\xed\xa5\xee\x2a\x91\xbe\x56\x15\xea\x1a\x5e\
-\xf1\xe5\xb8\x18\x2e\x8f\xe3\x6c\x94\x5b\xee\x16\x9c\x84\xce\x0a\
-\x5e\x46\x8b\x7a\x60\x55\xcb\x37\x9a\xff\x3c\xcf\x80\x5a\xed\x83\
-\xc9\xfe\x30\x18\x79\x1d\x56\x0e\xbe\x80\xa6\xa7\x25\xd0\x4e\x7f\
-\x10\x86\x7b\xa7\xa0\x51\xf5\xc3\xe7\xcd\x39\xc8\x9a\x1a\x34\x07\
-\x1a\xf8\xf6\x07\x5e\x5d\x35\xc2\x9d\x51\x6e\x3d\x69\x4f\x77\x08\
-\x41\x7a\xd9\x46\x4f\x7b\x08\x12\x27\x2b\xb0\x71\xb8\xc4\xd6\x13\
-\x7d\xd3\xf0\x36\x30\x64\x5f\x6c\x53\xdf\xc0\xd1\xf5\x0e\xbb\x67\
-\xe5\x83\xb0\x0a\x08\x58\x9d\xf3\x6a\xd9\x3f\xdf\x82\x11\xb4\xd0\
-\xab\xa8\x6c\x3d\xd0\x3d\x81\xa0\x83\x7f\x2b\xc8\xfa\xc6\x72\x95\
-\xd3\x21\x99\xda\x06\xa5\xde\x64\x77\x2d\x82\x50\xa9\x1c\xd8\x42\
-\xa1\xe1\x16\xdb\xa5\x89\xc0\x22\x38\xc9\xe2\xe6\x27\xc8\x1a\x3a\
-\xfc\xd6\x8c\xa2\x38\x9e\x72\xc9\xa3\xb0\x68\xd9\x74\xc9\xfd\xe3\
-\x8b\x03\x48\xa4\xe2\x6c\xfe\x70\xff\xc8\x2a\xef\x49\x04\x24\xb1\
-\xe4\xc7\x92\x7b\xcb\x89\xaf\xd2\xda\x34\xcb\x7b\x90\xe4\x2f\x54\
-\x94\xb3\x74\x0a\xf5\xb0\xd0\x3b\xb4\x9c\x3c\x10\xe5\xb5\xbf\x4e\
-\xc2\x72\x12\xc4\xf9\xeb\x74\xb4\x00\x88\xed\x4a\xa5\xcd\x12\xfb\
-\xc3\x61\x7d\x6d\xbd\xc2\x54\xc4\x92\x08\xac\xba\xa5\xc6\xc5\x9e\
-\xbf\x28\xf4\x06\x28\x1f\x5c\x36\xf6\xbe\xc3\x4d\xe6\x4a\x3a\xd3\
-\x11\xf4\xdb\xcd\x4f\xec\xb0\x35\x0e\xcf\xc3\xd4\x2a\xc8\x03\x7a\
-\xfe\xe2\x6b\xa6\x8a\x52\x3d\x3e\x8c\xb3\x09\xeb\xfb\x31\xe9\x52\
-\x20\xd8\x24\x5a\x1f\x7e\x76\xb3\xa3\x3a\xcf\x5c\xdf\x49\x61\x21\
-\xcb\x05\xf0\xf2\xcd\xce\x4d\xbb\xd6\x7f\xe5\xec\x84\x0a\xc0\xee\
-\xdb\xf5\x7f\xf9\xe1\xfc\xcb\x5f\xe6\xcb\x97\x3f\x02\x0c\x00\xc4\
-\xc5\xfd\xc6\x4b\x25\x02\xde\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x02\x64\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x06\x49\x44\x41\x54\x78\xda\x9c\
-\x55\x3b\x6e\xc2\x40\x10\x5d\x90\x9b\x28\x4d\x8e\xe0\xdc\xc0\x54\
-\x29\xb1\xa5\xd0\xa4\x41\x69\x69\x62\x9f\x00\x73\x02\xc2\x09\x62\
-\x4e\x80\x69\x68\x51\xfa\x48\x98\x32\x9d\x6f\x80\xeb\x88\x9f\xc2\
-\xc7\x40\x81\x32\x13\x8d\xd1\x68\xe4\x0f\x66\xa4\x95\xd7\x9e\xf5\
-\x7b\x6f\x76\x66\x67\x2b\xea\x06\x9b\x4e\xbf\x0c\x78\x7c\xc0\x30\
-\xe9\xd3\x1a\x86\x0f\xa3\x57\xaf\x3f\xaf\xf9\xda\xca\x0d\xe0\x08\
-\x3a\xc9\x70\x87\x30\x2c\x4e\x52\xbd\x21\x80\x01\x7f\xd9\xef\x77\
-\x6a\xb1\x98\xab\xd5\x6a\xa9\x8e\xc7\x23\x46\xe6\x72\x7f\xb5\xa4\
-\xfa\x77\x78\xe8\xc9\xfb\xe9\x74\xf2\x00\xd8\x3a\x1c\xe2\x10\x89\
-\xe6\xf3\x1f\x24\x6c\x5e\x4d\x10\x7f\xdf\xeb\x0c\x1c\xe7\x6d\xe6\
-\x0e\x1a\x8d\x97\x4e\xab\xe5\x04\x30\xef\x27\x1f\x81\xd0\x28\x24\
-\x40\x60\x18\xb8\xcf\x33\x46\x62\xc3\x78\x60\xcb\x7a\x6c\xfe\xc6\
-\xe6\xd1\x35\x11\xe8\xac\x42\x92\x3d\xf7\x99\xdf\x87\x44\xa2\x72\
-\x35\x1a\x0d\x4c\xb6\x16\x6d\x58\x48\x70\xf7\xb4\x0b\x18\xa0\x09\
-\x51\x98\x00\x18\x91\xea\xb5\x50\xcf\x93\x8e\x3e\xef\xda\x1c\x24\
-\x60\x1c\xc4\xa3\x5a\x8f\x48\xbd\xcb\x93\x8e\x3e\xc8\x49\xf6\x39\
-\x40\xa5\x39\x35\xde\x81\xc8\x2e\xea\x00\x1c\xf3\x31\x63\x79\x09\
-\x01\xbc\x26\x7f\xd2\x4a\x54\x69\x17\x04\xf8\x40\xc2\x15\xbe\x66\
-\x25\x37\x2b\x02\x54\x63\xe4\x90\x84\x82\xa0\xd0\x4a\xb7\x8a\xb2\
-\x22\xb4\x8c\x13\xab\x8b\xe4\x85\xa2\x89\x8d\xc5\x99\xe0\x66\xe1\
-\x21\x2c\xaa\xa2\x31\x25\x7b\x42\x73\x5e\xc2\xb2\x4c\x73\x4d\x4b\
-\x51\xef\x8a\x2d\xb8\xb4\x60\x2a\x4b\x48\xb4\xe3\xc1\x56\xb5\x29\
-\x4a\xf4\xd5\x80\x38\x35\xc9\x55\x01\x8e\x61\x77\x79\x65\x00\xb8\
-\x47\xe0\x3a\xf9\x92\x6e\xe9\xd0\x53\xfe\xa3\xf2\x0e\x9a\x2b\xf6\
-\xd6\xe1\x65\x9a\x80\x21\x19\x9d\xf6\x64\xaf\x6d\x3a\x43\x85\x04\
-\xbc\x69\x05\xa2\xdf\xd8\xcc\x67\x0b\x01\x41\xd6\x39\xd0\x52\x9a\
-\xdc\xbf\x2d\x97\x8b\xa1\x50\xaf\xc4\xf5\x88\x09\x8f\x40\xf9\x63\
-\xd6\xfe\xa7\x11\xe0\x95\x67\x6c\xb7\x1b\x15\xc7\xfb\x36\x28\xc7\
-\x1f\x9b\xa2\x5b\xf6\xa1\x25\x44\xac\xaa\xa2\x32\x55\xf4\x79\x3e\
-\x9f\x8d\xcd\xe6\x57\x51\x25\xc9\xbe\x14\xc9\x6e\x59\x64\x32\x07\
-\x78\x05\x86\x40\x92\xb5\xde\x91\xdd\xb2\x14\x01\xd6\x3b\xdc\xaf\
-\x16\xa9\xe4\x40\x98\xc4\x1a\x5d\x8f\xa5\xec\x4f\x80\x01\x00\xdf\
-\x64\xe5\xe9\x0e\xc2\xdc\xed\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x02\x9f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x41\x49\x44\x41\x54\x78\xda\x9c\
-\x56\xcb\x4e\xdb\x40\x14\x1d\xa2\x2c\x8a\x04\x92\x51\x41\x6c\xf3\
-\x09\xee\x17\xc4\x91\xca\xa6\x1b\xba\x66\xd3\xe6\x07\x78\x48\x6c\
-\xba\x80\x10\x58\x74\x49\xf8\x02\xc2\x86\x6d\xc5\x1e\x09\xe7\x0f\
-\xf2\x09\x59\xb6\x8e\x1d\x8f\x19\x27\x8e\x13\x62\x71\xaf\x35\x63\
-\x2e\x56\x42\xed\x19\x69\x94\x79\x78\xce\xb9\x73\xee\x63\xb2\xc6\
-\x34\x5a\xaf\xf7\x68\xc2\xcf\x35\x74\x4b\x2e\x71\xe8\x5d\xe8\xed\
-\x7a\xfd\x2b\xa7\xdf\xae\x69\x80\x23\xe8\xd3\x8a\xed\x3e\xf4\x06\
-\x25\xa9\x68\x5c\xe0\x96\x4e\x26\x93\x31\xf3\x3c\x97\xf9\xfe\x88\
-\xc5\x71\x8c\x37\x3b\xa6\xfb\x95\x92\xd6\x5f\xc0\x4f\x4d\xcd\x67\
-\xb3\x59\x07\x80\x1b\xd3\x69\xd4\x47\x22\xd7\x75\x90\x70\x5f\x8b\
-\x00\xc0\x11\xf8\x88\x2c\xd9\x7b\x7b\xdf\x4e\x0e\x0e\x9a\x36\x8c\
-\x6f\xd4\x22\x10\x9a\xba\x37\x68\x41\x37\xc8\xbc\x4d\xc6\x3f\xc8\
-\x78\x40\x0f\x55\x4b\x10\xfc\x54\x03\xce\x7d\x3e\x1e\x87\xad\xfb\
-\xfb\x5b\x53\x3a\xd6\x22\xdf\xdd\x95\x26\x90\x91\x93\x36\xd0\x9b\
-\x01\xb8\x21\x41\xad\x28\x9a\x0e\xd6\xd7\x3f\x31\x12\xae\x1d\x1d\
-\x89\xd2\xb0\x4b\x92\x04\xac\x7f\x0b\xf3\xf9\x7c\xce\x86\x8e\x5b\
-\xa3\xb2\x81\x4f\x78\x69\x02\x88\x6b\x94\x61\x00\x96\xb3\xc5\xe2\
-\x25\x5b\x77\x87\x1e\x44\xcd\x84\x05\xc1\x73\x9a\x03\x00\xde\xc9\
-\x9f\x2d\xec\xe4\x28\x9a\xb4\xc3\x50\x90\xf8\x8f\x14\x70\x4a\x04\
-\xed\x64\xd9\xb9\x6a\x41\xfd\x2d\xc7\xf9\x5b\x47\x89\xa8\xf5\x4a\
-\x3e\x90\xaa\x29\xc3\xb5\x38\x01\x00\x7f\x97\x59\x6b\x40\x86\xa6\
-\x7a\xab\x16\xc7\x33\x1b\xa4\xe9\x61\x2e\x5c\x5e\xfd\xb6\x3f\x32\
-\xb0\xfa\x81\xd5\x7f\xd4\x5c\x88\x20\xdb\x4b\x16\x09\x64\xac\x77\
-\x07\xc0\xdd\x22\xd2\xae\xf2\xc1\x35\xad\x35\x78\x03\xd5\x46\xbe\
-\xcf\xc4\xb3\x68\x15\xf5\x5d\x65\x89\xf5\x58\xac\xb2\x74\x0f\x82\
-\xf7\x61\x29\xb5\xaf\x9d\x9f\xfd\x32\x4b\x13\x00\xb8\x21\x4b\x42\
-\x96\xf6\xd4\xb1\xce\xbf\x21\xfd\xdc\x28\x42\x90\xf7\xc1\x71\xee\
-\x60\x53\xde\x66\x9f\xf3\xc0\x14\x22\xcc\xf6\xfe\xe7\xdc\x55\x04\
-\xb4\x68\xd9\x90\x60\x08\x62\x83\x1c\xfd\xdc\x23\xd3\xd5\xf5\x41\
-\x96\xf6\xa3\x91\x97\x15\xad\xad\x2d\xa3\x95\x2b\x1b\xed\xa2\x04\
-\xd5\x25\x4f\x9e\x89\x19\x0b\x99\x7b\x04\xd5\x12\x4b\x2f\x3e\x20\
-\x56\x18\x8e\x55\x2e\xdc\x80\x3c\x03\xdd\x1b\x3c\xa0\x53\x85\x48\
-\x4b\x80\x29\x65\x49\x9f\xc0\xdd\xdd\x1d\x55\xeb\x3b\x65\x5e\xc1\
-\x3c\x01\x3e\x81\x7d\x1a\x39\xaa\x6d\x6c\x6e\xb0\xed\x9d\xcf\x4d\
-\xb0\x9e\x6b\x13\xe0\xbf\x01\xa8\xf7\x0d\x69\x25\x05\x42\x67\x7f\
-\x39\x3c\x3c\xb5\x59\xc9\xf6\x2a\xc0\x00\x22\x39\x24\xea\x27\x2a\
-\x36\xf9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x07\x3b\xe0\xb3\
-\x00\x70\
-\x00\x6c\x00\x75\x00\x67\x00\x69\x00\x6e\x00\x73\
-\x00\x16\
-\x0b\xa1\x93\x22\
-\x00\x73\
-\x00\x63\x00\x72\x00\x69\x00\x62\x00\x62\x00\x6c\x00\x65\x00\x6d\x00\x61\x00\x70\x00\x73\x00\x5f\x00\x63\x00\x6f\x00\x6e\x00\x6e\
-\x00\x65\x00\x63\x00\x74\x00\x6f\x00\x72\
-\x00\x0b\
-\x0c\x6a\x2c\x47\
-\x00\x72\
-\x00\x65\x00\x66\x00\x72\x00\x65\x00\x73\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x0f\xa4\x04\x27\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x0f\
-\x09\xfb\x67\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x75\x00\x70\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\xe1\x5a\x27\
-\x00\x64\
-\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x04\x78\x65\x47\
-\x00\x62\
-\x00\x72\x00\x6f\x00\x6b\x00\x65\x00\x6e\x00\x5f\x00\x6c\x00\x69\x00\x6e\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x00\x4e\x59\x27\
-\x00\x6c\
-\x00\x69\x00\x6e\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x07\x00\x00\x00\x03\
-\x00\x00\x00\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x26\x1c\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x23\xb4\
-\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x21\x1c\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x91\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x17\xf7\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x02\xee\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x07\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xfe\x00\x00\x00\x00\x00\x01\x00\x00\x26\x1c\
-\x00\x00\x01\x47\xc6\x40\xee\xd0\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x23\xb4\
-\x00\x00\x01\x47\xc6\x43\x11\xb0\
-\x00\x00\x00\xc4\x00\x00\x00\x00\x00\x01\x00\x00\x21\x1c\
-\x00\x00\x01\x47\xc6\x1f\x64\xe0\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x91\
-\x00\x00\x01\x72\x28\x98\xe0\xc4\
-\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x17\xf7\
-\x00\x00\x01\x71\xc8\x15\x94\xa9\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x47\xc6\x1b\xc3\x30\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x02\xee\
-\x00\x00\x01\x72\x28\x97\xb2\x07\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import *
+
+import uuid
+import time
+import json
+import base64
+
+class ScribbleMapsAuthError(Exception):
+    pass
+
+class ScribbleMapsAuthStore:
+    # Keeps the instance ID and the last bearer token (with its expiry) in one QgsAuthManager config, so both are
+    # stored encrypted and the token survives a QGIS restart.
+
+    CONFIG_ID = 'Scribble Maps Instance ID'
+
+    # Used when the auth endpoint doesn't tell us how long a token lasts and it isn't a JWT we can read
+    DEFAULT_TOKEN_LIFETIME = 15 * 60
+
+    # Don't hand out a token that's about to expire mid-request
+    EXPIRY_MARGIN = 60
+
+    def __init__(self):
+        self.loaded = False
+        self.instanceUuid = False
+        self.token = False
+        self.tokenExpiry = 0
+
+    def _load(self):
+        if self.loaded:
+            return
+        self.loaded = True
+
+        authManager = QgsApplication.authManager()
+        if self.CONFIG_ID in authManager.availableAuthMethodConfigs():
+            auConfig = QgsAuthMethodConfig()
+            authManager.loadAuthenticationConfig(self.CONFIG_ID, auConfig, True)
+            configMap = auConfig.configMap()
+            if "sessionid" in configMap:
+                self.instanceUuid = configMap["sessionid"]
+            if configMap.get("token"):
+                self.token = configMap["token"]
+                try:
+                    self.tokenExpiry = float(configMap.get("tokenExpiry", 0))
+                except ValueError:
+                    self.tokenExpiry = 0
+
+    def _store(self):
+        cfg = QgsAuthMethodConfig()
+        cfg.setId(self.CONFIG_ID)
+        cfg.setName(self.CONFIG_ID)
+        cfg.setMethod('ExternalConnector')
+        cfg.setConfig('sessionid', self.instanceUuid)
+        if self.token:
+            cfg.setConfig('token', self.token)
+            cfg.setConfig('tokenExpiry', str(self.tokenExpiry))
+
+        # Updated in place when it's already there, rather than removed and stored again
+        authManager = QgsApplication.authManager()
+        if self.CONFIG_ID in authManager.availableAuthMethodConfigs():
+            authManager.updateAuthenticationConfig(cfg)
+        else:
+            authManager.storeAuthenticationConfig(cfg)
+
+    def instanceId(self):
+        self._load()
+        if self.instanceUuid:
+            return self.instanceUuid
+
+        # Not set or something went wrong retrieving it - make us a new one, which will make them log in with Scribble Maps again
+        self.instanceUuid = str(uuid.uuid4())
+        self.token = False
+        self.tokenExpiry = 0
+        self._store()
+        return self.instanceUuid
+
+    def isLinked(self):
+        # Whether an instance ID has been stored - unlike instanceId(), never makes a new one
+        self._load()
+        return bool(self.instanceUuid)
+
+    def validToken(self):
+        self._load()
+        if self.token and self.tokenExpiry - time.time() > self.EXPIRY_MARGIN:
+            return self.token
+        return False
+
+    def secondsUntilExpiry(self):
+        return self.tokenExpiry - time.time()
+
+    def setToken(self, authResponse):
+        self._load()
+        if not self.instanceUuid:
+            # Unlinked since the token was asked for - it belongs to an instance ID that's gone
+            return
+        self.token = authResponse["token"]
+        self.tokenExpiry = time.time() + self._tokenLifetime(authResponse)
+        self._store()
+
+    def dropToken(self):
+        # Forget the token but keep the instance ID, so the next check goes back to the server
+        self._load()
+        if self.token:
+            self.token = False
+            self.tokenExpiry = 0
+            self._store()
+
+    def clear(self):
+        self.loaded = True
+        self.instanceUuid = False
+        self.token = False
+        self.tokenExpiry = 0
+
+        authManager = QgsApplication.authManager()
+        if self.CONFIG_ID in authManager.availableAuthMethodConfigs():
+            authManager.removeAuthenticationConfig(self.CONFIG_ID)
+
+    def _tokenLifetime(self, authResponse):
+        if "expiresIn" in authResponse:
+            try:
+                return float(authResponse["expiresIn"])
+            except (TypeError, ValueError):
+                pass
+
+        # Bearer tokens are usually JWTs - if so, the exp claim tells us exactly when this one runs out
+        try:
+            payload = authResponse["token"].split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload.encode('ascii')))
+            if "exp" in claims:
+                return float(claims["exp"]) - time.time()
+        except (IndexError, ValueError, TypeError, AttributeError):
+            pass
+
+        return self.DEFAULT_TOKEN_LIFETIME
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import os
+import json
+
+# Shared by the on-disk caches (map list, map store, thumbnails): each keeps a JSON index next to its data and
+# revalidates entries with the ETag/Last-Modified they were served with.
+
+def conditionalHeaders(entry):
+    # Headers that turn a fetch of a cached entry into a conditional request, answered with 304 if it's unchanged
+    headers = {}
+    if entry.get("etag"):
+        headers['If-None-Match'] = entry["etag"]
+    if entry.get("lastModified"):
+        headers['If-Modified-Since'] = entry["lastModified"]
+    return headers
+
+def readJsonFile(path):
+    # Returns the parsed file, or None if it's missing or unreadable - a cache is just rebuilt in that case
+    try:
+        with open(path, 'r', encoding='utf-8') as jsonFile:
+            return json.load(jsonFile)
+    except (OSError, ValueError):
+        return None
+
+def writeJsonFile(path, data):
+    # Written next to the target and swapped in, so a crash mid-write never leaves a truncated file behind.
+    # A cache that can't be written is only slower next time, so failures are ignored.
+    tempPath = path + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tempPath, 'w', encoding='utf-8') as jsonFile:
+            json.dump(data, jsonFile)
+        os.replace(tempPath, path)
+    except OSError:
+        pass
@@ -21,28 +21,64 @@ from qgis.PyQt.QtGui import *
 from qgis.PyQt.QtWidgets import *
 from qgis.core import *
 
-from .resources import *
-from .scribblemaps_connector_dialog import ScribbleMapsConnectorDialog
-from .scribblemaps_publish_dialog import ScribbleMapsPublishDialog
-from .scribblemaps_webview_dialog import ScribbleMapsWebViewDialog
-from .scribblemaps_shareview_dialog import ScribbleMapsShareViewDialog
+from .scribblemaps_network import ScribbleMapsNetworkClient, ScribbleMapsNetworkError, ScribbleMapsRequestCanceled
+from .scribblemaps_auth import ScribbleMapsAuthStore, ScribbleMapsAuthError
+from .scribblemaps_tasks import ScribbleMapsTaskRunner, ScribbleMapsTaskCanceled
+from .scribblemaps_trace import ScribbleMapsTracer
+from .scribblemaps_maplist import ScribbleMapsMapListCache
+from .scribblemaps_cacheutil import conditionalHeaders
+
+# The dialogs (which build their forms from .ui files, and QtWebKit for the login page) and the conversion modules
+# (GDAL, SMJSON) are imported where they're first needed rather than here, so that loading the plugin at QGIS
+# startup costs next to nothing for sessions that never use it. benchmark/bench_startup.py keeps it that way.
 
 import os
-import uuid
-import requests
-import ssl
-import threading
 import json
+import tempfile
+import hashlib
 import linecache
+import string
 import sys
-from tempfile import NamedTemporaryFile
-from html import escape
+import threading
+from urllib.parse import quote, quote_plus, urlencode
 
 class ScribbleMapsConnector:
 
+    # How long before a cached token expires that we renew it in the background
+    TOKEN_REFRESH_LEAD = 5 * 60
+    # Longest interval a QTimer can be started with, in milliseconds
+    MAX_TIMER_INTERVAL = 2**31 - 1
+
+    # Features added to a loaded map's layers at a time, between progress updates and checks for cancel
+    LOAD_CHUNK_SIZE = 2000
+
+    # Layers converted to SMJSON by the server at the same time when publishing
+    MAX_CONCURRENT_IMPORTS = 4
+
+    # Ways the map data can be sent to /stream, best first. The original form-encoded field is always the last resort.
+    STREAM_UPLOAD_FORMATS = ('gzip', 'json', 'form')
+
+    # Responses to a stream upload that mean the server didn't accept the body format, rather than the map itself.
+    # A 5xx to anything but the form post also falls back to the next format (a server that only reads the form field
+    # is likely to fail on finding it missing), but isn't remembered, since it may just be a passing server fault.
+    STREAM_FORMAT_REJECTED = (400, 404, 405, 411, 415)
+    # Bytes quote_plus leaves as one character in a form-encoded body
+    FORM_UNESCAPED_BYTES = (string.ascii_letters + string.digits + '_.-~ ').encode('ascii')
+
+    # Project custom properties remembering what was last published from the project
+    PROJECT_SCOPE = 'ScribbleMaps'
+
+    # Responses to stream/new for a remembered map code that mean the map has gone or isn't ours to update any more
+    MAP_CODE_UNUSABLE = (403, 404, 410)
+
+    # Icons are read straight from the plugin directory through this QDir search path (e.g. 'scribblemaps:link.png'),
+    # only when something is drawn with them - no compiled resources to load with the plugin
+    ICON_SEARCH_PREFIX = 'scribblemaps'
+
     def __init__(self, iface):
         self.iface = iface
         self.plugin_dir = os.path.dirname(__file__)
+        QDir.setSearchPaths(self.ICON_SEARCH_PREFIX, [self.plugin_dir])
 
         locale = QSettings().value('locale/userLocale')[0:2]
         locale_path = os.path.join(
@@ -60,33 +96,153 @@ class ScribbleMapsConnector:
 
         self.current_token = False
         self.lastPublishedMapCode = False
-        self.pendingErrorDisplay = False
-        self.instance_uuid = False
 
-        # Set up connector dialog:
-        self.loadDlg = ScribbleMapsConnectorDialog()
+        # Every phase of auth, list, load and publish is timed into the 'Scribble Maps Trace' log tab, and into a
+        # Chrome trace file too if scribblemaps/traceFile is set:
+        self.tracer = ScribbleMapsTracer(QSettings().value('scribblemaps/traceFile', '') or None)
+
+        # Long-running work (network round trips, parsing) runs as QGIS tasks and reports back through callbacks:
+        self.tasks = ScribbleMapsTaskRunner(self.handleException)
+
+        # The token is cached (encrypted, via the QGIS auth manager) until shortly before it expires:
+        self.authStore = ScribbleMapsAuthStore()
+        self.pendingAuthCallbacks = None
+        self.backgroundAuthRequest = None
+        self.tokenRefreshTimer = QTimer()
+        self.tokenRefreshTimer.setSingleShot(True)
+        self.tokenRefreshTimer.timeout.connect(self.refreshTokenInBackground)
+
+        # Every API call goes through this one client so connections are reused between requests:
+        # scribblemaps/postTimeout (seconds) is how long an upload may wait on the server, e.g. a big map converting
+        self.api = ScribbleMapsNetworkClient(postTimeout=QSettings().value('scribblemaps/postTimeout', ScribbleMapsNetworkClient.POST_TIMEOUT, type=int))
+
+        # Where the Scribble Maps site and the auth service live - both can be pointed elsewhere through QGIS settings,
+        # e.g. at the local stand-in server the benchmarks use:
+        self.siteUrl = QSettings().value('scribblemaps/siteUrl', 'https://www.scribblemaps.com').rstrip('/')
+        self.authServiceUrl = QSettings().value('scribblemaps/authUrl', 'https://labs.strategiccode.com/scribble-maps-api/auth/')
+
+        # The last list fetched is shown straight away next time, then brought up to date in the background:
+        self.mapListCache = ScribbleMapsMapListCache(os.path.join(QgsApplication.qgisSettingsDirPath(), 'cache', 'scribblemaps_maplist.json'))
+        self.mapListRefreshing = False
+        # Map loads still downloading or filling layers - this also keeps them referenced while they run on timers
+        self.mapLoads = []
+
+        # Dialogs and on-disk stores are only created when first used - see the properties below:
+        self.lazyLock = threading.Lock()
+        self._loadDlg = None
+        self._publishDlg = None
+        self._successDialog = None
+        self._mapStore = None
+        self._publishCache = None
+
+    def _lazy(self, name, factory):
+        # Creates the named attribute on first use, whichever thread gets there first - the stores are first used
+        # from tasks
+        with self.lazyLock:
+            if getattr(self, name) is None:
+                setattr(self, name, factory())
+            return getattr(self, name)
+
+    @property
+    def loadDlg(self):
+        if self._loadDlg is None:
+            self._lazy('_loadDlg', self.createLoadDlg)
+            self.updateLinkButtons()
+        return self._loadDlg
+
+    @property
+    def publishDlg(self):
+        return self._lazy('_publishDlg', self.createPublishDlg)
+
+    @property
+    def successDialog(self):
+        return self._lazy('_successDialog', self.createSuccessDialog)
+
+    @property
+    def mapStore(self):
+        # The data of maps loaded before, so loading one again is a conditional request, and works offline:
+        def createMapStore():
+            from .scribblemaps_mapstore import ScribbleMapsMapStore
+            mapStoreMaxBytes = QSettings().value('scribblemaps/mapStoreMaxMB', 512, type=int) * 1024 * 1024
+            return ScribbleMapsMapStore(os.path.join(QgsApplication.qgisSettingsDirPath(), 'cache', 'scribblemaps_maps'), mapStoreMaxBytes)
+        return self._lazy('_mapStore', createMapStore)
+
+    @property
+    def publishCache(self):
+        # Converted layers from earlier publishes, so republishing a project only converts what changed:
+        def createPublishCache():
+            from .scribblemaps_publish_cache import ScribbleMapsPublishCache
+            return ScribbleMapsPublishCache(os.path.join(QgsApplication.qgisSettingsDirPath(), 'cache', 'scribblemaps_publish'))
+        return self._lazy('_publishCache', createPublishCache)
+
+    def createLoadDlg(self):
+        from .scribblemaps_connector_dialog import ScribbleMapsConnectorDialog
+        from .scribblemaps_maplist import ScribbleMapsMapListModel, ScribbleMapsThumbnailDelegate, ScribbleMapsLinkDelegate
+        from .scribblemaps_thumbnails import ScribbleMapsThumbnailLoader, ScribbleMapsThumbnailCache
+
+        loadDlg = ScribbleMapsConnectorDialog()
 
         # Link account is the same action as refresh map list; since refreshing map list will check auth first anyway
-        self.loadDlg.pbLink.clicked.connect(self.authAndRefreshMapList)
-        self.loadDlg.pbUnlink.clicked.connect(self.clearAuth)
-        self.loadDlg.pbRefresh.clicked.connect(self.authAndRefreshMapList)
-        self.loadDlg.pbLoadSelected.clicked.connect(self.authAndLoadSelectedMap)
-        self.loadDlg.chbRequestThumbs.toggled.connect(self.authAndRefreshMapList)
-
-        # Set up publishing dialog:
-        self.publishDlg = ScribbleMapsPublishDialog()
-        self.successDialog = ScribbleMapsShareViewDialog()
-        self.publishDlg.cmbMapType.clear()
-        self.publishDlg.cmbMapType.addItem('Hybrid')
-        self.publishDlg.cmbMapType.addItem('Road')
-        self.publishDlg.cmbMapType.addItem('Satellite')
-        self.publishDlg.cmbMapType.addItem('Terrain')
-        self.publishDlg.cmbMapType.addItem('Scribble Maps Road')
-        self.publishDlg.cmbMapType.addItem('Scribble Maps Topo')
-        self.publishDlg.cmbMapType.addItem('Scribble Maps White')        
-
-        self.publishDlg.pbClose.clicked.connect(self.closePublishDlg)
-        self.publishDlg.pbPublish.clicked.connect(self.publishMap)
+        loadDlg.pbLink.clicked.connect(self.authAndRefreshMapList)
+        loadDlg.pbUnlink.clicked.connect(self.clearAuth)
+        loadDlg.pbRefresh.clicked.connect(self.authAndRefreshMapList)
+        loadDlg.pbLoadSelected.clicked.connect(self.authAndLoadSelectedMap)
+        loadDlg.chbRequestThumbs.toggled.connect(self.toggleThumbnails)
+
+        # The map list is a model over the user's maps, painted by delegates - no widgets per row:
+        self.mapListModel = ScribbleMapsMapListModel(self.siteUrl, loadDlg)
+        tblMaps = loadDlg.tblMaps
+        tblMaps.setModel(self.mapListModel)
+        tblMaps.setItemDelegateForColumn(ScribbleMapsMapListModel.THUMBNAIL_COLUMN, ScribbleMapsThumbnailDelegate(tblMaps))
+        tblMaps.setItemDelegateForColumn(ScribbleMapsMapListModel.EDIT_COLUMN, ScribbleMapsLinkDelegate(tblMaps))
+        tblMaps.setItemDelegateForColumn(ScribbleMapsMapListModel.SHARE_COLUMN, ScribbleMapsLinkDelegate(tblMaps))
+        tblMaps.setSelectionBehavior(QAbstractItemView.SelectRows)
+        tblMaps.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        tblMaps.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        tblMaps.setWordWrap(False)
+        # Every row is the same height, so the view never has to measure rows to lay them out
+        tblMaps.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.defaultRowHeight = tblMaps.verticalHeader().defaultSectionSize()
+
+        # Thumbnails are fetched in the background for whichever rows are on screen, once the list is showing,
+        # and kept pre-scaled in the profile directory so reopening the list doesn't fetch them again:
+        self.thumbnailCache = ScribbleMapsThumbnailCache(os.path.join(QgsApplication.qgisSettingsDirPath(), 'cache', 'scribblemaps_thumbnails'))
+        self.thumbnailLoader = ScribbleMapsThumbnailLoader(self.api, tblMaps, self.thumbnailCache)
+        self.thumbnailLoader.thumbnailLoaded.connect(self.showThumbnail)
+
+        return loadDlg
+
+    def createPublishDlg(self):
+        from .scribblemaps_publish_dialog import ScribbleMapsPublishDialog
+
+        publishDlg = ScribbleMapsPublishDialog()
+        publishDlg.cmbMapType.clear()
+        publishDlg.cmbMapType.addItem('Hybrid')
+        publishDlg.cmbMapType.addItem('Road')
+        publishDlg.cmbMapType.addItem('Satellite')
+        publishDlg.cmbMapType.addItem('Terrain')
+        publishDlg.cmbMapType.addItem('Scribble Maps Road')
+        publishDlg.cmbMapType.addItem('Scribble Maps Topo')
+        publishDlg.cmbMapType.addItem('Scribble Maps White')        
+
+        publishDlg.pbClose.clicked.connect(self.closePublishDlg)
+        publishDlg.pbPublish.clicked.connect(self.publishMap)
+        return publishDlg
+
+    def createSuccessDialog(self):
+        from .scribblemaps_shareview_dialog import ScribbleMapsShareViewDialog
+
+        successDialog = ScribbleMapsShareViewDialog()
+        successDialog.pbClose.clicked.connect(self.closeShareViewDialog)
+        successDialog.pbCopyLink.clicked.connect(self.copyShareViewLink)
+        successDialog.pbVisitMap.clicked.connect(self.navigateToShareViewLink)
+        return successDialog
+
+    def updateLinkButtons(self):
+        linked = bool(self.current_token)
+        self._loadDlg.pbLink.setEnabled(not linked)
+        self._loadDlg.pbUnlink.setEnabled(linked)
+        self._loadDlg.pbRefresh.setEnabled(linked)
     
     # noinspection PyMethodMayBeStatic
     def tr(self, message):
@@ -94,7 +250,13 @@ class ScribbleMapsConnector:
         return QCoreApplication.translate('ScribbleMapsConnector', message)
 
     def handleException(self, e):
-        exc_type, exc_obj, tb = sys.exc_info()
+        # Use the exception's own traceback - errors from tasks are reported from a callback, long after the except block
+        exc_obj = e
+        tb = e.__traceback__ or sys.exc_info()[2]
+        if tb is None:
+            # Never raised, e.g. the cancel a task reports when it was stopped before it got to run
+            QgsMessageLog.logMessage('EXCEPTION: {}'.format(exc_obj), "Error Report")
+            return
         f = tb.tb_frame
         lineno = tb.tb_lineno
         filename = f.f_code.co_filename
@@ -102,6 +264,35 @@ class ScribbleMapsConnector:
         line = linecache.getline(filename, lineno, f.f_globals)
         QgsMessageLog.logMessage('EXCEPTION IN ({}, LINE {} "{}"): {}'.format(filename, lineno, line.strip(), exc_obj), "Error Report")
 
+    def createProgressDialog(self, labelText, cancelable=False):
+        progressBar = QProgressDialog(labelText, 'Cancel' if cancelable else None, 0, 0)
+        progressBar.setWindowTitle('Please Wait...')
+        progressBar.setWindowModality(Qt.WindowModal)
+        progressBar.setAutoClose(False)
+        progressBar.setMinimumDuration(100)
+        progressBar.setWindowFlags(progressBar.windowFlags() | Qt.WindowStaysOnTopHint)
+        progressBar.show()
+        progressBar.raise_()
+        progressBar.activateWindow()
+        return progressBar
+
+    def taskFailed(self, progressBar, e):
+        if progressBar:
+            progressBar.close()
+        if isinstance(e, ScribbleMapsTaskCanceled):
+            # Stopped on purpose (the plugin unloading, or the user canceling) - nothing went wrong
+            return
+        self.handleException(e)
+
+        if isinstance(e, ScribbleMapsAuthError):
+            # The server no longer accepts our cached token - forget it so the next attempt checks auth properly
+            self.authStore.dropToken()
+            QMessageBox.information(None, "Session Expired", "Your Scribble Maps session has expired. Please try again.", QMessageBox.Ok)
+
+    def checkTokenAccepted(self, response):
+        if response.status_code == 401:
+            raise ScribbleMapsAuthError('Token rejected by ' + response.url)
+
     def add_action(self, icon_path, text, callback, enabled_flag=True, add_to_menu=True, add_to_toolbar=True, status_tip=None, whats_this=None, parent=None):
         icon = QIcon(icon_path)
         action = QAction(icon, text, parent)
@@ -127,387 +318,796 @@ class ScribbleMapsConnector:
         return action
 
     def initGui(self):
-        self.add_action(':/plugins/scribblemaps_connector/icon_download.png', text=self.tr(u'Load Data from Scribble Maps'), callback=self.showLoadDlg, parent=self.iface.mainWindow())
-        self.add_action(':/plugins/scribblemaps_connector/icon_upload.png', text=self.tr(u'Publish to Scribble Maps'), callback=self.showPublishDlg, parent=self.iface.mainWindow())
+        self.add_action(self.ICON_SEARCH_PREFIX + ':icon_download.png', text=self.tr(u'Load Data from Scribble Maps'), callback=self.showLoadDlg, parent=self.iface.mainWindow())
+        self.add_action(self.ICON_SEARCH_PREFIX + ':icon_upload.png', text=self.tr(u'Publish to Scribble Maps'), callback=self.showPublishDlg, parent=self.iface.mainWindow())
 
     def unload(self):
+        for batch in list(self.mapLoads):
+            self._cancelMapLoad(batch)
+        self.tasks.cancelAll()
+        self.tokenRefreshTimer.stop()
+        if self._loadDlg is not None:
+            self.thumbnailLoader.close()
+            self.thumbnailCache.save()
+
         for action in self.actions:
             self.iface.removePluginWebMenu(
                 self.tr(u'&Scribble Maps Connector'),
                 action)
             self.iface.removeToolBarIcon(action)
 
-    def checkAuth(self, authOKCallback):
+    def checkAuth(self, authOKCallback, offlineCallback=None):
+        # offlineCallback, if given, is called instead of reporting an error when the auth server can't be reached,
+        # for whatever can still be done from the map list and maps stored on this computer
         try:
-            progressBar = QProgressDialog('Checking authentication...', None, 0, 100)
-            progressBar.setWindowTitle('Please Wait...')
-            progressBar.setWindowModality(Qt.WindowModal)
-            progressBar.setAutoClose(False)
-            progressBar.setMinimumDuration(100)
-            progressBar.setWindowFlags(progressBar.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-            progressBar.show()
-            progressBar.raise_()
-            progressBar.activateWindow()
-            progressBar.setValue(0)
-            progressBar.setMaximum(100)
-
-            thread = threading.Thread(target = self._checkAuthInternal)
-            thread.start()
-            while thread.is_alive():
-                QApplication.processEvents()
-                thread.join(0.2)
-                progressBar.setValue((progressBar.value() + 1 % 100))
-
-            progressBar.close()
+            # A token we checked recently and that isn't close to expiring can be used straight away:
+            token = self.authStore.validToken()
+            if token:
+                self.tracer.span('checkAuth', root=True, cachedToken=True).finish()
+                self.authSucceeded(token)
+                authOKCallback()
+                return
 
-            if ("validToken" in self.lastThreadResponse or "redirectTo" in self.lastThreadResponse):
-                if (self.lastThreadResponse["validToken"]):
-                    self.current_token = self.lastThreadResponse["token"]
-                    self.loadDlg.pbLink.setEnabled(False)
-                    self.loadDlg.pbUnlink.setEnabled(True)
-                    self.loadDlg.pbRefresh.setEnabled(True)
+            # If a check is already running, just wait for its result rather than starting another one:
+            if self.pendingAuthCallbacks is not None:
+                self.pendingAuthCallbacks.append((authOKCallback, offlineCallback))
+                return
+            self.pendingAuthCallbacks = [(authOKCallback, offlineCallback)]
 
-                    authOKCallback()
-                else:
-                    connectDlg = ScribbleMapsWebViewDialog()
-                    connectDlg.setPage(self.lastThreadResponse["redirectTo"])
-                    dialogResult = connectDlg.exec_()
-                    if (dialogResult == 1):
-                        self.checkAuth(authOKCallback)
-            else:
-                QMessageBox.information(None, "Unable to Load Data", "We were unable to check your authentication! Please make sure you have an active internet connection.", QMessageBox.Ok)
+            span = self.tracer.span('checkAuth', root=True, cachedToken=False)
+            progressBar = self.createProgressDialog('Checking authentication...')
+            self.tasks.run('Checking Scribble Maps authentication', self._checkAuthInternal, self.getAuthUrl(),
+                onFinished=lambda result: self._authCheckFinished(progressBar, span, result),
+                onError=lambda e: self._authCheckFailed(progressBar, span, e))
         
         except Exception as e:
+            self.pendingAuthCallbacks = None
             self.handleException(e)
 
-    def _checkAuthInternal(self):
-        url = 'https://labs.strategiccode.com/scribble-maps-api/auth/' + self.getInstanceId()
-        # Most people won't have run Python/Install Certificates.command on mac... may be an issue on other platforms?
+    def _checkAuthInternal(self, task, authUrl):
+        # Certificates are checked against the QGIS CA store, so there's no need to depend on Python's certificate setup
+        with self.tracer.span('auth request') as span:
+            result = self.api.get(authUrl, canceled=task.isCanceled)
+            span.set(status=result.status_code, bytes=len(result.content))
+        return result.json()
+
+    def _authCheckFinished(self, progressBar, span, result):
+        span.finish(validToken=bool(result.get("validToken")))
+        progressBar.close()
+        callbacks = self.pendingAuthCallbacks
+        self.pendingAuthCallbacks = None
+
+        if ("validToken" in result or "redirectTo" in result):
+            if (result["validToken"]):
+                self.authStore.setToken(result)
+                self.authSucceeded(result["token"])
+
+                for (callback, offlineCallback) in callbacks:
+                    callback()
+            else:
+                from .scribblemaps_webview_dialog import ScribbleMapsWebViewDialog
+                connectDlg = ScribbleMapsWebViewDialog()
+                connectDlg.setPage(result["redirectTo"])
+                dialogResult = connectDlg.exec_()
+                if (dialogResult == 1):
+                    for (callback, offlineCallback) in callbacks:
+                        self.checkAuth(callback, offlineCallback)
+        else:
+            QMessageBox.information(None, "Unable to Load Data", "We were unable to check your authentication! Please make sure you have an active internet connection.", QMessageBox.Ok)
+
+    def _authCheckFailed(self, progressBar, span, e):
+        progressBar.close()
+        callbacks = self.pendingAuthCallbacks
+        self.pendingAuthCallbacks = None
+        if isinstance(e, ScribbleMapsTaskCanceled):
+            span.finish(canceled=True)
+            return
+        span.finish(error=str(e))
+        self.handleException(e)
+
+        # Offline - carry on with what's stored locally, where the action allows it
+        offlineCallbacks = [offlineCallback for (callback, offlineCallback) in callbacks or [] if offlineCallback]
+        if isinstance(e, ScribbleMapsNetworkError) and offlineCallbacks:
+            for offlineCallback in offlineCallbacks:
+                offlineCallback()
+            return
+        QMessageBox.information(None, "Unable to Load Data", "We were unable to check your authentication! Please make sure you have an active internet connection.", QMessageBox.Ok)
+
+    def authSucceeded(self, token):
+        self.current_token = token
+        if self._loadDlg is not None:
+            self.updateLinkButtons()
+
+        self.scheduleTokenRefresh()
+
+    def scheduleTokenRefresh(self):
+        # Renew the token quietly a little before it runs out, so the next action doesn't have to wait on the auth server
+        if not self.current_token:
+            return
+        refreshIn = self.authStore.secondsUntilExpiry() - self.TOKEN_REFRESH_LEAD
+        # QTimer takes a C int of milliseconds (about 24.8 days at most); a longer-lived token just gets checked sooner
+        self.tokenRefreshTimer.start(int(min(max(refreshIn, self.authStore.EXPIRY_MARGIN) * 1000, self.MAX_TIMER_INTERVAL)))
+
+    def pluginInUse(self):
+        return any(dialog is not None and dialog.isVisible() for dialog in (self._loadDlg, self._publishDlg)) or bool(self.tasks.tasks)
+
+    def refreshTokenInBackground(self):
+        if self.pendingAuthCallbacks is not None or self.backgroundAuthRequest is not None:
+            return
+        # Nobody's using the plugin - leave the token to run out rather than renewing it all session long. Opening
+        # either dialog schedules the renewal again, and an expired token just means a full check next time.
+        if not self.pluginInUse():
+            return
+        self.backgroundAuthRequest = self.api.requestAsync('GET', self.getAuthUrl(), self._backgroundAuthFinished)
+
+    def _backgroundAuthFinished(self, response):
+        # Aborted by clearAuth (or otherwise superseded) - the account it was renewing is gone
+        if self.backgroundAuthRequest is None or self.backgroundAuthRequest.response is not response:
+            return
+        self.backgroundAuthRequest = None
         try:
-            _create_unverified_https_context = ssl._create_unverified_context
-        except AttributeError:
-            pass
+            result = response.json() if response.status_code == 200 else {}
+        except ValueError:
+            result = {}
+
+        if result.get("validToken"):
+            self.authStore.setToken(result)
+            self.authSucceeded(result["token"])
+        elif "validToken" in result:
+            # The server wants the user to log in again - let the next action go through the full check
+            self.authStore.dropToken()
         else:
-            ssl._create_default_https_context = _create_unverified_https_context
-        result = requests.get(url)
-        self.lastThreadResponse = result.json()
-    
+            # Couldn't reach the server; the token we have is still good until it expires, so try again later
+            self.tokenRefreshTimer.start(self.authStore.EXPIRY_MARGIN * 1000)
+
+    def getAuthUrl(self):
+        return self.authServiceUrl + self.getInstanceId()
+
     def getInstanceId(self):
-        if self.instance_uuid:
-            return self.instance_uuid
-
-        authManager = QgsApplication.authManager()
-
-        # See if we already have an instance ID we can use to pass to our auth endpoint:
-        if "Scribble Maps Instance ID" in authManager.availableAuthMethodConfigs():
-            auConfig = QgsAuthMethodConfig()
-            authManager.loadAuthenticationConfig('Scribble Maps Instance ID', auConfig, True)
-            configMap = auConfig.configMap()
-            if "sessionid" in configMap:
-                self.instance_uuid = configMap["sessionid"]
-                return self.instance_uuid
-        
-        # Not set or something went wrong retrieving it - make us a new one, which will make them log in with Scribble Maps again
-        self.instance_uuid = str(uuid.uuid4())
-            
-        # Store it securely for future use - but first, see if we need to remove an old one first:
-        if "Scribble Maps Instance ID" in authManager.availableAuthMethodConfigs():
-            authManager.removeAuthenticationConfig('Scribble Maps Instance ID')
-        
-        cfg = QgsAuthMethodConfig()
-        cfg.setId('Scribble Maps Instance ID')
-        cfg.setName('Scribble Maps Instance ID')
-        cfg.setMethod('ExternalConnector')
-        cfg.setConfig('sessionid', str(uuid.uuid4()))
-        authManager.storeAuthenticationConfig(cfg)
+        return self.authStore.instanceId()
 
     def clearAuth(self):
         self.current_token = False
-        
-        self.instance_uuid = False
-        authManager = QgsApplication.authManager()
-        if "Scribble Maps Instance ID" in authManager.availableAuthMethodConfigs():
-            authManager.removeAuthenticationConfig('Scribble Maps Instance ID')
-        
-        self.loadDlg.pbLink.setEnabled(True)
-        self.loadDlg.pbUnlink.setEnabled(False)
-        self.loadDlg.pbRefresh.setEnabled(False)
+        self.tokenRefreshTimer.stop()
+        if self.backgroundAuthRequest is not None:
+            pending = self.backgroundAuthRequest
+            self.backgroundAuthRequest = None
+            self.api.abort(pending)
+        self.authStore.clear()
+
+        # The cached list belongs to the account that was just unlinked
+        self.mapListCache.clear()
+        if self._loadDlg is None:
+            return
+
+        self.updateLinkButtons()
         self.loadDlg.tblMaps.setEnabled(False)
         self.loadDlg.pbLoadSelected.setEnabled(False)
+        self.thumbnailLoader.clear()
+        self.mapListModel.setMaps([])
 
     def authAndRefreshMapList(self):
-        # Before any operation, we'll re-check our authentication in case the server refreshed our token for us
-        self.checkAuth(self.refreshMapList)
+        # Before any operation, make sure we have a current token - checkAuth reuses a cached one if it's still good
+        self.checkAuth(self.refreshMapList, self.showStoredMapList)
 
     def refreshMapList(self):
         try:
             if (not self.loadDlg.pbRefresh.isEnabled):
                 return
 
-            progressBar = QProgressDialog('Loading map list...', None, 0, 100)
-            progressBar.setWindowTitle('Please Wait...')
-            progressBar.setWindowModality(Qt.WindowModal)
-            progressBar.setAutoClose(False)
-            progressBar.setMinimumDuration(100)
-            progressBar.setWindowFlags(progressBar.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-            progressBar.show()
-            progressBar.raise_()
-            progressBar.activateWindow()
-            progressBar.setValue(0)
-            progressBar.setMaximum(100)
-
-            thread = threading.Thread(target = self._refreshMapListInternal)
-            thread.start()
-            while thread.is_alive():
-                QApplication.processEvents()
-                thread.join(0.2)
-                progressBar.setValue((progressBar.value() + 1 % 100))
-
-            result = self.lastThreadResponse
-
-            if ("mapList" in result):
-                self.loadDlg.tblMaps.setColumnCount(7)
-                self.loadDlg.tblMaps.setHorizontalHeaderLabels(['Map Code', 'Title', 'Description', 'Created', 'Thumbnail', 'Edit', 'Share'])
-                self.loadDlg.tblMaps.setRowCount(len(result["mapList"]))
-
-                for i, map in enumerate(result["mapList"]):
-                    parsedCreateDate = QDateTime.fromString(map["created"], Qt.ISODate)
-
-                    thumbLabel = QLabel()
-                    if ("thumbBytes" in map):
-                        thumb = QPixmap()
-                        thumb.loadFromData(map["thumbBytes"])
-                        thumbLabel.setPixmap(thumb.scaled(100, 100))
-
-                    self.loadDlg.tblMaps.setItem(i, 0, QTableWidgetItem(map["mapCode"]))
-                    self.loadDlg.tblMaps.setItem(i, 1, QTableWidgetItem(map["title"]))
-                    self.loadDlg.tblMaps.setItem(i, 2, QTableWidgetItem(map["description"]))
-                    self.loadDlg.tblMaps.setItem(i, 3, QTableWidgetItem(parsedCreateDate.toString('ddd MMMM d yyyy h:m ap')))
-                    self.loadDlg.tblMaps.setCellWidget(i, 4, thumbLabel)
-
-                    editLabel = QLabel()
-                    editLabel.setText("<a href='https://www.scribblemaps.com/create/#id=" + map["mapCode"] + "'>Edit on Scribble Maps</a>")
-                    editLabel.setOpenExternalLinks(True)
-                    self.loadDlg.tblMaps.setCellWidget(i, 5, editLabel)
-
-                    if (map["shareUrl"][0] == '/'):
-                        map["shareUrl"] = 'https:' + map["shareUrl"]
-                    shareLabel = QLabel()
-                    shareLabel.setText("<a href='" + map["shareUrl"] + "'>Share Link</a>")
-                    shareLabel.setOpenExternalLinks(True)
-                    self.loadDlg.tblMaps.setCellWidget(i, 6, shareLabel)
-                    
-                self.loadDlg.tblMaps.resizeColumnsToContents()
-                self.loadDlg.tblMaps.resizeRowsToContents()
-                self.loadDlg.tblMaps.setSelectionBehavior(QAbstractItemView.SelectRows)
-
-                if (len(result["mapList"]) > 0):
-                    self.loadDlg.tblMaps.setCurrentCell(0, 0)
-                    self.loadDlg.pbLoadSelected.setEnabled(True)
+            # One refresh at a time - clicking Refresh again while one is running has nothing more to fetch
+            if self.mapListRefreshing:
+                return
+
+            account = self.getInstanceId()
+            requestThumbs = self.loadDlg.chbRequestThumbs.isChecked()
+
+            span = self.tracer.span('refreshMapList', root=True)
+
+            # Show the list we had last time right away, if the table's empty, then check it's still current:
+            with self.tracer.span('load cached map list') as cacheSpan:
+                cached = self.mapListCache.load(account)
+                cacheSpan.set(rows=len(cached["mapList"]) if cached else 0)
+            if cached and not self.mapListModel.rowCount():
+                with self.tracer.span('show cached map list', rows=len(cached["mapList"])):
+                    self.showMapList(cached["mapList"], requestThumbs)
+
+            # Only block on the fetch when there's nothing to look at in the meantime
+            progressBar = None
+            validators = {}
+            if self.mapListModel.rowCount():
+                if cached:
+                    validators = conditionalHeaders(cached)
             else:
-                QMessageBox.information(None, "Unable to Load List", "Unable to load the map list! There was no data returned.", QMessageBox.Ok)
+                progressBar = self.createProgressDialog('Loading map list...')
 
-            progressBar.close()
+            self.mapListRefreshing = True
+            self.tasks.run('Loading Scribble Maps map list', self._refreshMapListInternal, self.current_token, account, validators,
+                onFinished=lambda result: self._mapListLoaded(progressBar, span, result, requestThumbs),
+                onError=lambda e: self._mapListFailed(progressBar, span, e))
         
         except Exception as e:
+            self.mapListRefreshing = False
             self.handleException(e)
 
-    def _refreshMapListInternal(self):
-        result = requests.get('https://www.scribblemaps.com/api/user/maps/', headers={ 'Authorization': 'Bearer ' + self.current_token})
-        self.lastThreadResponse = result.json()
+    def showSavedMapList(self):
+        # Puts up the list saved for the linked account last time, if the table's empty. Returns whether there's a
+        # list showing. Needs no token, so it also works once the token has run out and the server can't be reached.
+        if self.mapListModel.rowCount():
+            return True
+        if not self.authStore.isLinked():
+            return False
+        cached = self.mapListCache.load(self.getInstanceId())
+        if not cached:
+            return False
+        with self.tracer.span('show cached map list', rows=len(cached["mapList"])):
+            self.showMapList(cached["mapList"], self.loadDlg.chbRequestThumbs.isChecked())
+        return True
+
+    def showStoredMapList(self):
+        # Offline instead of refreshing the list: maps in the map store can still be loaded from the saved list
+        if self.showSavedMapList():
+            QgsMessageLog.logMessage('Unable to reach Scribble Maps, showing the map list saved last time', 'Scribble Maps')
+        else:
+            QMessageBox.information(None, "Unable to Load Data", "We were unable to check your authentication! Please make sure you have an active internet connection.", QMessageBox.Ok)
+
+    def _mapListLoaded(self, progressBar, span, result, requestThumbs):
+        self.mapListRefreshing = False
+        if progressBar:
+            progressBar.close()
+
+        if result["notModified"]:
+            span.finish(notModified=True)
+            QgsMessageLog.logMessage('Map list is up to date', 'Scribble Maps', Qgis.Info)
+            return
+
+        if (result["mapList"] is not None):
+            with self.tracer.span('update map list view', rows=len(result["mapList"])):
+                if self.mapListModel.rowCount():
+                    # Apply just what changed, so the table doesn't jump back to the top under the user. The thumbnail
+                    # loader works by row, so it's pointed at the new URLs whenever any row's URL changed.
+                    if self.mapListModel.updateMaps(result["mapList"]) and requestThumbs:
+                        self.thumbnailLoader.setUrls([entry.thumbUrl for entry in self.mapListModel.entries])
+                    self.loadDlg.pbLoadSelected.setEnabled(self.mapListModel.rowCount() > 0)
+                else:
+                    self.showMapList(result["mapList"], requestThumbs)
+            span.finish(rows=len(result["mapList"]))
+        else:
+            span.finish(error='no data')
+            QMessageBox.information(None, "Unable to Load List", "Unable to load the map list! There was no data returned.", QMessageBox.Ok)
+
+    def _mapListFailed(self, progressBar, span, e):
+        if isinstance(e, ScribbleMapsTaskCanceled):
+            span.finish(canceled=True)
+        else:
+            span.finish(error=str(e))
+        self.mapListRefreshing = False
+        self.taskFailed(progressBar, e)
+        # A background refresh of a list that's already showing fails quietly - the list is just left as it is
+        if progressBar and isinstance(e, ScribbleMapsNetworkError):
+            QMessageBox.information(None, "Unable to Load List", "We were unable to load your map list! Please make sure you have an active internet connection. The error was: " + str(e), QMessageBox.Ok)
+
+    def showMapList(self, mapList, requestThumbs):
+        self.thumbnailLoader.clear()
+        self.mapListModel.setMaps(mapList)
+        self.setThumbnailRows(requestThumbs)
+        self.loadDlg.tblMaps.resizeColumnsToContents()
+
+        if (self.mapListModel.rowCount() > 0):
+            self.loadDlg.tblMaps.selectRow(0)
+            self.loadDlg.pbLoadSelected.setEnabled(True)
+
+        if (requestThumbs):
+            self.thumbnailLoader.setUrls([entry.thumbUrl for entry in self.mapListModel.entries])
+
+    def _refreshMapListInternal(self, task, token, account, validators):
+        # Returns {'notModified': True} if the list we're showing is still current, otherwise the new list (None if
+        # the server sent none), which is also saved for next time
+        headers = { 'Authorization': 'Bearer ' + token}
+        headers.update(validators)
+        with self.tracer.span('GET /api/user/maps/', conditional=bool(validators)) as span:
+            result = self.api.get(self.siteUrl + '/api/user/maps/', headers=headers, canceled=task.isCanceled)
+            span.set(status=result.status_code, bytes=len(result.content))
+        self.checkTokenAccepted(result)
+
+        if result.status_code == 304:
+            return {'notModified': True, 'mapList': None}
+
+        with self.tracer.span('parse map list'):
+            mapList = result.json().get("mapList")
+        if mapList is None:
+            return {'notModified': False, 'mapList': None}
+
+        for map in mapList:
+            if (map["thumbUrl"] and map["thumbUrl"][0] == '/'):
+                map["thumbUrl"] = 'https:' + map["thumbUrl"]
+            if (map["shareUrl"] and map["shareUrl"][0] == '/'):
+                map["shareUrl"] = 'https:' + map["shareUrl"]
+
+        with self.tracer.span('save map list cache', rows=len(mapList)):
+            self.mapListCache.save(account, mapList, result.header('ETag'), result.header('Last-Modified'))
+        return {'notModified': False, 'mapList': mapList}
+
+    def toggleThumbnails(self, requestThumbs):
+        # Nothing listed yet - fetching the list will pick up the new setting
+        if not self.mapListModel.rowCount():
+            self.authAndRefreshMapList()
+            return
+
+        self.setThumbnailRows(requestThumbs)
+        self.loadDlg.tblMaps.resizeColumnToContents(self.mapListModel.THUMBNAIL_COLUMN)
 
-        if (self.loadDlg.chbRequestThumbs.isChecked()):
-            for i, map in enumerate(self.lastThreadResponse["mapList"]):
-                if (map["thumbUrl"][0] == '/'):
-                    map["thumbUrl"] = 'https:' + map["thumbUrl"]
-                map["thumbBytes"] = requests.get(map["thumbUrl"]).content
+        if requestThumbs:
+            self.thumbnailLoader.setUrls([entry.thumbUrl for entry in self.mapListModel.entries])
+        else:
+            self.thumbnailLoader.clear()
+
+    def setThumbnailRows(self, requestThumbs):
+        # Reserve the space up front; showThumbnail fills it in once each image arrives
+        self.mapListModel.setShowThumbnails(requestThumbs)
+        rowHeight = self.mapListModel.THUMB_SIZE + 4 if requestThumbs else self.defaultRowHeight
+        self.loadDlg.tblMaps.verticalHeader().setDefaultSectionSize(rowHeight)
+
+    def showThumbnail(self, row, thumbnail):
+        # Already decoded and scaled off the GUI thread by the loader
+        self.mapListModel.setThumbnail(row, thumbnail)
 
     def authAndLoadSelectedMap(self):
-        # Before any operation, we'll re-check our authentication in case the server refreshed our token for us
-        self.checkAuth(self.loadSelectedMap)
+        # Before any operation, make sure we have a current token - checkAuth reuses a cached one if it's still good
+        self.checkAuth(self.loadSelectedMap, lambda: self.loadSelectedMap(offline=True))
 
-    def loadSelectedMap(self):
+    def loadSelectedMap(self, offline=False):
+        # Offline, there's no token: only maps already in the map store can be loaded
+        token = None if offline else self.current_token
         try:
-            self.lastSelectedMapCode = str(self.loadDlg.tblMaps.item(self.loadDlg.tblMaps.currentRow(), 0).text())
-
-            progressBar = QProgressDialog('Loading map data...', None, 0, 100)
-            progressBar.setWindowTitle('Please Wait...')
-            progressBar.setWindowModality(Qt.WindowModal)
-            progressBar.setAutoClose(False)
-            progressBar.setMinimumDuration(100)
-            progressBar.setWindowFlags(progressBar.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-            progressBar.show()
-            progressBar.raise_()
-            progressBar.activateWindow()
-            progressBar.setValue(0)
-            progressBar.setMaximum(100)
-
-            thread = threading.Thread(target = self._loadSelectedMapInternal)
-            thread.start()
-            while thread.is_alive():
-                QApplication.processEvents()
-                thread.join(0.2)
-                progressBar.setValue((progressBar.value() + 1 % 100))
-
-            if (len(self.lastLoadedMap) > 0):
-                tempKML = NamedTemporaryFile(delete=False)
-                tempKML.write(self.lastLoadedMap)
-                tempKML.flush()
-                
-                # Convert it to in-memory datasets of each type, so we can 1) delete our temp file and not reference a weird temp file, and 2) get each geometry type
-                srcLayer = QgsVectorLayer(tempKML.name, "data", "ogr")
-                
-                destPoint = QgsVectorLayer("Point?crs=epsg:4326",  'Points: ' + str(self.loadDlg.tblMaps.item(self.loadDlg.tblMaps.currentRow(), 1).text()), "memory")
-                destLine = QgsVectorLayer("LineString?crs=epsg:4326",  'Lines: ' + str(self.loadDlg.tblMaps.item(self.loadDlg.tblMaps.currentRow(), 1).text()), "memory")
-                destPoly = QgsVectorLayer("Polygon?crs=epsg:4326",  'Polygons: ' + str(self.loadDlg.tblMaps.item(self.loadDlg.tblMaps.currentRow(), 1).text()), "memory")
-
-                # Add attributes:
-                srcAtts = srcLayer.dataProvider().fields().toList()
-
-                destPointData = destPoint.dataProvider()
-                destPointData.addAttributes(srcAtts)
-                destPoint.updateFields()
-
-                destLineData = destLine.dataProvider()
-                destLineData.addAttributes(srcAtts)
-                destLine.updateFields()
-
-                destPolyData = destPoly.dataProvider()
-                destPolyData.addAttributes(srcAtts)
-                destPoly.updateFields()
-
-                # Add the features themselves:
-                for feat in srcLayer.getFeatures():
-                    if QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.Point:
-                        destPointData.addFeatures([feat])
-                    elif QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.LineString:
-                        destLineData.addFeatures([feat])
-                    elif QgsWkbTypes.flatType(feat.geometry().wkbType()) == QgsWkbTypes.Polygon:
-                        destPolyData.addFeatures([feat])
-
-                if (destPoint.featureCount() > 0):
-                    QgsProject.instance().addMapLayer(destPoint)
-                if (destLine.featureCount() > 0):
-                    QgsProject.instance().addMapLayer(destLine)
-                if (destPoly.featureCount() > 0):
-                    QgsProject.instance().addMapLayer(destPoly)
-
-                # Clean up
-                del srcLayer
-                # Close (and automatically delete) file:
-                tempKML.close() 
-                
-                try:
-                    os.unlink(tempKML.name)
-                except:
-                    pass
+            # Every selected row is loaded; fall back to the current row if the selection is somehow empty
+            rows = sorted(set(index.row() for index in self.loadDlg.tblMaps.selectionModel().selectedRows()))
+            if not rows:
+                rows = [self.loadDlg.tblMaps.currentIndex().row()]
+
+            selectedMaps = []
+            for row in rows:
+                entry = self.mapListModel.entry(row)
+                selectedMaps.append((entry.mapCode, entry.title))
+
+            progressBar = self.createProgressDialog('Downloading map data...', cancelable=True)
+            progressBar.setAutoReset(False)
+            progressBar.setMaximum(len(selectedMaps))
+
+            # Each map downloads and parses in its own task, so they all run at once. Once the last one is in, the
+            # features go into layers a chunk at a time - see _fillLayers.
+            batch = {
+                'span': self.tracer.span('loadSelectedMap', root=True, maps=len(selectedMaps)),
+                'progressBar': progressBar,
+                'remaining': len(selectedMaps),
+                'maps': [None] * len(selectedMaps),
+                'layers': [],
+                'errors': [],
+                'tasks': [],
+                'features': 0,
+                'canceled': False,
+                'finished': False
+            }
+            progressBar.canceled.connect(lambda: self._cancelMapLoad(batch))
+            self.mapLoads.append(batch)
+            for i, (mapCode, mapTitle) in enumerate(selectedMaps):
+                batch["tasks"].append(self.tasks.run('Downloading Scribble Maps map ' + mapCode, self._loadSelectedMapInternal, mapCode, mapTitle, token,
+                    onFinished=lambda mapData, i=i: self._mapDataLoaded(batch, i, mapData),
+                    onError=lambda e, mapTitle=mapTitle: self._mapDataFailed(batch, mapTitle, e)))
+
+        except Exception as e:
+            self.handleException(e)
+
+    def _mapDataLoaded(self, batch, i, mapData):
+        batch["maps"][i] = mapData
+        self._mapLoadStepDone(batch)
+
+    def _mapDataFailed(self, batch, mapTitle, e):
+        if not isinstance(e, ScribbleMapsTaskCanceled):
+            self.handleException(e)
+            batch["errors"].append((mapTitle, e))
+        self._mapLoadStepDone(batch)
+
+    def _mapLoadStepDone(self, batch):
+        batch["remaining"] -= 1
+        if batch["canceled"]:
+            if batch["remaining"] == 0:
+                self._mapLoadFinished(batch)
+            return
+
+        batch["progressBar"].setValue(batch["progressBar"].maximum() - batch["remaining"])
+        if batch["remaining"] > 0:
+            return
 
+        try:
+            # Keep the layers in the order the maps were listed
+            maps = [mapData for mapData in batch["maps"] if mapData]
+            batch["features"] = sum(self._featureCount(mapData) for mapData in maps)
+            if not batch["features"]:
+                self._mapLoadFinished(batch)
+                return
+
+            batch["progressBar"].setLabelText('Loading features...')
+            batch["progressBar"].setMaximum(batch["features"])
+            batch["progressBar"].setValue(0)
+            self._fillLayers(batch, maps)
+
+        except Exception as e:
+            self.handleException(e)
+            batch["errors"].append((', '.join(mapData["title"] for mapData in maps), e))
+            self._mapLoadFinished(batch)
+
+    def _fillLayers(self, batch, maps):
+        # By default the layers are filled in a background task and added to the project once they're complete. With
+        # scribblemaps/addLayersEarly set, empty layers go into the project straight away and are filled from the
+        # event loop instead, so the first features draw while the rest are still going in.
+        if QSettings().value('scribblemaps/addLayersEarly', False, type=bool):
+            self._fillLayersEarly(batch, maps)
+            return
+
+        total = batch["features"]
+        task = self.tasks.run('Loading Scribble Maps features', self._createLayersInternal, maps, total,
+            onFinished=lambda layers: self._layersCreated(batch, layers),
+            onError=lambda e: self._layersFailed(batch, maps, e))
+        task.progressChanged.connect(lambda percent: batch["progressBar"].setValue(int(total * percent / 100)))
+        batch["tasks"].append(task)
+
+    def _createLayersInternal(self, task, maps, total):
+        # Returns every map's memory layers, built here and handed over to the main thread ready to add to the project
+        from .scribblemaps_layers import createMemoryLayers
+
+        processed = 0
+        def progress(count):
+            nonlocal processed
+            task.checkCanceled()
+            processed += count
+            task.setProgress(100.0 * processed / total)
+
+        with self.tracer.span('create memory layers', maps=len(maps), features=total):
+            layers = []
+            for mapData in maps:
+                layers.extend(createMemoryLayers(mapData["title"], mapData["fields"], mapData["features"], mapData["multiFamilies"], self.LOAD_CHUNK_SIZE, progress))
+        for layer in layers:
+            layer.moveToThread(QgsApplication.instance().thread())
+        return layers
+
+    def _layersCreated(self, batch, layers):
+        if not batch["canceled"]:
+            batch["layers"] = layers
+            with self.tracer.span('add layers to project', layers=len(layers)):
+                QgsProject.instance().addMapLayers(layers)
                 # Make sure it's visible:
                 self.iface.mapCanvas().zoomToFullExtent()
+        self._mapLoadFinished(batch)
 
-                # TODO: Longer term - pull SMJSON instead and convert directly, possibly including published styles, so the map looks exactly the same
-            else:
-                QMessageBox.information(None, "Unable to Load", "Unable to load the map! There was no data returned.", QMessageBox.Ok)
+    def _layersFailed(self, batch, maps, e):
+        if not isinstance(e, ScribbleMapsTaskCanceled):
+            self.handleException(e)
+            batch["errors"].append((', '.join(mapData["title"] for mapData in maps), e))
+        self._mapLoadFinished(batch)
 
-            progressBar.close()
+    def _fillLayersEarly(self, batch, maps):
+        from .scribblemaps_layers import emptyMemoryLayers, featureChunks
+
+        pairs = [pair for mapData in maps for pair in emptyMemoryLayers(mapData["title"], mapData["fields"], mapData["features"], mapData["multiFamilies"])]
+        batch["layers"] = [layer for (layer, features) in pairs]
+        QgsProject.instance().addMapLayers(batch["layers"])
+
+        batch["chunks"] = ((layer, chunk) for (layer, features) in pairs for chunk in featureChunks(features, self.LOAD_CHUNK_SIZE))
+        batch["inserted"] = 0
+        batch["insertSpan"] = self.tracer.span('fill project layers', layers=len(pairs), features=batch["features"])
+        batch["insertTimer"] = QTimer()
+        batch["insertTimer"].timeout.connect(lambda: self._insertNextChunk(batch))
+        batch["insertTimer"].start(0)
+
+    def _insertNextChunk(self, batch):
+        layer = None
+        try:
+            (layer, chunk) = next(batch["chunks"], (None, None))
+            if layer is None:
+                batch["insertTimer"].stop()
+                batch["insertSpan"].finish()
+                self.iface.mapCanvas().zoomToFullExtent()
+                self._mapLoadFinished(batch)
+                return
+
+            layer.dataProvider().addFeatures(chunk)
+            layer.updateExtents()
+            layer.triggerRepaint()
+            if not batch["inserted"]:
+                # Show the first features as soon as they're in
+                self.iface.mapCanvas().zoomToFullExtent()
+            batch["inserted"] += len(chunk)
+            batch["progressBar"].setValue(batch["inserted"])
 
         except Exception as e:
+            batch["insertTimer"].stop()
+            batch["insertSpan"].finish(error=str(e))
             self.handleException(e)
+            batch["errors"].append((layer.name() if layer else '', e))
+            self._mapLoadFinished(batch)
+
+    def _cancelMapLoad(self, batch):
+        # Closing the progress dialog when the load finishes also signals canceled
+        if batch["finished"] or batch["canceled"]:
+            return
+
+        batch["canceled"] = True
+        for task in batch["tasks"]:
+            self.tasks.cancel(task)
+
+        if batch.get("insertTimer"):
+            # Filling layers already in the project - stop, and take them back out
+            batch["insertTimer"].stop()
+            batch["insertSpan"].finish(canceled=True)
+            QgsProject.instance().removeMapLayers([layer.id() for layer in batch["layers"]])
+            batch["layers"] = []
+            self._mapLoadFinished(batch)
+        # Otherwise the tasks' callbacks finish the load once they've stopped
+
+    def _mapLoadFinished(self, batch):
+        if batch["finished"]:
+            return
+        batch["finished"] = True
+        self.mapLoads.remove(batch)
+        batch["progressBar"].close()
 
-    def _loadSelectedMapInternal(self):
-        mapUrl = 'https://www.scribblemaps.com/api/maps/' + self.lastSelectedMapCode + '/kml'
-        QgsMessageLog.logMessage('Fetching map from URL: ' + mapUrl, 'Scribble Maps')
-        mapResult = requests.get(mapUrl, headers={ 'Authorization': 'Bearer ' + self.current_token})
-        QgsMessageLog.logMessage('Results: ' +  str(mapResult.status_code) + ' - ' + escape(mapResult.text), 'Scribble Maps')
-        self.lastLoadedMap = mapResult.content
+        try:
+            allLayers = batch["layers"]
+            batch["span"].finish(layers=len(allLayers), features=batch["features"], errors=len(batch["errors"]), canceled=batch["canceled"])
+            if batch["canceled"]:
+                return
+
+            if any(isinstance(e, ScribbleMapsAuthError) for (mapTitle, e) in batch["errors"]):
+                # The server no longer accepts our cached token - forget it so the next attempt checks auth properly
+                self.authStore.dropToken()
+                QMessageBox.information(None, "Session Expired", "Your Scribble Maps session has expired. Please try again.", QMessageBox.Ok)
+            elif batch["errors"]:
+                QMessageBox.information(None, "Unable to Load", "Unable to load: " + ', '.join(mapTitle for (mapTitle, e) in batch["errors"]) + ". Please check the 'Error Report' tab for details.", QMessageBox.Ok)
+            elif not allLayers:
+                QMessageBox.information(None, "Unable to Load", "Unable to load the map! There was no data returned.", QMessageBox.Ok)
+
+        except Exception as e:
+            self.handleException(e)
+
+    def _featureCount(self, mapData):
+        return sum(len(featureList) for featureList in mapData["features"].values())
+
+    def _loadSelectedMapInternal(self, task, mapCode, mapTitle, token):
+        # Downloads and parses the map; its layers are filled once every selected map is in
+        with self.tracer.span('load map', mapCode=mapCode):
+            mapData = self._fetchMapFeatures(task, mapCode, token)
+            mapData["title"] = mapTitle
+            return mapData
+
+    def _fetchMapFeatures(self, task, mapCode, token):
+        from .scribblemaps_smjson import smjsonFields, smjsonToFeatures
+        from .scribblemaps_layers import partitionFeatures
+
+        entry = self._fetchMapData(mapCode, token, task.isCanceled)
+        task.checkCanceled()
+        mapPath = self.mapStore.path(entry)
+
+        if entry["format"] == 'smjson':
+            # SMJSON converts straight to features with no OGR in between
+            with self.tracer.span('convert SMJSON', mapCode=mapCode, bytes=entry["size"]) as span:
+                with open(mapPath, 'r', encoding='utf-8') as mapFile:
+                    document = json.load(mapFile)
+                fields = smjsonFields()
+                skipped = []
+                features = smjsonToFeatures(document, fields, skipped)
+                span.set(features=sum(len(featureList) for featureList in features.values()), skipped=len(skipped))
+            return {'fields': fields, 'features': features, 'multiFamilies': set()}
+
+        # Read it back through OGR and sort the features by geometry type in one pass, so each memory layer
+        # can be filled with a single addFeatures call afterwards:
+        with self.tracer.span('read KML', mapCode=mapCode, bytes=entry["size"]) as span:
+            srcLayer = QgsVectorLayer(mapPath, "data", "ogr")
+            fields = srcLayer.fields()
+            (features, multiFamilies) = partitionFeatures(srcLayer.getFeatures())
+            del srcLayer
+            span.set(features=sum(len(featureList) for featureList in features.values()))
+
+        return {'fields': fields, 'features': features, 'multiFamilies': multiFamilies}
+
+    def _fetchMapData(self, mapCode, token, canceled=None):
+        # Returns the map store entry for the map, downloading the data only if the stored copy is missing or the
+        # server says it has changed. SMJSON is preferred, since it converts straight to features; KML is the
+        # fallback. If the server can't be reached, or fails, a stored copy is used as it is. Once canceled returns
+        # True the download is aborted, and what had arrived is thrown away rather than stored. With no token (offline)
+        # only the stored copy is used.
+        stored = self.mapStore.lookup(mapCode)
+        if token is None:
+            if stored:
+                QgsMessageLog.logMessage('Unable to reach Scribble Maps, loading the stored copy of map ' + mapCode, 'Scribble Maps')
+                return stored
+            raise ScribbleMapsNetworkError('Map ' + mapCode + ' has not been downloaded before, and Scribble Maps can\'t be reached to download it')
+        formats = ['smjson', 'kml']
+        if stored and stored["format"] == 'kml':
+            # This map only came as KML last time - no point asking for SMJSON again
+            formats = ['kml']
+
+        statusCode = None
+        for format in formats:
+            headers = { 'Authorization': 'Bearer ' + token}
+            if stored and stored["format"] == format:
+                headers.update(conditionalHeaders(stored))
+
+            mapUrl = self.siteUrl + '/api/maps/' + mapCode + '/' + format
+            QgsMessageLog.logMessage('Fetching map from URL: ' + mapUrl, 'Scribble Maps')
+            downloadPath = self.mapStore.downloadPath(mapCode)
+            try:
+                # The map goes straight to disk as it downloads, so memory use stays flat however large the map is
+                with self.tracer.span('download map', mapCode=mapCode, format=format, conditional='If-None-Match' in headers or 'If-Modified-Since' in headers) as span:
+                    mapResult = self.api.download(mapUrl, downloadPath, headers=headers, canceled=canceled)
+                    span.set(status=mapResult.status_code, bytes=mapResult.bytesReceived)
+                QgsMessageLog.logMessage('Results: {} - {} bytes'.format(mapResult.status_code, mapResult.bytesReceived), 'Scribble Maps')
+                self.checkTokenAccepted(mapResult)
+
+                if mapResult.status_code == 304 and stored:
+                    self.mapStore.revalidated(mapCode)
+                    return stored
+                if mapResult.status_code == 200:
+                    return self.mapStore.commit(mapCode, format, downloadPath, mapResult.header('ETag'), mapResult.header('Last-Modified'))
+                statusCode = mapResult.status_code
+            except ScribbleMapsNetworkError as e:
+                if not stored:
+                    raise
+                QgsMessageLog.logMessage('Unable to reach Scribble Maps ({}), loading the stored copy of map {}'.format(e, mapCode), 'Scribble Maps')
+                return stored
+            finally:
+                try:
+                    os.unlink(downloadPath)
+                except OSError:
+                    pass
+
+            QgsMessageLog.logMessage('{} not available ({})'.format(format.upper(), statusCode), 'Scribble Maps')
+
+        if stored:
+            QgsMessageLog.logMessage('Loading the stored copy of map ' + mapCode, 'Scribble Maps')
+            return stored
+        raise Exception('Unable to download map ' + mapCode + ' (' + str(statusCode) + ')')
 
     def showLoadDlg(self):
-        self.loadDlg.show()
-        self.loadDlg.raise_()
-        self.loadDlg.activateWindow()
+        loadDlg = self.loadDlg
+
+        # Already signed in - put the list up from the cache and bring it up to date behind the scenes. Once the token
+        # has run out, the saved list is still shown straight away (the maps stored from it load even offline), and
+        # Link brings it up to date.
+        if not self.mapListModel.rowCount():
+            if self.authStore.validToken():
+                self.authAndRefreshMapList()
+            else:
+                self.showSavedMapList()
+
+        loadDlg.show()
+        loadDlg.raise_()
+        loadDlg.activateWindow()
+        self.scheduleTokenRefresh()
 
     def showPublishDlg(self):
         self.publishDlg.lstLayers.clear()
+        # Only vector layers can be published - rasters, meshes and the like have no features to convert or export
         for layer in QgsProject.instance().mapLayers().values():
+            if layer.type() != QgsMapLayer.VectorLayer:
+                continue
             newItem = QListWidgetItem(layer.name(), self.publishDlg.lstLayers)
+            newItem.setData(Qt.UserRole, layer.id())
             newItem.setCheckState(Qt.Checked)
             self.publishDlg.lstLayers.addItem(newItem)
 
         if (self.publishDlg.lstLayers.count() == 0):
-            QMessageBox.information(None, "No Layers", "There are no layers in your map yet! Please add some data first before publishing.")
+            QMessageBox.information(None, "No Layers", "There are no vector layers in your map yet! Please add some data first before publishing.")
             return
 
+        # Offer to update the map this project was last published to, rather than making a new one each time:
+        (publishedMapCode, found) = QgsProject.instance().readEntry(self.PROJECT_SCOPE, 'mapCode', '')
+        self.publishDlg.chbUpdateExisting.setEnabled(bool(publishedMapCode))
+        self.publishDlg.chbUpdateExisting.setChecked(bool(publishedMapCode))
+        self.publishDlg.chbUpdateExisting.setToolTip((self.siteUrl + '/maps/view/' + publishedMapCode) if publishedMapCode else '')
+
         self.publishDlg.show()
         self.publishDlg.raise_()
         self.publishDlg.activateWindow()
+        self.scheduleTokenRefresh()
 
     def closePublishDlg(self):
         self.publishDlg.hide()
 
     def publishMap(self):
         self.checkAuth(self.publishMapInternal)
-        
-        # Check to see if we need to show a message box - has to be done in main therad, or QGIS will hard crash, at least on OSX
-        if self.pendingErrorDisplay:
-            QMessageBox.information(None, "Error Encountered", self.pendingErrorDisplay)
-            self.pendingErrorDisplay = False
-
-        # Display share URL for the map in a success modal - have to do this in main thread:
-        if self.lastPublishedMapCode:
-            self.successDialog.lblLink.setText('<a href="https://www.scribblemaps.com/maps/view/' + self.lastPublishedMapCode + '">https://www.scribblemaps.com/maps/view/' + self.lastPublishedMapCode + '</a>')
-            self.successDialog.lblLink.setTextFormat(Qt.RichText)
-            self.successDialog.lblLink.setTextInteractionFlags(Qt.TextBrowserInteraction)
-            self.successDialog.lblLink.setOpenExternalLinks(True)
-            self.successDialog.pbClose.clicked.connect(self.closeShareViewDialog)
-            self.successDialog.pbCopyLink.clicked.connect(self.copyShareViewLink)
-            self.successDialog.pbVisitMap.clicked.connect(self.navigateToShareViewLink)
-            self.successDialog.show()
-            self.successDialog.raise_()
-            self.successDialog.activateWindow()
 
     def publishMapInternal(self):
+        span = None
         try:
-            # Export all the selected layers to KML to handle in turn:
-            self.pendingConversionTempFiles = []
-            LatLongCRS = QgsCoordinateReferenceSystem("EPSG:4326")
+            # Vector layers are converted to SMJSON locally, from a snapshot of each layer that's safe to read from the
+            # publish task. The old route - export to KML and let /api/import/kml convert it - is still there behind
+            # the scribblemaps/serverSideConversion setting:
+            from .scribblemaps_layers import exportLayerKML
+
+            serverSideConversion = QSettings().value('scribblemaps/serverSideConversion', False, type=bool)
+            layerSources = []
+            pendingConversionLayers = []
+            span = self.tracer.span('publishMap', root=True, serverSideConversion=serverSideConversion)
 
             for i in range(self.publishDlg.lstLayers.count()):
                 if (self.publishDlg.lstLayers.item(i).checkState() == Qt.Checked):
-                    tempKML = NamedTemporaryFile()
-                    tempKMLName = tempKML.name + ".kml"
-                    tempKML.close()
-                    tempLyr = QgsProject.instance().mapLayersByName(self.publishDlg.lstLayers.item(i).text())[0]
-                    options = QgsVectorFileWriter.SaveVectorOptions()
-                    options.driverName = "KML"
-                    (errCode, errMsg) = QgsVectorFileWriter.writeAsVectorFormatV2(tempLyr, tempKMLName, QgsCoordinateTransformContext(), options)
-                    if errCode == QgsVectorFileWriter.NoError and os.path.isfile(tempKMLName):
-                        self.pendingConversionTempFiles.append(tempKMLName)
-                    else:
-                        self.pendingErrorDisplay = "Error Exporting Layer", "We were uanble to export a layer! Aborting. The error message was: " + errMsg
+                    tempLyr = QgsProject.instance().mapLayer(self.publishDlg.lstLayers.item(i).data(Qt.UserRole))
+                    if tempLyr is None:
+                        # Removed from the project while the dialog was open
+                        continue
+                    if (not serverSideConversion):
+                        layerSources.append((tempLyr.name(), QgsVectorLayerFeatureSource(tempLyr), tempLyr.fields()))
+                        continue
+
+                    # Exported in memory and uploaded from there - no temp files to write, re-read or clean up
+                    with self.tracer.span('export KML', layer=tempLyr.name()) as exportSpan:
+                        (kmlData, errMsg) = exportLayerKML(tempLyr, QgsCoordinateTransformContext())
+                        exportSpan.set(bytes=len(kmlData) if kmlData is not None else 0)
+                    if kmlData is None:
+                        span.finish(error=errMsg)
+                        QMessageBox.information(None, "Error Exporting Layer", "We were unable to export a layer! Aborting. The error message was: " + errMsg)
                         return
+                    pendingConversionLayers.append((tempLyr.name(), kmlData))
 
-            # Fire off a new thread to convert these to SMJSON and do the rest of the magic:
-            progressBar = QProgressDialog('Processing map for upload...', None, 0, 100)
-            progressBar.setWindowTitle('Please Wait...')
-            progressBar.setWindowModality(Qt.WindowModal)
-            progressBar.setAutoClose(False)
-            progressBar.setMinimumDuration(100)
-            progressBar.setWindowFlags(progressBar.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-            progressBar.show()
-            progressBar.raise_()
-            progressBar.activateWindow()
-            progressBar.setValue(0)
-            progressBar.setMaximum(100)
-            thread = threading.Thread(target = self._publishMapInternal)
-            thread.start()
-            while thread.is_alive():
-                QApplication.processEvents()
-                thread.join(0.2)
-                progressBar.setValue((progressBar.value() + 1 % 100))
-
-            progressBar.close()
+            # Everything the upload needs from the GUI is read here, since the task itself runs off the main thread:
+            fullExtentsCenter = self.iface.mapCanvas().fullExtent().center()
+            updateExisting = self.publishDlg.chbUpdateExisting.isEnabled() and self.publishDlg.chbUpdateExisting.isChecked()
+            publishSettings = {
+                'mapCode': QgsProject.instance().readEntry(self.PROJECT_SCOPE, 'mapCode', '')[0] if updateExisting else None,
+                'documentHash': QgsProject.instance().readEntry(self.PROJECT_SCOPE, 'documentHash', '')[0] if updateExisting else None,
+                'title': self.publishDlg.txtMapTitle.text(),
+                'description': self.publishDlg.plntxtMapDescription.toPlainText(),
+                'mapType': self.publishDlg.cmbMapType.currentText().lower().replace('scribble maps ', 'sm_'),
+                'centerLat': fullExtentsCenter.y(),
+                'centerLng': fullExtentsCenter.x(),
+                'transformContext': QgsProject.instance().transformContext(),
+                'streamUploadFormats': self.streamUploadFormats()
+            }
+
+            # Fire off a task to convert these to SMJSON and do the rest of the magic:
+            progressBar = self.createProgressDialog('Processing map for upload...')
+            self.tasks.run('Publishing to Scribble Maps', self._publishMapInternal, layerSources, pendingConversionLayers, publishSettings, self.current_token,
+                onFinished=lambda result: self._publishFinished(progressBar, span, result),
+                onError=lambda e: self._publishFailed(progressBar, span, e))
         except Exception as e:
+            if span:
+                span.finish(error=str(e))
             self.handleException(e)
+            QMessageBox.information(None, "Error Encountered", "We were unable to prepare your map for publishing! The error message was: " + str(e))
+
+    def _publishFinished(self, progressBar, span, result):
+        progressBar.close()
+        (mapCode, errorMessage, documentHash) = result
+        span.finish(mapCode=mapCode, error=errorMessage)
+
+        if errorMessage:
+            QMessageBox.information(None, "Error Encountered", errorMessage)
+            return
+
+        # Remember what went where, so the next publish from this project can update the same map:
+        QgsProject.instance().writeEntry(self.PROJECT_SCOPE, 'mapCode', mapCode)
+        QgsProject.instance().writeEntry(self.PROJECT_SCOPE, 'documentHash', documentHash)
+
+        # Display share URL for the map in a success modal:
+        self.lastPublishedMapCode = mapCode
+        viewUrl = self.siteUrl + '/maps/view/' + self.lastPublishedMapCode
+        self.successDialog.lblLink.setText('<a href="' + viewUrl + '">' + viewUrl + '</a>')
+        self.successDialog.lblLink.setTextFormat(Qt.RichText)
+        self.successDialog.lblLink.setTextInteractionFlags(Qt.TextBrowserInteraction)
+        self.successDialog.lblLink.setOpenExternalLinks(True)
+        self.successDialog.show()
+        self.successDialog.raise_()
+        self.successDialog.activateWindow()
+
+    def _publishFailed(self, progressBar, span, e):
+        if isinstance(e, ScribbleMapsTaskCanceled):
+            span.finish(canceled=True)
+        else:
+            span.finish(error=str(e))
+        self.taskFailed(progressBar, e)
+        if isinstance(e, ScribbleMapsNetworkError):
+            QMessageBox.information(None, "Error Encountered", "We were unable to publish your map! Please make sure you have an active internet connection. The error was: " + str(e), QMessageBox.Ok)
 
     def closeShareViewDialog(self):
         self.successDialog.hide()
@@ -515,109 +1115,285 @@ class ScribbleMapsConnector:
     def copyShareViewLink(self):
         cb = QApplication.clipboard()
         cb.clear(mode=cb.Clipboard)
-        cb.setText('https://www.scribblemaps.com/maps/view/' + self.lastPublishedMapCode, mode=cb.Clipboard)
+        cb.setText(self.siteUrl + '/maps/view/' + self.lastPublishedMapCode, mode=cb.Clipboard)
 
     def navigateToShareViewLink(self):
-        QDesktopServices.openUrl(QUrl('https://www.scribblemaps.com/maps/view/' + self.lastPublishedMapCode))
-
-    def _publishMapInternal(self):
-        self.lastPublishedMapCode = False
+        QDesktopServices.openUrl(QUrl(self.siteUrl + '/maps/view/' + self.lastPublishedMapCode))
 
-        # Convert our KML files to SMJSON strings:
+    def _importLayerKML(self, layerName, kmlData, canceled=None):
+        # Returns (layer name, SMJSON for the layer), with None in place of the SMJSON if the import failed
         try:
-            mergedSMJSON = False
-            for kmlTempFile in self.pendingConversionTempFiles:
-                with open(kmlTempFile, "rb") as kmlFileReader:
-                    files = {'file': ('data.kml', kmlFileReader, 'application/vnd.google-earth.kml+xml', {'Expires': '0'})}
-                    result = requests.post('https://www.scribblemaps.com/api/import/kml', files=files)
-                    thisLayer = result.json()
-                    if (not mergedSMJSON):
-                        mergedSMJSON = thisLayer
-                    else:
-                        # Merge it all into one SMJSON file - outer overlays object can contain each layer as a separate overlay entry
-                        for overlay in thisLayer["overlays"]:
-                            mergedSMJSON["overlays"].append(overlay)
-
-                    kmlFileReader.close()
-                    os.unlink(kmlTempFile)
-
-            # Get center of all data in the map:
-            fullExtentsCenter = self.iface.mapCanvas().fullExtent().center()
-
-            # At this poing we have mergedSMJSON that has all the features from all our layers - update our map type:
-            if not "view" in mergedSMJSON:
-                mergedSMJSON["view"] = { 
-                    'mapType': self.publishDlg.cmbMapType.currentText().lower().replace('scribble maps ', 'sm_'),
-                    'zoom': 10,
-                    'center': [
-                        fullExtentsCenter.y(),
-                        fullExtentsCenter.x()
-                    ]
-                }
-            else:
-                mergedSMJSON["view"]["mapType"] = self.publishDlg.cmbMapType.currentText().lower().replace('scribble maps ', 'sm_')
-                mergedSMJSON["view"]["zoom"] = 10
-                mergedSMJSON["view"]["center"] = [
-                    fullExtentsCenter.y(),
-                    fullExtentsCenter.x()
-                ]
-
-            # Next, Call the get new map code to get a valid map code - note no bearer token needed here
-            response = requests.get('https://www.scribblemaps.com/api/maps/newCode')
-            self.lastPublishedMapCode = str(response.text).replace('"', '')
-
-            # Lastly, save SMJSON - new stream, then save stream portion
-
-            # Create new stream:
-            response = requests.post('https://www.scribblemaps.com/api/maps/' + self.lastPublishedMapCode + '/stream/new', headers={ 'Authorization': 'Bearer ' + self.current_token}, data={
-                'title': self.publishDlg.txtMapTitle.text(),
-                'description': self.publishDlg.plntxtMapDescription.toPlainText(),
+            files = {'file': ('data.kml', kmlData, 'application/vnd.google-earth.kml+xml', {'Expires': '0'})}
+            with self.tracer.span('POST /api/import/kml', layer=layerName, bytesSent=len(kmlData)) as span:
+                result = self.api.post(self.siteUrl + '/api/import/kml', files=files, canceled=canceled)
+                span.set(status=result.status_code, bytes=len(result.content))
+
+            if not result.status_code == 200:
+                QgsMessageLog.logMessage('Converting layer "' + layerName + '" - ' + str(result.status_code) + ': ' + result.text[:1000], 'Scribble Maps')
+                return (layerName, None)
+
+            thisLayer = result.json()
+            if not isinstance(thisLayer, dict) or not isinstance(thisLayer.get("overlays"), list):
+                QgsMessageLog.logMessage('Converting layer "' + layerName + '" - unexpected response: ' + result.text[:1000], 'Scribble Maps')
+                return (layerName, None)
+
+            return (layerName, thisLayer)
+        except ScribbleMapsRequestCanceled:
+            raise
+        except Exception as e:
+            QgsMessageLog.logMessage('Converting layer "' + layerName + '" - ' + str(e), 'Scribble Maps')
+            return (layerName, None)
+
+    def _publishMapInternal(self, task, layerSources, pendingConversionLayers, publishSettings, token):
+        from .scribblemaps_smjson import ScribbleMapsSmJsonWriter
+
+        # Requests stop waiting, and are aborted, as soon as the task is canceled
+        publishSettings['canceled'] = task.isCanceled
+        with ScribbleMapsSmJsonWriter() as smjson:
+            return self._uploadMap(smjson, layerSources, pendingConversionLayers, publishSettings, token)
+
+    def _uploadMap(self, smjson, layerSources, pendingConversionLayers, publishSettings, token):
+        # Returns (map code, None, document hash) on success or (False, message to show the user, None) on failure.
+        # Each layer is written out as soon as it is converted, rather than merged into one big SMJSON dict, so
+        # memory is bounded by the largest layer instead of the whole map. Layers whose content hasn't changed since
+        # they were last published are written straight from the publish cache.
+        from .scribblemaps_smjson import layerToSmJson
+        from .scribblemaps_publish_cache import layerContentHash
+        from concurrent.futures import ThreadPoolExecutor
+
+        layerHashes = []
+
+        # Vector layers go straight from their features to SMJSON, with no round trip to the server:
+        for (layerName, source, fields) in layerSources:
+            with self.tracer.span('hash layer', layer=layerName):
+                contentHash = layerContentHash(layerName, source, fields, publishSettings['transformContext'])
+            layerHashes.append(contentHash)
+            with self.tracer.span('convert layer', layer=layerName) as span:
+                startLength = smjson.charLength
+                cached = self.publishCache.read(contentHash)
+                if cached:
+                    for encoded in cached[1]:
+                        smjson.writeEncodedOverlay(encoded)
+                else:
+                    layerSmJson = layerToSmJson(layerName, source, fields, publishSettings['transformContext'])
+                    span.set(overlays=len(layerSmJson["overlays"]))
+                    encoded = smjson.writeOverlay(layerSmJson)
+                    del layerSmJson
+                    self.publishCache.store(contentHash, None, [encoded])
+                span.set(cached=bool(cached), bytes=smjson.charLength - startLength)
+
+        # Anything exported to KML instead is converted by the server, several layers at a time, and written in the
+        # original layer order whichever finished first:
+        failedLayers = []
+        view = None
+        if pendingConversionLayers:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_IMPORTS) as executor:
+                for (layerName, contentHash, cached) in executor.map(lambda pending: self._importLayerCached(*pending, canceled=publishSettings['canceled']), pendingConversionLayers):
+                    layerHashes.append(contentHash)
+                    if cached is None:
+                        failedLayers.append(layerName)
+                        continue
+                    (layerView, encodedOverlays) = cached
+                    if view is None and isinstance(layerView, dict):
+                        view = layerView
+                    # Outer overlays object can contain each layer as a separate overlay entry
+                    for encoded in encodedOverlays:
+                        smjson.writeEncodedOverlay(encoded)
+
+        if failedLayers:
+            return (False, "We were unable to convert these layers for upload: " + ', '.join(failedLayers) + ". Please check the 'Scribble Maps' tab for any relevant messages.", None)
+
+        # At this point we have all the features from all our layers - finish off with the map type and view:
+        view = dict(view or {})
+        view["mapType"] = publishSettings['mapType']
+        view["zoom"] = 10
+        view["center"] = [
+            publishSettings['centerLat'],
+            publishSettings['centerLng']
+        ]
+        smjson.finish(view)
+        self.publishCache.evict()
+
+        # If nothing at all has changed since this project was last published to the map, there's nothing to send:
+        documentHash = hashlib.sha1(json.dumps([layerHashes, publishSettings['title'], publishSettings['description'], view]).encode('utf-8')).hexdigest()
+        mapCode = publishSettings['mapCode']
+        if mapCode and documentHash == publishSettings['documentHash']:
+            self.tracer.span('skip unchanged map', mapCode=mapCode).finish()
+            QgsMessageLog.logMessage('Map ' + mapCode + ' is already up to date, nothing to publish', 'Scribble Maps', Qgis.Info)
+            return (mapCode, None, documentHash)
+
+        # Lastly, save SMJSON - new stream, then save stream portion
+
+        # Create new stream, on the map published last time if we're updating it:
+        response = None
+        if mapCode:
+            response = self._createStream(mapCode, smjson, publishSettings, token)
+            if response.status_code in self.MAP_CODE_UNUSABLE:
+                QgsMessageLog.logMessage('Map ' + mapCode + ' can no longer be updated (' + str(response.status_code) + '), publishing as a new map', 'Scribble Maps')
+                response = None
+
+        if response is None:
+            # Call the get new map code to get a valid map code - note no bearer token needed here
+            with self.tracer.span('GET /api/maps/newCode') as span:
+                response = self.api.get(self.siteUrl + '/api/maps/newCode', canceled=publishSettings['canceled'])
+                span.set(status=response.status_code)
+            mapCode = str(response.text).replace('"', '')
+            response = self._createStream(mapCode, smjson, publishSettings, token)
+        
+        if response.status_code == 402:
+            # 402 = too many maps (spec = reserved for future use)
+            return (False, "We were unable to publish your map. You appear to be using the maximum number of maps allowed under the free plan.", None)
+
+        self.checkTokenAccepted(response)
+
+        if not response.status_code == 200:
+            QgsMessageLog.logMessage('Getting Map Code - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
+            return (False, "We were unable to retrieve a map code to publish! Please check the 'Scribble Maps' tab for any relevant messages.", None)
+
+        responseJSON = response.json()
+        if not responseJSON or not "streamCode" in responseJSON:
+            QgsMessageLog.logMessage('Creating Stream - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
+            return (False, "We were unable to retrieve a map code to publish! Please check the 'Scribble Maps' tab for any relevant messages.", None)
+
+        createStreamResultGUID = responseJSON["streamCode"]          
+
+        # Save SMJSON to stream:
+        response = self._postStream(mapCode, createStreamResultGUID, smjson, publishSettings['streamUploadFormats'], token, publishSettings['canceled'])
+        if not response.status_code == 200:
+            QgsMessageLog.logMessage('Publishing SMJSON to Stream - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
+            QgsMessageLog.logMessage('JSON body being published (first 10000 characters): ' + smjson.read(10000).decode('ascii'), 'Scribble Maps')
+            return (False, "We did not receive a successful status when publishing map data! Please check the 'Scribble Maps' tab for any relevant messages.", None)
+
+        # TODO: Version 2 or 3 perhaps - include any styling info present in QGIS, pushing into SMJSON
+        return (mapCode, None, documentHash)
+
+    def _importLayerCached(self, layerName, kmlData, canceled=None):
+        # Returns (layer name, content hash, (view, encoded overlays)) - from the publish cache if this exact KML has
+        # been converted before, otherwise from the server - with None in place of the last item if the import failed
+        from .scribblemaps_publish_cache import kmlContentHash
+
+        contentHash = kmlContentHash(layerName, kmlData)
+        cached = self.publishCache.read(contentHash)
+        if cached:
+            return (layerName, contentHash, cached)
+
+        (layerName, thisLayer) = self._importLayerKML(layerName, kmlData, canceled)
+        if thisLayer is None:
+            return (layerName, contentHash, None)
+
+        cached = (thisLayer.get("view"), [json.dumps(overlay) for overlay in thisLayer["overlays"]])
+        self.publishCache.store(contentHash, *cached)
+        return (layerName, contentHash, cached)
+
+    def _createStream(self, mapCode, smjson, publishSettings, token):
+        with self.tracer.span('POST stream/new', mapCode=mapCode) as span:
+            response = self.api.post(self.siteUrl + '/api/maps/' + mapCode + '/stream/new', headers={ 'Authorization': 'Bearer ' + token}, data={
+                'title': publishSettings['title'],
+                'description': publishSettings['description'],
                 'password': None,
                 'format': "smjsonUTF8",
                 'lang': "en",
-                'lat': fullExtentsCenter.y(),
-                'lng': fullExtentsCenter.x(),
+                'lat': publishSettings['centerLat'],
+                'lng': publishSettings['centerLng'],
                 'mapTypeId': 0,
-                'baseMap': self.publishDlg.cmbMapType.currentText().lower().replace('scribble maps ', 'sm_'),
+                'baseMap': publishSettings['mapType'],
                 'listed': 0,
                 'secure': 0,
                 'version': "2.1",
-                'charLength': len(json.dumps(mergedSMJSON))
-            })
-            
-            if response.status_code == 402:
-                # 402 = too many maps (spec = reserved for future use)
-                self.pendingErrorDisplay = "We were unable to publish your map. You appear to be using the maximum number of maps allowed under the free plan.";
-                self.lastPublishedMapCode = False
-                return
-
-            if not response.status_code == 200:
-                QgsMessageLog.logMessage('Getting Map Code - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
-                self.pendingErrorDisplay = "We were unable to retrieve a map code to publish! Please check the 'Scribble Maps' tab for any relevant messages."
-                self.lastPublishedMapCode = False
-                return
-
-            responseJSON = response.json()
-            if not responseJSON or not "streamCode" in responseJSON:
-                QgsMessageLog.logMessage('Creating Stream - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
-                self.pendingErrorDisplay = "We were unable to retrieve a map code to publish! Please check the 'Scribble Maps' tab for any relevant messages."
-                self.lastPublishedMapCode = False
-                return
-
-            createStreamResultGUID = responseJSON["streamCode"]          
-
-            # Save SMJSON to stream:
-            response = requests.post('https://www.scribblemaps.com/api/maps/' + self.lastPublishedMapCode + '/stream', headers={ 'Authorization': 'Bearer ' + self.current_token}, data={
-                'streamCode': createStreamResultGUID,
-                'data': json.dumps(mergedSMJSON)
-            })
-            if not response.status_code == 200:
-                QgsMessageLog.logMessage('Publishing SMJSON to Stream - ' + str(response.status_code) + ': ' + response.text, 'Scribble Maps')
-                QgsMessageLog.logMessage('JSON body being published: ' + json.dumps(mergedSMJSON), 'Scribble Maps')
-                self.pendingErrorDisplay = "We did not receive a successful status when publishing map data! Please check the 'Scribble Maps' tab for any relevant messages."
-                self.lastPublishedMapCode = False
-                return
-
-            # TODO: Version 2 or 3 perhaps - include any styling info present in QGIS, pushing into SMJSON
-        except Exception as e:
-            self.handleException(e)
+                'charLength': smjson.charLength
+            }, canceled=publishSettings['canceled'])
+            span.set(status=response.status_code)
+        return response
+
+    def streamUploadFormats(self):
+        # The stream upload formats to try, best first. gzip is only tried once scribblemaps/gzipStreamUpload is set.
+        # scribblemaps/streamUploadFormat pins the format to start from; otherwise it's the one the server last
+        # accepted, remembered across sessions so a server that only takes the form post gets just that.
+        settings = QSettings()
+        preferred = settings.value('scribblemaps/streamUploadFormat', '') or settings.value('scribblemaps/acceptedStreamUploadFormat', '')
+        formats = list(self.STREAM_UPLOAD_FORMATS)
+        if preferred != 'gzip' and not settings.value('scribblemaps/gzipStreamUpload', False, type=bool):
+            formats.remove('gzip')
+        if preferred in formats:
+            formats = formats[formats.index(preferred):]
+        return formats
+
+    def _postStream(self, mapCode, streamCode, smjson, formats, token, canceled=None):
+        # Sends the SMJSON as a raw (optionally gzipped) JSON body, which is a fraction of the size of the
+        # form-encoded field the stream endpoint originally took. Formats the server turns away fall back to the next
+        # one down, ending with the original form post; whichever is accepted is remembered for the next publish.
+        # A server error only falls back for this publish - it may be a passing fault rather than the format being
+        # turned away, so it doesn't stop the better format being tried first next time.
+        serverErrorFallback = False
+        for uploadFormat in formats:
+            url = self.siteUrl + '/api/maps/' + mapCode + '/stream'
+            headers = {'Authorization': 'Bearer ' + token}
+            # Every format is posted straight from a file, so only a buffer's worth of the map is ever in memory
+            bodyPath = None
+            if uploadFormat == 'form':
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+                bodyPath = self._formStream(streamCode, smjson)
+            else:
+                url += '?streamCode=' + quote(streamCode)
+                headers['Content-Type'] = 'application/json; charset=utf-8'
+                if uploadFormat == 'gzip':
+                    headers['Content-Encoding'] = 'gzip'
+                    with self.tracer.span('gzip SMJSON', bytes=smjson.charLength):
+                        bodyPath = self._gzipStream(smjson)
+
+            try:
+                with open(bodyPath or smjson.path, 'rb') as body:
+                    bodyLength = os.fstat(body.fileno()).st_size
+                    with self.tracer.span('POST stream', format=uploadFormat, bytesSent=bodyLength, charLength=smjson.charLength) as span:
+                        response = self.api.post(url, headers=headers, data=body, canceled=canceled)
+                        span.set(status=response.status_code)
+            finally:
+                if bodyPath:
+                    try:
+                        os.unlink(bodyPath)
+                    except OSError:
+                        pass
+
+            serverError = uploadFormat != 'form' and response.status_code >= 500
+            if (response.status_code in self.STREAM_FORMAT_REJECTED or serverError) and uploadFormat != formats[-1]:
+                serverErrorFallback = serverErrorFallback or serverError
+                QgsMessageLog.logMessage('Stream upload as ' + uploadFormat + ' was refused (' + str(response.status_code) + '), trying the next format', 'Scribble Maps')
+                continue
+
+            if response.status_code == 200:
+                if not serverErrorFallback:
+                    QSettings().setValue('scribblemaps/acceptedStreamUploadFormat', uploadFormat)
+                QgsMessageLog.logMessage('Stream upload: sent {} bytes as {} for {} characters of SMJSON ({} bytes form-encoded)'.format(
+                    bodyLength, uploadFormat, smjson.charLength, self._formEncodedLength(streamCode, smjson)), 'Scribble Maps', Qgis.Info)
+            return response
+
+    def _tempBodyFile(self, suffix):
+        return tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False)
+
+    def _gzipStream(self, smjson):
+        # Compresses the SMJSON a chunk at a time into a temp file, and returns its path
+        import gzip
+
+        with self._tempBodyFile('.smjson.gz') as bodyFile:
+            with gzip.GzipFile(fileobj=bodyFile, mode='wb', compresslevel=6) as gzipFile:
+                for chunk in smjson.chunks():
+                    gzipFile.write(chunk)
+        return bodyFile.name
+
+    def _formStream(self, streamCode, smjson):
+        # Writes the original form-encoded body a chunk at a time into a temp file, and returns its path. Chunks can
+        # be encoded separately because the SMJSON is ASCII-only.
+        with self._tempBodyFile('.form') as bodyFile:
+            bodyFile.write(urlencode({'streamCode': streamCode, 'data': ''}).encode('ascii'))
+            for chunk in smjson.chunks():
+                bodyFile.write(quote_plus(chunk).encode('ascii'))
+        return bodyFile.name
+
+    def _formEncodedLength(self, streamCode, smjson):
+        # Size the original form post would have been, for the log. quote_plus turns every byte outside
+        # FORM_UNESCAPED_BYTES into a three character %XX (spaces become '+'), so counting those is enough - without
+        # encoding the whole document again.
+        length = len(urlencode({'streamCode': streamCode, 'data': ''}))
+        for chunk in smjson.chunks():
+            length += len(chunk) + 2 * len(chunk.translate(None, self.FORM_UNESCAPED_BYTES))
+        return length
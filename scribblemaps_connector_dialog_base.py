@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'scribblemaps_connector_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ScribbleMapsConnectorDialogBase(object):
+    def setupUi(self, ScribbleMapsConnectorDialogBase):
+        ScribbleMapsConnectorDialogBase.setObjectName("ScribbleMapsConnectorDialogBase")
+        ScribbleMapsConnectorDialogBase.resize(711, 587)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(ScribbleMapsConnectorDialogBase)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.grpStep1 = QtWidgets.QGroupBox(ScribbleMapsConnectorDialogBase)
+        self.grpStep1.setObjectName("grpStep1")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.grpStep1)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label = QtWidgets.QLabel(self.grpStep1)
+        self.label.setObjectName("label")
+        self.verticalLayout_3.addWidget(self.label)
+        self.label_2 = QtWidgets.QLabel(self.grpStep1)
+        self.label_2.setWordWrap(True)
+        self.label_2.setOpenExternalLinks(True)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_3.addWidget(self.label_2)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.pbLink = QtWidgets.QPushButton(self.grpStep1)
+        self.pbLink.setMinimumSize(QtCore.QSize(176, 32))
+        self.pbLink.setMaximumSize(QtCore.QSize(176, 32))
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("scribblemaps:link.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pbLink.setIcon(icon)
+        self.pbLink.setObjectName("pbLink")
+        self.horizontalLayout_2.addWidget(self.pbLink)
+        self.pbUnlink = QtWidgets.QPushButton(self.grpStep1)
+        self.pbUnlink.setEnabled(False)
+        self.pbUnlink.setMinimumSize(QtCore.QSize(176, 32))
+        self.pbUnlink.setMaximumSize(QtCore.QSize(176, 32))
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("scribblemaps:broken_link.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pbUnlink.setIcon(icon1)
+        self.pbUnlink.setObjectName("pbUnlink")
+        self.horizontalLayout_2.addWidget(self.pbUnlink)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_2)
+        self.chbRequestThumbs = QtWidgets.QCheckBox(self.grpStep1)
+        self.chbRequestThumbs.setObjectName("chbRequestThumbs")
+        self.verticalLayout_3.addWidget(self.chbRequestThumbs)
+        self.verticalLayout_2.addWidget(self.grpStep1)
+        self.grpStep2 = QtWidgets.QGroupBox(ScribbleMapsConnectorDialogBase)
+        self.grpStep2.setEnabled(True)
+        self.grpStep2.setObjectName("grpStep2")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.grpStep2)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label_3 = QtWidgets.QLabel(self.grpStep2)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout.addWidget(self.label_3)
+        self.tblMaps = QtWidgets.QTableView(self.grpStep2)
+        self.tblMaps.setObjectName("tblMaps")
+        self.verticalLayout.addWidget(self.tblMaps)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.pbRefresh = QtWidgets.QPushButton(self.grpStep2)
+        self.pbRefresh.setEnabled(False)
+        self.pbRefresh.setMinimumSize(QtCore.QSize(176, 32))
+        self.pbRefresh.setMaximumSize(QtCore.QSize(176, 32))
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("scribblemaps:refresh.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pbRefresh.setIcon(icon2)
+        self.pbRefresh.setObjectName("pbRefresh")
+        self.horizontalLayout.addWidget(self.pbRefresh)
+        self.pbLoadSelected = QtWidgets.QPushButton(self.grpStep2)
+        self.pbLoadSelected.setEnabled(False)
+        self.pbLoadSelected.setMinimumSize(QtCore.QSize(176, 32))
+        self.pbLoadSelected.setMaximumSize(QtCore.QSize(176, 32))
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap("scribblemaps:down.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pbLoadSelected.setIcon(icon3)
+        self.pbLoadSelected.setObjectName("pbLoadSelected")
+        self.horizontalLayout.addWidget(self.pbLoadSelected)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2.addWidget(self.grpStep2)
+        self.buttonBox = QtWidgets.QDialogButtonBox(ScribbleMapsConnectorDialogBase)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+        self.retranslateUi(ScribbleMapsConnectorDialogBase)
+        self.buttonBox.accepted.connect(ScribbleMapsConnectorDialogBase.accept) # type: ignore
+        self.buttonBox.rejected.connect(ScribbleMapsConnectorDialogBase.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(ScribbleMapsConnectorDialogBase)
+
+    def retranslateUi(self, ScribbleMapsConnectorDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        ScribbleMapsConnectorDialogBase.setWindowTitle(_translate("ScribbleMapsConnectorDialogBase", "Scribble Maps Connector"))
+        self.grpStep1.setTitle(_translate("ScribbleMapsConnectorDialogBase", "Step 1: Connect Account"))
+        self.label.setText(_translate("ScribbleMapsConnectorDialogBase", "Welcome!"))
+        self.label_2.setText(_translate("ScribbleMapsConnectorDialogBase", "Please visit https://www.scribblemaps.com if you do not yet have a Scribble Maps account."))
+        self.pbLink.setText(_translate("ScribbleMapsConnectorDialogBase", "Link to My Account"))
+        self.pbUnlink.setText(_translate("ScribbleMapsConnectorDialogBase", "Unlink My Account"))
+        self.chbRequestThumbs.setText(_translate("ScribbleMapsConnectorDialogBase", "Load thumbnails in map list? (Slower)"))
+        self.grpStep2.setTitle(_translate("ScribbleMapsConnectorDialogBase", "Step 2: Load Data from Scribble Maps"))
+        self.label_3.setText(_translate("ScribbleMapsConnectorDialogBase", "Choose Maps to Load (Ctrl or Shift-click to choose several):"))
+        self.pbRefresh.setText(_translate("ScribbleMapsConnectorDialogBase", "Refresh Listing"))
+        self.pbLoadSelected.setText(_translate("ScribbleMapsConnectorDialogBase", "Load Selected Maps"))
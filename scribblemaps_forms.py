@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.PyQt import uic
+
+import os
+import importlib
+
+FORMS_DIR = os.path.dirname(__file__)
+
+# Set to False to always build forms from the .ui files at runtime (benchmark/bench_startup.py uses it to measure
+# the difference)
+USE_COMPILED_FORMS = True
+
+def loadFormClass(formName):
+    # Returns the form class for <formName>.ui. Importing the pyuic5-generated <formName>.py (see compile_forms.sh)
+    # is much cheaper than having uic parse the XML and generate the class at runtime, so that's used whenever it
+    # is at least as new as the .ui file. A .ui edited since it was last compiled falls back to uic.loadUiType, so
+    # a dialog never shows a stale form.
+    uiPath = os.path.join(FORMS_DIR, formName + '.ui')
+    formPath = os.path.join(FORMS_DIR, formName + '.py')
+
+    if USE_COMPILED_FORMS and os.path.exists(formPath):
+        if not os.path.exists(uiPath) or os.path.getmtime(formPath) >= os.path.getmtime(uiPath):
+            module = importlib.import_module('.' + formName, __package__)
+            return next(value for (name, value) in vars(module).items() if name.startswith('Ui_'))
+
+    (formClass, _) = uic.loadUiType(uiPath)
+    return formClass
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import *
+from osgeo import gdal
+
+import uuid
+
+LAYER_GEOMETRY_TYPES = ('Point', 'LineString', 'Polygon')
+LAYER_NAME_PREFIXES = {'Point': 'Points: ', 'LineString': 'Lines: ', 'Polygon': 'Polygons: '}
+LAYER_GEOMETRY_FAMILIES = {
+    QgsWkbTypes.PointGeometry: 'Point',
+    QgsWkbTypes.LineGeometry: 'LineString',
+    QgsWkbTypes.PolygonGeometry: 'Polygon'
+}
+
+def partitionFeatures(features):
+    # Sorts features into 'Point'/'LineString'/'Polygon' lists in a single pass, looking at each geometry's type once.
+    # Multi* geometries land with their single-part family; if a family has any, the whole family is promoted to
+    # multi so it can share one layer. Returns (partitions, set of families that need a Multi* layer).
+    partitions = dict((geometryType, []) for geometryType in LAYER_GEOMETRY_TYPES)
+    multiFamilies = set()
+    for feature in features:
+        wkbType = feature.geometry().wkbType()
+        family = LAYER_GEOMETRY_FAMILIES.get(QgsWkbTypes.geometryType(wkbType))
+        if family is None:
+            continue
+        if QgsWkbTypes.isMultiType(wkbType):
+            multiFamilies.add(family)
+        partitions[family].append(feature)
+
+    for family in multiFamilies:
+        for feature in partitions[family]:
+            geometry = feature.geometry()
+            if not geometry.isMultipart():
+                geometry.convertToMultiType()
+                feature.setGeometry(geometry)
+
+    return (partitions, multiFamilies)
+
+def createMemoryLayers(mapTitle, fields, features, multiFamilies=(), chunkSize=None, progress=None):
+    # One memory layer per geometry type that has any features. features maps 'Point'/'LineString'/'Polygon' to lists
+    # of QgsFeature. Each layer is filled with a single bulk addFeatures call, or chunkSize features at a time if
+    # given - see addFeatureChunks.
+    layers = []
+    for (layer, layerFeatures) in emptyMemoryLayers(mapTitle, fields, features, multiFamilies):
+        addFeatureChunks(layer, layerFeatures, chunkSize, progress)
+        layers.append(layer)
+    return layers
+
+def emptyMemoryLayers(mapTitle, fields, features, multiFamilies=()):
+    # Returns (layer, features) for each geometry type that has any features: the layer set up with the fields but
+    # still empty, and the features that belong in it
+    pairs = []
+    for geometryType in LAYER_GEOMETRY_TYPES:
+        if not features.get(geometryType):
+            continue
+        layerType = ('Multi' + geometryType) if geometryType in multiFamilies else geometryType
+        layer = QgsVectorLayer(layerType + "?crs=epsg:4326", LAYER_NAME_PREFIXES[geometryType] + mapTitle, "memory")
+        layer.dataProvider().addAttributes(fields.toList())
+        layer.updateFields()
+        pairs.append((layer, features[geometryType]))
+    return pairs
+
+def featureChunks(features, chunkSize=None):
+    step = chunkSize or len(features) or 1
+    for start in range(0, len(features), step):
+        yield features[start:start + step]
+
+def addFeatureChunks(layer, features, chunkSize=None, progress=None):
+    # Adds the features chunkSize at a time (all at once without one), calling progress(count) after each chunk.
+    # progress may raise to stop part way through.
+    layerData = layer.dataProvider()
+    for chunk in featureChunks(features, chunkSize):
+        layerData.addFeatures(chunk)
+        if progress:
+            progress(len(chunk))
+    layer.updateExtents()
+
+def exportLayerKML(layer, transformContext):
+    # Writes the layer as KML to GDAL's in-memory filesystem and returns (KML bytes, None), or (None, error message).
+    # Nothing touches the disk, and the /vsimem/ file is released before returning whatever happens.
+    vsiPath = '/vsimem/scribblemaps/' + uuid.uuid4().hex + '.kml'
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = "KML"
+    try:
+        (errCode, errMsg) = QgsVectorFileWriter.writeAsVectorFormatV2(layer, vsiPath, transformContext, options)[:2]
+        if errCode != QgsVectorFileWriter.NoError:
+            return (None, errMsg)
+
+        stat = gdal.VSIStatL(vsiPath)
+        if stat is None:
+            return (None, 'No KML was written for layer "' + layer.name() + '"')
+
+        handle = gdal.VSIFOpenL(vsiPath, 'rb')
+        try:
+            return (bytes(gdal.VSIFReadL(1, stat.size, handle)), None)
+        finally:
+            gdal.VSIFCloseL(handle)
+    finally:
+        gdal.Unlink(vsiPath)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtGui import *
+from qgis.PyQt.QtWidgets import *
+
+import os
+from collections import namedtuple
+
+from .scribblemaps_cacheutil import readJsonFile, writeJsonFile
+
+# Just what the table shows for each map - the rest of the /api/user/maps/ response isn't kept
+ScribbleMapsMapEntry = namedtuple('ScribbleMapsMapEntry', ['mapCode', 'title', 'description', 'created', 'thumbUrl', 'shareUrl'])
+
+class ScribbleMapsMapListModel(QAbstractTableModel):
+    # The user's maps for tblMaps. Cells are worked out only when the view asks for them, i.e. for the rows on
+    # screen, so opening a list of thousands of maps costs about the same as a list of ten.
+
+    COLUMNS = ('Map Code', 'Title', 'Description', 'Created', 'Thumbnail', 'Edit', 'Share')
+    THUMBNAIL_COLUMN = 4
+    EDIT_COLUMN = 5
+    SHARE_COLUMN = 6
+
+    THUMB_SIZE = 100
+
+    # Link columns hand their target URL to the delegate through this role
+    UrlRole = Qt.UserRole + 1
+
+    def __init__(self, siteUrl, parent=None):
+        super(ScribbleMapsMapListModel, self).__init__(parent)
+        # Edit links point at the configured site, like every other URL the plugin builds
+        self.siteUrl = siteUrl
+        self.entries = []
+        self.thumbnails = {}
+        self.showThumbnails = False
+
+    def setMaps(self, mapList):
+        self.beginResetModel()
+        self.entries = [self._entry(map) for map in mapList]
+        self.thumbnails = {}
+        self.endResetModel()
+
+    def updateMaps(self, mapList):
+        # Brings the rows in line with a newer copy of the list through row removes, moves, inserts and changes,
+        # rather than a reset, so the view keeps its scroll position, selection and thumbnails. Returns True if the
+        # thumbnail URL of any row changed - rows were added, removed or moved, or a map's thumbnail was replaced.
+        newEntries = [self._entry(map) for map in mapList]
+        newCodes = set(entry.mapCode for entry in newEntries)
+        thumbUrlsChanged = False
+
+        for row in reversed(range(len(self.entries))):
+            if self.entries[row].mapCode not in newCodes:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self.thumbnails.pop(self.entries[row].mapCode, None)
+                del self.entries[row]
+                self.endRemoveRows()
+                thumbUrlsChanged = True
+
+        for row, entry in enumerate(newEntries):
+            if row >= len(self.entries) or self.entries[row].mapCode != entry.mapCode:
+                thumbUrlsChanged = True
+                current = next((i for i in range(row + 1, len(self.entries)) if self.entries[i].mapCode == entry.mapCode), None)
+                if current is None:
+                    self.beginInsertRows(QModelIndex(), row, row)
+                    self.entries.insert(row, entry)
+                    self.endInsertRows()
+                    continue
+                self.beginMoveRows(QModelIndex(), current, current, QModelIndex(), row)
+                self.entries.insert(row, self.entries.pop(current))
+                self.endMoveRows()
+
+            if self.entries[row] != entry:
+                if self.entries[row].thumbUrl != entry.thumbUrl:
+                    self.thumbnails.pop(entry.mapCode, None)
+                    thumbUrlsChanged = True
+                self.entries[row] = entry
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+        return thumbUrlsChanged
+
+    def _entry(self, map):
+        return ScribbleMapsMapEntry(map["mapCode"], map.get("title") or '', map.get("description") or '', map.get("created") or '',
+                                    map.get("thumbUrl") or '', map.get("shareUrl") or '')
+
+    def entry(self, row):
+        return self.entries[row]
+
+    def setShowThumbnails(self, showThumbnails):
+        self.showThumbnails = showThumbnails
+        if not showThumbnails:
+            self.thumbnails = {}
+        if self.entries:
+            self.dataChanged.emit(self.index(0, self.THUMBNAIL_COLUMN), self.index(len(self.entries) - 1, self.THUMBNAIL_COLUMN))
+
+    def setThumbnail(self, row, thumbnail):
+        # Keyed by map code rather than row, so a thumbnail stays with its map if rows move
+        if row >= len(self.entries):
+            return
+        self.thumbnails[self.entries[row].mapCode] = thumbnail
+        index = self.index(row, self.THUMBNAIL_COLUMN)
+        self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.entries[index.row()]
+        column = index.column()
+
+        if column == self.THUMBNAIL_COLUMN:
+            if role == Qt.DecorationRole:
+                return self.thumbnails.get(entry.mapCode)
+            if role == Qt.SizeHintRole and self.showThumbnails:
+                return QSize(self.THUMB_SIZE, self.THUMB_SIZE)
+            return None
+
+        if column in (self.EDIT_COLUMN, self.SHARE_COLUMN):
+            url = self.siteUrl + '/create/#id=' + entry.mapCode if column == self.EDIT_COLUMN else entry.shareUrl
+            if role == Qt.DisplayRole:
+                return 'Edit on Scribble Maps' if column == self.EDIT_COLUMN else 'Share Link'
+            if role in (self.UrlRole, Qt.ToolTipRole):
+                return url
+            return None
+
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            if column == 0:
+                return entry.mapCode
+            if column == 1:
+                return entry.title
+            if column == 2:
+                return entry.description
+            if column == 3:
+                return QDateTime.fromString(entry.created, Qt.ISODate).toString('ddd MMMM d yyyy h:m ap')
+        return None
+
+class ScribbleMapsMapListCache:
+    # The last map list fetched for an account, kept in the profile directory so it can be shown the moment the
+    # dialog opens, with the ETag/Last-Modified it was served with for revalidating it in the background.
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, account):
+        cached = readJsonFile(self.path)
+        if not isinstance(cached, dict) or cached.get("account") != account or not isinstance(cached.get("mapList"), list):
+            return None
+        return cached
+
+    def save(self, account, mapList, etag, lastModified):
+        writeJsonFile(self.path, {'account': account, 'etag': etag, 'lastModified': lastModified, 'mapList': mapList})
+
+    def clear(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+class ScribbleMapsThumbnailDelegate(QStyledItemDelegate):
+    # Paints the thumbnail image centred in its cell, in place of a QLabel per row
+
+    def paint(self, painter, option, index):
+        QApplication.style().drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        thumbnail = index.data(Qt.DecorationRole)
+        if thumbnail is None or thumbnail.isNull():
+            return
+        target = QRect(QPoint(0, 0), thumbnail.size().scaled(option.rect.size(), Qt.KeepAspectRatio))
+        target.moveCenter(option.rect.center())
+        painter.drawImage(target, thumbnail)
+
+    def sizeHint(self, option, index):
+        size = index.data(Qt.SizeHintRole)
+        return size if size is not None else QSize(0, 0)
+
+class ScribbleMapsLinkDelegate(QStyledItemDelegate):
+    # Paints a link-styled label and opens its URL on click, in place of a QLabel with openExternalLinks per row
+
+    def initStyleOption(self, option, index):
+        super(ScribbleMapsLinkDelegate, self).initStyleOption(option, index)
+        option.font.setUnderline(True)
+        option.palette.setColor(QPalette.Text, option.palette.color(QPalette.Link))
+
+    def linkRect(self, option, index):
+        # Where the style draws the link text in the cell, so only clicks on the text itself open the link
+        option = QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else QApplication.style()
+        textRect = style.subElementRect(QStyle.SE_ItemViewItemText, option, option.widget)
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, option.widget) + 1
+        textRect.adjust(margin, 0, -margin, 0)
+        metrics = QFontMetrics(option.font)
+        textSize = QSize(min(metrics.width(option.text), textRect.width()), metrics.height())
+        return QStyle.alignedRect(option.direction, option.displayAlignment, textSize, textRect)
+
+    def editorEvent(self, event, model, option, index):
+        # Clicks with Ctrl or Shift held, or beside the text, are left to the view so rows can still be selected
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton and event.modifiers() == Qt.NoModifier:
+            url = index.data(ScribbleMapsMapListModel.UrlRole)
+            if url and self.linkRect(option, index).contains(event.pos()):
+                QDesktopServices.openUrl(QUrl(url))
+                return True
+        return False
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+import os
+import time
+import uuid
+import hashlib
+import threading
+
+from .scribblemaps_cacheutil import readJsonFile, writeJsonFile
+
+class ScribbleMapsMapStore:
+    # Keeps the data last downloaded for each map (SMJSON or KML, whichever the server gave us) with the ETag and
+    # Last-Modified it was served with, so loading a map again only costs a conditional request - or nothing at all
+    # when we're offline. Least recently used maps are evicted once the store grows past maxBytes.
+    # Map loads run on several task threads at once, so every index change happens under one lock.
+
+    def __init__(self, storeDir, maxBytes=512 * 1024 * 1024):
+        self.storeDir = storeDir
+        self.maxBytes = maxBytes
+        self.indexPath = os.path.join(storeDir, 'index.json')
+        self.lock = threading.Lock()
+
+        os.makedirs(storeDir, exist_ok=True)
+        entries = readJsonFile(self.indexPath)
+        self.entries = entries if isinstance(entries, dict) else {}
+
+    def _key(self, mapCode):
+        return hashlib.sha1(mapCode.encode('utf-8')).hexdigest()
+
+    def path(self, entry):
+        return os.path.join(self.storeDir, entry["file"])
+
+    def lookup(self, mapCode):
+        with self.lock:
+            entry = self.entries.get(self._key(mapCode))
+            if entry is None or not os.path.isfile(self.path(entry)):
+                return None
+            entry["lastUsed"] = time.time()
+            return dict(entry)
+
+    def downloadPath(self, mapCode):
+        # Somewhere in the store to download a fresh copy to, without disturbing the current one until commit
+        return os.path.join(self.storeDir, self._key(mapCode) + '.' + uuid.uuid4().hex + '.part')
+
+    def commit(self, mapCode, format, downloadPath, etag, lastModified):
+        key = self._key(mapCode)
+        entry = {
+            'mapCode': mapCode,
+            'format': format,
+            'file': key + '.' + format,
+            'etag': etag,
+            'lastModified': lastModified,
+            'validated': time.time(),
+            'lastUsed': time.time(),
+            'size': os.path.getsize(downloadPath)
+        }
+        with self.lock:
+            old = self.entries.get(key)
+            if old is not None and old["file"] != entry["file"]:
+                self._unlink(self.path(old))
+            os.replace(downloadPath, self.path(entry))
+            self.entries[key] = entry
+            self._evict(keep=key)
+            self._save()
+        return dict(entry)
+
+    def revalidated(self, mapCode):
+        with self.lock:
+            entry = self.entries.get(self._key(mapCode))
+            if entry is not None:
+                entry["validated"] = time.time()
+                self._save()
+
+    def remove(self, mapCode):
+        with self.lock:
+            entry = self.entries.pop(self._key(mapCode), None)
+            if entry is not None:
+                self._unlink(self.path(entry))
+                self._save()
+
+    def _evict(self, keep):
+        totalBytes = sum(entry["size"] for entry in self.entries.values())
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["lastUsed"]):
+            if totalBytes <= self.maxBytes:
+                break
+            if key == keep:
+                continue
+            self._unlink(self.path(entry))
+            del self.entries[key]
+            totalBytes -= entry["size"]
+
+    def _unlink(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def _save(self):
+        writeJsonFile(self.indexPath, self.entries)
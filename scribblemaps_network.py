@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtNetwork import *
+from qgis.core import *
+
+import json
+import time
+import threading
+from urllib.parse import urlencode
+
+class ScribbleMapsNetworkError(Exception):
+    pass
+
+class ScribbleMapsRequestCanceled(Exception):
+    pass
+
+class ScribbleMapsReply:
+    # Minimal stand-in for the parts of requests.Response the connector uses
+
+    def __init__(self, url, status_code, content, headers, error=None, bytesReceived=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.error = error
+        self.bytesReceived = len(content) if bytesReceived is None else bytesReceived
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def header(self, name, default=None):
+        return self.headers.get(name.lower(), default)
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+class _PendingRequest:
+
+    def __init__(self, method, url, headers, body, files, cacheable, callback, outputPath=None):
+        self.method = method
+        self.url = url
+        self.headers = headers or {}
+        self.body = body
+        self.files = files
+        self.cacheable = cacheable
+        self.callback = callback
+        self.outputPath = outputPath
+        self.outputFile = None
+        self.bodyDevice = None
+        self.bytesReceived = 0
+        self.reply = None
+        self.response = None
+        self.canceled = False
+        self.lastActivity = time.monotonic()
+        self.finished = threading.Event()
+
+class ScribbleMapsNetworkClient(QObject):
+    # All traffic goes through the main thread's QgsNetworkAccessManager, so every call shares one connection pool
+    # (keep-alive, TLS session reuse, HTTP/2 where the server offers it), the user's proxy settings and the QGIS
+    # network disk cache. Worker threads hand their requests over to the main thread and wait for the reply there.
+
+    requestQueued = pyqtSignal(object)
+    abortQueued = pyqtSignal(object)
+
+    # A transfer with no bytes going either way for this long is aborted
+    TRANSFER_TIMEOUT = 60
+    # POSTs get longer by default: once the body is sent, nothing moves while the server converts or stores it
+    POST_TIMEOUT = 600
+    # How often a waiting worker thread checks whether its caller has canceled
+    CANCEL_POLL_INTERVAL = 0.1
+    # How long a canceled worker waits for the abort to go through before giving up on the main thread
+    ABORT_GRACE = 2
+
+    def __init__(self, parent=None, postTimeout=None):
+        super(ScribbleMapsNetworkClient, self).__init__(parent)
+        self.networkManager = QgsNetworkAccessManager.instance()
+        self.postTimeout = postTimeout or self.POST_TIMEOUT
+        self.inFlight = set()
+        self.requestQueued.connect(self._startRequest, Qt.QueuedConnection)
+        self.abortQueued.connect(self.abort, Qt.QueuedConnection)
+
+    def get(self, url, headers=None, cacheable=False, canceled=None):
+        return self.request('GET', url, headers=headers, cacheable=cacheable, canceled=canceled)
+
+    def post(self, url, headers=None, data=None, files=None, canceled=None):
+        return self.request('POST', url, headers=headers, data=data, files=files, canceled=canceled)
+
+    def download(self, url, outputPath, headers=None, canceled=None):
+        # Like get, but the body is written to outputPath chunk by chunk as it arrives instead of being held in memory
+        return self.request('GET', url, headers=headers, outputPath=outputPath, canceled=canceled)
+
+    def request(self, method, url, headers=None, data=None, files=None, cacheable=False, outputPath=None, canceled=None):
+        # Blocking call, safe from the main thread or any worker thread. From a worker, canceled (e.g. a task's
+        # isCanceled) is polled while waiting; once it returns True the request is aborted and
+        # ScribbleMapsRequestCanceled raised.
+        pending = _PendingRequest(method, url, headers, data, files, cacheable, None, outputPath)
+
+        if QThread.currentThread() == self.thread():
+            loop = QEventLoop()
+            pending.callback = lambda response: loop.quit()
+            self._startRequest(pending)
+            if not pending.finished.is_set():
+                loop.exec_()
+        else:
+            self.requestQueued.emit(pending)
+            self._waitFor(pending, canceled)
+
+        if pending.response.status_code is None:
+            raise ScribbleMapsNetworkError('{} {} failed: {}'.format(method, url, pending.response.error))
+
+        return pending.response
+
+    def requestAsync(self, method, url, callback, headers=None, data=None, files=None, cacheable=False):
+        # Non-blocking call, main thread only - callback receives the ScribbleMapsReply once the request completes
+        pending = _PendingRequest(method, url, headers, data, files, cacheable, callback)
+        self._startRequest(pending)
+        return pending
+
+    def abort(self, pending):
+        # Main thread only. A request that hasn't been started yet never will be.
+        pending.canceled = True
+        if pending.reply is not None and not pending.finished.is_set():
+            pending.reply.abort()
+
+    def _waitFor(self, pending, canceled):
+        # Never waits unboundedly: the main thread might not get round to the request at all (e.g. while the plugin is
+        # being unloaded), so the worker gives up once it's canceled, or once nothing has moved for the request's timeout
+        timeout = self._timeout(pending)
+        while not pending.finished.wait(self.CANCEL_POLL_INTERVAL):
+            if canceled is not None and canceled():
+                self.abortQueued.emit(pending)
+                pending.finished.wait(self.ABORT_GRACE)
+                raise ScribbleMapsRequestCanceled('{} {} canceled'.format(pending.method, pending.url))
+            if time.monotonic() - pending.lastActivity > timeout + self.ABORT_GRACE:
+                self.abortQueued.emit(pending)
+                pending.finished.wait(self.ABORT_GRACE)
+                raise ScribbleMapsNetworkError('{} {} timed out'.format(pending.method, pending.url))
+
+    def _timeout(self, pending):
+        return self.postTimeout if pending.method == 'POST' else self.TRANSFER_TIMEOUT
+
+    def _activity(self, pending):
+        pending.lastActivity = time.monotonic()
+
+    def _startRequest(self, pending):
+        if pending.canceled:
+            return
+
+        request = QNetworkRequest(QUrl(pending.url))
+        request.setAttribute(QNetworkRequest.FollowRedirectsAttribute, True)
+        if hasattr(QNetworkRequest, 'Http2AllowedAttribute'):
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        if hasattr(request, 'setTransferTimeout'):
+            request.setTransferTimeout(self._timeout(pending) * 1000)
+
+        if pending.cacheable:
+            request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferNetwork)
+        else:
+            # API responses are per-user; never serve them from, or write them to, the shared disk cache
+            request.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.AlwaysNetwork)
+            request.setAttribute(QNetworkRequest.CacheSaveControlAttribute, False)
+
+        for name, value in pending.headers.items():
+            request.setRawHeader(name.encode('latin-1'), str(value).encode('latin-1'))
+
+        if pending.method == 'GET':
+            reply = self.networkManager.get(request)
+        elif pending.files:
+            multiPart = self._buildMultiPart(pending.files)
+            reply = self.networkManager.post(request, multiPart)
+            multiPart.setParent(reply)
+        elif hasattr(pending.body, 'read'):
+            # File objects are sent straight from disk, a buffer at a time, rather than read into memory first
+            device = QFile(pending.body.name)
+            if not device.open(QIODevice.ReadOnly):
+                self._completeRequest(pending, ScribbleMapsReply(pending.url, None, b'', {}, 'Unable to read ' + pending.body.name))
+                return
+            request.setHeader(QNetworkRequest.ContentLengthHeader, device.size())
+            reply = self.networkManager.post(request, device)
+            # Closed as soon as the reply finishes, not when the reply is deleted later - until then the caller
+            # couldn't delete the file (Windows keeps open files locked)
+            pending.bodyDevice = device
+        else:
+            body = pending.body
+            if isinstance(body, dict):
+                # Same as requests: fields with a value of None are left out entirely
+                body = urlencode([(key, value) for key, value in body.items() if value is not None]).encode('utf-8')
+                if not pending.headers.get('Content-Type'):
+                    request.setHeader(QNetworkRequest.ContentTypeHeader, 'application/x-www-form-urlencoded')
+            reply = self.networkManager.post(request, QByteArray(body or b''))
+
+        pending.reply = reply
+        pending.lastActivity = time.monotonic()
+        self.inFlight.add(pending)
+        reply.downloadProgress.connect(lambda received, total: self._activity(pending))
+        reply.uploadProgress.connect(lambda sent, total: self._activity(pending))
+        if pending.outputPath:
+            pending.outputFile = open(pending.outputPath, 'wb')
+            reply.readyRead.connect(lambda: self._writeChunk(pending))
+        reply.finished.connect(lambda: self._finishRequest(pending))
+
+    def _writeChunk(self, pending):
+        chunk = bytes(pending.reply.readAll())
+        pending.bytesReceived += len(chunk)
+        pending.outputFile.write(chunk)
+
+    def _buildMultiPart(self, files):
+        multiPart = QHttpMultiPart(QHttpMultiPart.FormDataType)
+        for fieldName, fileSpec in files.items():
+            # Same tuple layout as requests: (filename, content or file object, content type[, extra headers])
+            fileName, content, contentType = fileSpec[:3]
+            part = QHttpPart()
+            part.setHeader(QNetworkRequest.ContentTypeHeader, contentType)
+            part.setHeader(QNetworkRequest.ContentDispositionHeader, 'form-data; name="{}"; filename="{}"'.format(fieldName, fileName))
+            if len(fileSpec) > 3:
+                for name, value in fileSpec[3].items():
+                    part.setRawHeader(name.encode('latin-1'), str(value).encode('latin-1'))
+            if hasattr(content, 'read'):
+                content = content.read()
+            part.setBody(QByteArray(content))
+            multiPart.append(part)
+        return multiPart
+
+    def _finishRequest(self, pending):
+        reply = pending.reply
+        statusCode = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        headers = {}
+        for name, value in reply.rawHeaderPairs():
+            headers[bytes(name).decode('latin-1').lower()] = bytes(value).decode('latin-1')
+        error = None if reply.error() == QNetworkReply.NoError else reply.errorString()
+
+        if pending.outputFile is not None:
+            self._writeChunk(pending)
+            pending.outputFile.close()
+            pending.response = ScribbleMapsReply(pending.url, statusCode, b'', headers, error, pending.bytesReceived)
+        else:
+            pending.response = ScribbleMapsReply(pending.url, statusCode, bytes(reply.readAll()), headers, error)
+        self.inFlight.discard(pending)
+        if pending.bodyDevice is not None:
+            pending.bodyDevice.close()
+            pending.bodyDevice = None
+        reply.deleteLater()
+        self._completeRequest(pending, pending.response)
+
+    def _completeRequest(self, pending, response):
+        pending.response = response
+        pending.finished.set()
+
+        if pending.callback:
+            pending.callback(pending.response)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import *
+
+import os
+import json
+import hashlib
+
+class ScribbleMapsPublishCache:
+    # Keeps the encoded SMJSON of each layer published, keyed by a hash of the layer's content, so republishing a
+    # project only converts the layers that changed. An entry is a text file: the layer's map view (or null) on the
+    # first line, then one encoded overlay per line. Least recently used entries go once the cache passes maxBytes.
+
+    def __init__(self, cacheDir, maxBytes=256 * 1024 * 1024):
+        self.cacheDir = cacheDir
+        self.maxBytes = maxBytes
+        os.makedirs(cacheDir, exist_ok=True)
+
+    def _path(self, contentHash):
+        return os.path.join(self.cacheDir, contentHash + '.smjson')
+
+    def read(self, contentHash):
+        # Returns (view, [encoded overlay, ...]), or None if the layer isn't cached
+        path = self._path(contentHash)
+        try:
+            with open(path, 'r', encoding='ascii') as entryFile:
+                view = json.loads(entryFile.readline())
+                overlays = [line.rstrip('\n') for line in entryFile]
+            os.utime(path)
+            return (view, overlays)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, contentHash, view, encodedOverlays):
+        path = self._path(contentHash)
+        tempPath = path + '.tmp'
+        try:
+            with open(tempPath, 'w', encoding='ascii') as entryFile:
+                entryFile.write(json.dumps(view) + '\n')
+                for encoded in encodedOverlays:
+                    entryFile.write(encoded + '\n')
+            os.replace(tempPath, path)
+        except OSError:
+            pass
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.cacheDir):
+            path = os.path.join(self.cacheDir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        totalBytes = sum(size for (mtime, size, path) in entries)
+        for (mtime, size, path) in sorted(entries):
+            if totalBytes <= self.maxBytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            totalBytes -= size
+
+def layerContentHash(layerName, source, fields, transformContext):
+    # Everything that ends up in a layer's SMJSON: its name, field names, and every feature's geometry (in WGS84,
+    # as published) and attributes
+    digest = hashlib.sha1()
+    digest.update(json.dumps([layerName, fields.names()]).encode('utf-8'))
+    request = QgsFeatureRequest()
+    request.setDestinationCrs(QgsCoordinateReferenceSystem('EPSG:4326'), transformContext)
+    for feature in source.getFeatures(request):
+        digest.update(bytes(feature.geometry().asWkb()))
+        digest.update(repr(feature.attributes()).encode('utf-8'))
+    return digest.hexdigest()
+
+def kmlContentHash(layerName, kmlData):
+    digest = hashlib.sha1()
+    digest.update(layerName.encode('utf-8') + b'\0')
+    digest.update(kmlData)
+    return digest.hexdigest()
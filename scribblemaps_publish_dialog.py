@@ -16,13 +16,11 @@
  ***************************************************************************/
 """
 
-import os
-
-from qgis.PyQt import uic
 from qgis.PyQt import QtWidgets
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'scribblemaps_publish_dialog_base.ui'))
+from .scribblemaps_forms import loadFormClass
+
+FORM_CLASS = loadFormClass('scribblemaps_publish_dialog_base')
 
 class ScribbleMapsPublishDialog(QtWidgets.QDialog, FORM_CLASS):
     def __init__(self, parent=None):
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'scribblemaps_publish_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ScribbleMapsPublishDialogBase(object):
+    def setupUi(self, ScribbleMapsPublishDialogBase):
+        ScribbleMapsPublishDialogBase.setObjectName("ScribbleMapsPublishDialogBase")
+        ScribbleMapsPublishDialogBase.resize(711, 464)
+        self.verticalLayout = QtWidgets.QVBoxLayout(ScribbleMapsPublishDialogBase)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.groupBox = QtWidgets.QGroupBox(ScribbleMapsPublishDialogBase)
+        self.groupBox.setObjectName("groupBox")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.groupBox)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.lstLayers = QtWidgets.QListWidget(self.groupBox)
+        self.lstLayers.setObjectName("lstLayers")
+        self.horizontalLayout.addWidget(self.lstLayers)
+        self.verticalLayout.addWidget(self.groupBox)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.cmbMapType = QtWidgets.QComboBox(ScribbleMapsPublishDialogBase)
+        self.cmbMapType.setMinimumSize(QtCore.QSize(200, 0))
+        self.cmbMapType.setCurrentText("")
+        self.cmbMapType.setObjectName("cmbMapType")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.cmbMapType)
+        self.label_2 = QtWidgets.QLabel(ScribbleMapsPublishDialogBase)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.txtMapTitle = QtWidgets.QLineEdit(ScribbleMapsPublishDialogBase)
+        self.txtMapTitle.setObjectName("txtMapTitle")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.txtMapTitle)
+        self.label_3 = QtWidgets.QLabel(ScribbleMapsPublishDialogBase)
+        self.label_3.setObjectName("label_3")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_3)
+        self.plntxtMapDescription = QtWidgets.QPlainTextEdit(ScribbleMapsPublishDialogBase)
+        self.plntxtMapDescription.setObjectName("plntxtMapDescription")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.plntxtMapDescription)
+        self.chbUpdateExisting = QtWidgets.QCheckBox(ScribbleMapsPublishDialogBase)
+        self.chbUpdateExisting.setObjectName("chbUpdateExisting")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.chbUpdateExisting)
+        self.label = QtWidgets.QLabel(ScribbleMapsPublishDialogBase)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.verticalLayout.addLayout(self.formLayout)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem)
+        self.pbPublish = QtWidgets.QPushButton(ScribbleMapsPublishDialogBase)
+        self.pbPublish.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.pbPublish.setObjectName("pbPublish")
+        self.horizontalLayout_3.addWidget(self.pbPublish)
+        self.pbClose = QtWidgets.QPushButton(ScribbleMapsPublishDialogBase)
+        self.pbClose.setMaximumSize(QtCore.QSize(90, 16777215))
+        self.pbClose.setObjectName("pbClose")
+        self.horizontalLayout_3.addWidget(self.pbClose)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+
+        self.retranslateUi(ScribbleMapsPublishDialogBase)
+        QtCore.QMetaObject.connectSlotsByName(ScribbleMapsPublishDialogBase)
+
+    def retranslateUi(self, ScribbleMapsPublishDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        ScribbleMapsPublishDialogBase.setWindowTitle(_translate("ScribbleMapsPublishDialogBase", "Publish to Scribble Maps"))
+        self.groupBox.setTitle(_translate("ScribbleMapsPublishDialogBase", "Choose QGIS Layers to Publish"))
+        self.label_2.setText(_translate("ScribbleMapsPublishDialogBase", "Map Title:"))
+        self.label_3.setText(_translate("ScribbleMapsPublishDialogBase", "Map Description:"))
+        self.chbUpdateExisting.setText(_translate("ScribbleMapsPublishDialogBase", "Update the map previously published from this project"))
+        self.label.setText(_translate("ScribbleMapsPublishDialogBase", "Choose Map Type:"))
+        self.pbPublish.setText(_translate("ScribbleMapsPublishDialogBase", "Publish Map"))
+        self.pbClose.setText(_translate("ScribbleMapsPublishDialogBase", "Close"))
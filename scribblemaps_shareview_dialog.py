@@ -16,13 +16,11 @@
  ***************************************************************************/
 """
 
-import os
-
-from qgis.PyQt import uic
 from qgis.PyQt import QtWidgets
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'scribblemaps_shareview_dialog_base.ui'))
+from .scribblemaps_forms import loadFormClass
+
+FORM_CLASS = loadFormClass('scribblemaps_shareview_dialog_base')
 
 class ScribbleMapsShareViewDialog(QtWidgets.QDialog, FORM_CLASS):
     def __init__(self, parent=None):
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'scribblemaps_shareview_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ScribbleMapsShareViewDialogBase(object):
+    def setupUi(self, ScribbleMapsShareViewDialogBase):
+        ScribbleMapsShareViewDialogBase.setObjectName("ScribbleMapsShareViewDialogBase")
+        ScribbleMapsShareViewDialogBase.resize(401, 178)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(ScribbleMapsShareViewDialogBase)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.label = QtWidgets.QLabel(ScribbleMapsShareViewDialogBase)
+        self.label.setObjectName("label")
+        self.verticalLayout_2.addWidget(self.label)
+        self.lblLink = QtWidgets.QLabel(ScribbleMapsShareViewDialogBase)
+        self.lblLink.setObjectName("lblLink")
+        self.verticalLayout_2.addWidget(self.lblLink)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.pbCopyLink = QtWidgets.QPushButton(ScribbleMapsShareViewDialogBase)
+        self.pbCopyLink.setMinimumSize(QtCore.QSize(81, 0))
+        self.pbCopyLink.setMaximumSize(QtCore.QSize(900, 16777215))
+        self.pbCopyLink.setObjectName("pbCopyLink")
+        self.horizontalLayout.addWidget(self.pbCopyLink)
+        self.pbVisitMap = QtWidgets.QPushButton(ScribbleMapsShareViewDialogBase)
+        self.pbVisitMap.setMinimumSize(QtCore.QSize(81, 0))
+        self.pbVisitMap.setMaximumSize(QtCore.QSize(900, 16777215))
+        self.pbVisitMap.setObjectName("pbVisitMap")
+        self.horizontalLayout.addWidget(self.pbVisitMap)
+        self.pbClose = QtWidgets.QPushButton(ScribbleMapsShareViewDialogBase)
+        self.pbClose.setMinimumSize(QtCore.QSize(81, 0))
+        self.pbClose.setMaximumSize(QtCore.QSize(900, 16777215))
+        self.pbClose.setObjectName("pbClose")
+        self.horizontalLayout.addWidget(self.pbClose)
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(ScribbleMapsShareViewDialogBase)
+        QtCore.QMetaObject.connectSlotsByName(ScribbleMapsShareViewDialogBase)
+
+    def retranslateUi(self, ScribbleMapsShareViewDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        ScribbleMapsShareViewDialogBase.setWindowTitle(_translate("ScribbleMapsShareViewDialogBase", "Publish to Scribble Maps"))
+        self.label.setText(_translate("ScribbleMapsShareViewDialogBase", "Your map has been published! You can find it here:"))
+        self.lblLink.setText(_translate("ScribbleMapsShareViewDialogBase", "LINK GOES HERE"))
+        self.pbCopyLink.setText(_translate("ScribbleMapsShareViewDialogBase", "Copy Link"))
+        self.pbVisitMap.setText(_translate("ScribbleMapsShareViewDialogBase", "Visit Map"))
+        self.pbClose.setText(_translate("ScribbleMapsShareViewDialogBase", "Close"))
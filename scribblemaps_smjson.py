@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.PyQt.QtCore import QVariant, QDate, QDateTime, QTime, Qt
+from qgis.core import *
+
+import os
+import json
+import math
+from tempfile import NamedTemporaryFile
+
+# SMJSON stores coordinates as [lat, lng] pairs (the same order as the map view's center), always in WGS84.
+# Overlays can nest: a layer or group is itself an overlay with an "overlays" list of its own.
+
+POINT_TYPES = ('marker', 'point', 'label', 'text', 'image')
+LINE_TYPES = ('line', 'polyline', 'path')
+POLYGON_TYPES = ('polygon', 'shape', 'rectangle', 'circle')
+
+COORD_KEYS = ('coords', 'points', 'latLngs', 'path')
+
+NAME_FIELDS = ('name', 'title')
+DESCRIPTION_FIELDS = ('description', 'descriptio', 'desc')
+
+CIRCLE_SEGMENTS = 64
+METRES_PER_DEGREE = 111320.0
+
+class ScribbleMapsSmJsonWriter:
+    # Builds one SMJSON document overlay by overlay, so a map is serialized exactly once and never held as a whole in
+    # memory. Each overlay is encoded and written to a temp file as soon as it is written; charLength counts what has
+    # been written so far (the output is ASCII-only, so characters and bytes are the same). Call finish() once with
+    # the map view, then upload the file at path, or read it back a chunk at a time.
+
+    def __init__(self):
+        self.file = NamedTemporaryFile(mode='w+b', suffix='.smjson', delete=False)
+        self.path = self.file.name
+        self.charLength = 0
+        self.overlayCount = 0
+        self._write('{"overlays":[')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, text):
+        data = text.encode('ascii')
+        self.file.write(data)
+        self.charLength += len(data)
+
+    def writeOverlay(self, overlay):
+        # Returns the overlay as encoded, so it can be cached and written again later with writeEncodedOverlay
+        encoded = json.dumps(overlay)
+        self.writeEncodedOverlay(encoded)
+        return encoded
+
+    def writeEncodedOverlay(self, encoded):
+        self._write((',' if self.overlayCount else '') + encoded)
+        self.overlayCount += 1
+
+    def finish(self, view):
+        self._write('],"view":' + json.dumps(view) + '}')
+        self.file.flush()
+
+    def read(self, size):
+        # Always from the start of the document, e.g. to log the beginning of what failed to upload
+        self.file.seek(0)
+        return self.file.read(size)
+
+    def chunks(self, size=1024 * 1024):
+        self.file.seek(0)
+        chunk = self.file.read(size)
+        while chunk:
+            yield chunk
+            chunk = self.file.read(size)
+
+    def close(self):
+        self.file.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+def smjsonFields():
+    fields = QgsFields()
+    fields.append(QgsField('name', QVariant.String))
+    fields.append(QgsField('description', QVariant.String))
+    fields.append(QgsField('smType', QVariant.String))
+    fields.append(QgsField('style', QVariant.String))
+    return fields
+
+def smjsonToFeatures(document, fields=None, skipped=None):
+    # Returns {'Point': [...], 'LineString': [...], 'Polygon': [...]} - QgsFeatures ready for one bulk addFeatures
+    # per memory layer. Geometries are built straight from the coordinate arrays, with no OGR round trip.
+    # An overlay in a shape we don't understand is left out rather than failing the whole map; if skipped is given
+    # (a list), each one left out is added to it.
+    if fields is None:
+        fields = smjsonFields()
+
+    features = {'Point': [], 'LineString': [], 'Polygon': []}
+    stack = list(reversed(document.get("overlays") or []))
+    while stack:
+        overlay = stack.pop()
+        if not isinstance(overlay, dict):
+            continue
+
+        children = overlay.get("overlays")
+        if children:
+            stack.extend(reversed(children))
+
+        try:
+            (geometryType, geometry) = overlayGeometry(overlay)
+            if geometry is None:
+                continue
+
+            feature = QgsFeature(fields)
+            feature.setGeometry(geometry)
+            style = overlay.get("style")
+            feature.setAttributes([
+                overlay.get("title") or overlay.get("name"),
+                overlay.get("description"),
+                overlay.get("type"),
+                json.dumps(style) if style else None
+            ])
+        except (TypeError, ValueError, IndexError, KeyError):
+            if skipped is not None:
+                skipped.append(overlay)
+            continue
+        features[geometryType].append(feature)
+
+    return features
+
+def overlayGeometry(overlay):
+    overlayType = str(overlay.get("type", '')).lower()
+    coords = _overlayCoords(overlay)
+
+    if overlayType in POINT_TYPES:
+        point = coords if coords else overlay.get("center")
+        if isinstance(point, (list, tuple)) and point and isinstance(point[0], (list, tuple, dict)):
+            point = point[0]
+        (lat, lng) = _latLng(point)
+        if lat is None:
+            return (None, None)
+        return ('Point', QgsGeometry(QgsPoint(lng, lat)))
+
+    if overlayType == 'circle':
+        return ('Polygon', _circleGeometry(overlay))
+
+    if overlayType == 'rectangle' and overlay.get("bounds"):
+        ((south, west), (north, east)) = [_latLng(corner) for corner in overlay["bounds"]]
+        coords = [[south, west], [south, east], [north, east], [north, west], [south, west]]
+
+    if not coords:
+        return (None, None)
+
+    if overlayType in LINE_TYPES:
+        return ('LineString', QgsGeometry(_lineString(coords)))
+
+    if overlayType in POLYGON_TYPES:
+        # Either a single ring, or a list of rings where the first is the outer boundary and the rest are holes
+        rings = coords if isinstance(coords[0], (list, tuple)) and coords[0] and isinstance(coords[0][0], (list, tuple, dict)) else [coords]
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(_lineString(rings[0], close=True))
+        for hole in rings[1:]:
+            polygon.addInteriorRing(_lineString(hole, close=True))
+        return ('Polygon', QgsGeometry(polygon))
+
+    return (None, None)
+
+def _overlayCoords(overlay):
+    for key in COORD_KEYS:
+        if overlay.get(key):
+            return overlay[key]
+    return None
+
+def _latLng(value):
+    if isinstance(value, dict):
+        return (value.get("lat"), value.get("lng", value.get("lon")))
+    if isinstance(value, (list, tuple)) and len(value) >= 2:
+        return (value[0], value[1])
+    return (None, None)
+
+def _lineString(coords, close=False):
+    if coords and isinstance(coords[0], dict):
+        coords = [_latLng(coord) for coord in coords]
+    # One constructor call with whole x and y arrays, rather than a QgsPoint per vertex
+    xs = [coord[1] for coord in coords]
+    ys = [coord[0] for coord in coords]
+    if close and (xs[0] != xs[-1] or ys[0] != ys[-1]):
+        xs.append(xs[0])
+        ys.append(ys[0])
+    return QgsLineString(xs, ys)
+
+def _circleGeometry(overlay):
+    (lat, lng) = _latLng(overlay.get("center") or _overlayCoords(overlay))
+    radius = overlay.get("radius")
+    if lat is None or not radius:
+        return None
+
+    # Good enough for display - a polygon approximating the circle on the sphere around its center
+    latRadius = radius / METRES_PER_DEGREE
+    lngRadius = radius / (METRES_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+    angles = [2 * math.pi * i / CIRCLE_SEGMENTS for i in range(CIRCLE_SEGMENTS)]
+    xs = [lng + lngRadius * math.cos(angle) for angle in angles]
+    ys = [lat + latRadius * math.sin(angle) for angle in angles]
+    xs.append(xs[0])
+    ys.append(ys[0])
+
+    polygon = QgsPolygon()
+    polygon.setExteriorRing(QgsLineString(xs, ys))
+    return QgsGeometry(polygon)
+
+def layerToSmJson(layerName, source, fields, transformContext):
+    # Builds the SMJSON for one layer locally - a layer overlay holding one overlay per feature part - so publishing
+    # doesn't have to send the layer to /api/import/kml first. source is any QgsFeatureSource; pass a
+    # QgsVectorLayerFeatureSource to read a project layer safely from a task thread.
+    request = QgsFeatureRequest()
+    request.setDestinationCrs(QgsCoordinateReferenceSystem('EPSG:4326'), transformContext)
+    return {
+        'type': 'layer',
+        'title': layerName,
+        'overlays': featuresToOverlays(source.getFeatures(request), fields)
+    }
+
+def featuresToOverlays(features, fields):
+    nameIndex = _findField(fields, NAME_FIELDS)
+    descriptionIndex = _findField(fields, DESCRIPTION_FIELDS)
+    fieldNames = fields.names()
+
+    overlays = []
+    for feature in features:
+        geometry = feature.geometry()
+        if geometry.isNull():
+            continue
+
+        attributes = feature.attributes()
+        title = _jsonValue(attributes[nameIndex]) if nameIndex >= 0 else None
+        description = _jsonValue(attributes[descriptionIndex]) if descriptionIndex >= 0 else None
+        data = dict((name, _jsonValue(value)) for (name, value) in zip(fieldNames, attributes))
+
+        # Multi-part features become one overlay per part, as Scribble Maps has no multi-geometry overlays
+        for part in geometry.asGeometryCollection():
+            overlay = partToOverlay(part)
+            if overlay is None:
+                continue
+            overlay["title"] = title or ''
+            overlay["description"] = description or ''
+            overlay["data"] = data
+            overlays.append(overlay)
+
+    return overlays
+
+def partToOverlay(part):
+    if QgsWkbTypes.isCurvedType(part.wkbType()):
+        part = QgsGeometry(part.constGet().segmentize())
+
+    geometryType = QgsWkbTypes.geometryType(part.wkbType())
+    if geometryType == QgsWkbTypes.PointGeometry:
+        point = part.asPoint()
+        return {'type': 'marker', 'coords': [point.y(), point.x()]}
+    if geometryType == QgsWkbTypes.LineGeometry:
+        return {'type': 'line', 'coords': _latLngs(part.asPolyline())}
+    if geometryType == QgsWkbTypes.PolygonGeometry:
+        rings = [_latLngs(ring) for ring in part.asPolygon()]
+        if not rings:
+            return None
+        # Plain polygons keep the simple single-ring form; only polygons with holes need the list of rings
+        return {'type': 'polygon', 'coords': rings[0] if len(rings) == 1 else rings}
+    return None
+
+def _latLngs(points):
+    return [[point.y(), point.x()] for point in points]
+
+def _findField(fields, candidates):
+    lowerNames = [name.lower() for name in fields.names()]
+    for candidate in candidates:
+        if candidate in lowerNames:
+            return lowerNames.index(candidate)
+    return -1
+
+def _jsonValue(value):
+    if value is None or (isinstance(value, QVariant) and value.isNull()):
+        return None
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (QDate, QDateTime, QTime)):
+        return value.toString(Qt.ISODate)
+    return str(value)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import *
+
+class ScribbleMapsTaskCanceled(Exception):
+    pass
+
+class ScribbleMapsTask(QgsTask):
+    # Runs function(task, *args) on a QGIS task manager thread. Whatever it returns is handed to onFinished, and
+    # anything it raises to onError - both are called back on the main thread, so they can safely touch the GUI.
+
+    def __init__(self, description, function, args, onFinished=None, onError=None, flags=QgsTask.CanCancel):
+        super(ScribbleMapsTask, self).__init__(description, flags)
+        self.function = function
+        self.args = args
+        self.onFinished = onFinished
+        self.onError = onError
+        self.result = None
+        self.exception = None
+
+    def checkCanceled(self):
+        # For functions to call between steps of long-running work, so a canceled task stops at the next step
+        if self.isCanceled():
+            raise ScribbleMapsTaskCanceled(self.description())
+
+    def run(self):
+        try:
+            self.result = self.function(self, *self.args)
+            return True
+        except Exception as e:
+            # Whatever a canceled task stopped with (e.g. its aborted request) is reported as the cancel it was
+            self.exception = ScribbleMapsTaskCanceled(self.description()) if self.isCanceled() else e
+            return False
+
+    def finished(self, succeeded):
+        if succeeded:
+            if self.onFinished:
+                self.onFinished(self.result)
+        elif self.onError:
+            self.onError(self.exception or ScribbleMapsTaskCanceled(self.description()))
+
+class ScribbleMapsTaskRunner:
+    # Keeps our tasks referenced until they complete - the task manager doesn't hold on to the Python objects, and
+    # a task that gets garbage collected mid-run takes QGIS down with it.
+
+    def __init__(self, exceptionHandler=None):
+        self.tasks = set()
+        self.exceptionHandler = exceptionHandler
+
+    def run(self, description, function, *args, onFinished=None, onError=None):
+        task = ScribbleMapsTask(description, function, args, self._wrap(onFinished), self._wrap(onError))
+        task.taskCompleted.connect(lambda: self.tasks.discard(task))
+        task.taskTerminated.connect(lambda: self.tasks.discard(task))
+        self.tasks.add(task)
+        QgsApplication.taskManager().addTask(task)
+        return task
+
+    def cancel(self, task):
+        # Only tasks still running - the task manager deletes finished ones
+        if task in self.tasks:
+            task.cancel()
+
+    def cancelAll(self):
+        for task in list(self.tasks):
+            task.cancel()
+
+    def _wrap(self, callback):
+        if callback is None:
+            return None
+        # Callbacks run from QgsTask.finished, where an uncaught exception would be swallowed without a trace
+        def wrapped(value):
+            try:
+                callback(value)
+            except Exception as e:
+                if self.exceptionHandler:
+                    self.exceptionHandler(e)
+                else:
+                    QgsMessageLog.logMessage('Unhandled error in task callback: {}'.format(e), 'Scribble Maps', Qgis.Critical)
+        return wrapped
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.PyQt.QtCore import *
+from qgis.PyQt.QtGui import *
+
+import os
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .scribblemaps_cacheutil import conditionalHeaders, readJsonFile, writeJsonFile
+
+class ScribbleMapsThumbnailCache(QObject):
+    # Size-bounded on-disk cache of thumbnails, already scaled to the 100x100 the map table shows. Entries are keyed
+    # by thumbnail URL, remember the ETag/Last-Modified they were served with for revalidation, and the least
+    # recently used ones are evicted once the cache grows past maxBytes. The index is only touched from the main
+    # thread; write() is the one method that's safe to call from the loader's decode threads.
+
+    THUMB_SIZE = 100
+
+    def __init__(self, cacheDir, maxBytes=32 * 1024 * 1024, maxAge=7 * 24 * 3600, parent=None):
+        super(ScribbleMapsThumbnailCache, self).__init__(parent)
+        self.cacheDir = cacheDir
+        self.maxBytes = maxBytes
+        self.maxAge = maxAge
+        self.indexPath = os.path.join(cacheDir, 'index.json')
+
+        os.makedirs(cacheDir, exist_ok=True)
+        entries = readJsonFile(self.indexPath)
+        self.entries = entries if isinstance(entries, dict) else {}
+
+        # Writing the index after every thumbnail would hammer the disk while a list fills in; batch it up instead
+        self.saveTimer = QTimer(self)
+        self.saveTimer.setSingleShot(True)
+        self.saveTimer.setInterval(1000)
+        self.saveTimer.timeout.connect(self.save)
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cacheDir, key + '.png')
+
+    def lookup(self, url):
+        entry = self.entries.get(self._key(url))
+        if entry is None or not os.path.isfile(self._path(self._key(url))):
+            return None
+        return entry
+
+    def isFresh(self, entry):
+        return time.time() - entry["validated"] < self.maxAge
+
+    def path(self, url):
+        return self._path(self._key(url))
+
+    def touch(self, url):
+        # Marks the cached thumbnail as just used, and returns the file it's in
+        entry = self.entries.get(self._key(url))
+        if entry is not None:
+            entry["lastUsed"] = time.time()
+            self.saveTimer.start()
+        return self.path(url)
+
+    def revalidated(self, url):
+        # Server answered 304 Not Modified - the cached copy is good for another maxAge
+        entry = self.entries.get(self._key(url))
+        if entry is not None:
+            entry["validated"] = time.time()
+        return self.touch(url)
+
+    def write(self, url, image, etag=None, lastModified=None):
+        # Saves an already scaled thumbnail, and returns the index entry to hand to stored() on the main thread
+        path = self.path(url)
+        if not image.save(path, 'PNG'):
+            return None
+
+        now = time.time()
+        return {
+            'url': url,
+            'etag': etag,
+            'lastModified': lastModified,
+            'size': os.path.getsize(path),
+            'validated': now,
+            'lastUsed': now
+        }
+
+    def stored(self, entry):
+        self.entries[self._key(entry["url"])] = entry
+        self.evict()
+        self.saveTimer.start()
+
+    def forget(self, url):
+        # The cached file is missing or unreadable
+        if self.entries.pop(self._key(url), None) is not None:
+            self.saveTimer.start()
+
+    def evict(self):
+        totalBytes = sum(entry["size"] for entry in self.entries.values())
+        if totalBytes <= self.maxBytes:
+            return
+
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["lastUsed"]):
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+            del self.entries[key]
+            totalBytes -= entry["size"]
+            if totalBytes <= self.maxBytes:
+                break
+
+    def save(self):
+        writeJsonFile(self.indexPath, self.entries)
+
+class ScribbleMapsThumbnailLoader(QObject):
+    # Fetches thumbnails only for the rows currently visible in the map table (plus a small look-ahead), a few at a
+    # time, and hands each one back as soon as it arrives so the list can be shown before any images are in.
+    # Reading, decoding, scaling and caching happen on decode threads; the GUI thread only ever gets ready-to-paint
+    # QImages, and the downloaded bytes are let go as soon as they're decoded.
+
+    thumbnailLoaded = pyqtSignal(int, QImage)
+    # Emitted from the decode threads, so it's queued across to this object's thread
+    thumbnailDecoded = pyqtSignal(int, int, object)
+
+    def __init__(self, api, table, cache=None, maxConcurrent=6, lookAhead=10, decodeThreads=2, parent=None):
+        super(ScribbleMapsThumbnailLoader, self).__init__(parent)
+        self.api = api
+        self.cache = cache
+        self.table = table
+        self.maxConcurrent = maxConcurrent
+        self.lookAhead = lookAhead
+
+        self.urls = []
+        self.requested = set()
+        self.queue = []
+        self.inFlight = {}
+        self.generation = 0
+
+        self.decoder = ThreadPoolExecutor(max_workers=decodeThreads)
+        self.thumbnailDecoded.connect(self._decodeFinished)
+
+        # Scrolling fires a burst of events; only work out what's visible once things settle
+        self.scheduleTimer = QTimer(self)
+        self.scheduleTimer.setSingleShot(True)
+        self.scheduleTimer.setInterval(50)
+        self.scheduleTimer.timeout.connect(self.loadVisible)
+
+        self.table.verticalScrollBar().valueChanged.connect(self.scheduleVisible)
+        self.table.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.scheduleVisible()
+        return False
+
+    def setUrls(self, urls):
+        self.clear()
+        self.urls = list(urls)
+        self.scheduleVisible()
+
+    def clear(self):
+        # Anything still in flight belongs to the previous list - drop it and ignore its late replies
+        self.generation += 1
+        for pending in list(self.inFlight.values()):
+            self.api.abort(pending)
+        self.inFlight = {}
+        self.queue = []
+        self.requested = set()
+        self.urls = []
+
+    def close(self):
+        self.clear()
+        self.decoder.shutdown(wait=True)
+
+    def scheduleVisible(self):
+        if self.urls:
+            self.scheduleTimer.start()
+
+    def loadVisible(self):
+        if not self.urls:
+            return
+
+        firstRow = self.table.rowAt(0)
+        if firstRow < 0:
+            firstRow = 0
+        lastRow = self.table.rowAt(self.table.viewport().height() - 1)
+        if lastRow < 0:
+            lastRow = len(self.urls) - 1
+        lastRow = min(lastRow + self.lookAhead, len(self.urls) - 1)
+
+        # Rows that scrolled out of view before their turn came are simply dropped from the queue
+        self.queue = [row for row in range(firstRow, lastRow + 1) if row not in self.requested and self.urls[row]]
+        self._startNext()
+
+    def _startNext(self):
+        while self.queue and len(self.inFlight) < self.maxConcurrent:
+            row = self.queue.pop(0)
+            url = self.urls[row]
+            self.requested.add(row)
+
+            headers = {}
+            entry = self.cache.lookup(url) if self.cache else None
+            if entry is not None:
+                if self.cache.isFresh(entry):
+                    self._decode(row, self._readCached, url, self.cache.touch(url))
+                    continue
+                headers = conditionalHeaders(entry)
+
+            # Our own cache does the revalidation, so keep these out of the QGIS network cache
+            generation = self.generation
+            self.inFlight[row] = self.api.requestAsync('GET', url, lambda response, row=row, generation=generation: self._thumbnailFinished(row, generation, response), headers=headers, cacheable=self.cache is None)
+
+    def _thumbnailFinished(self, row, generation, response):
+        if generation != self.generation:
+            return
+
+        self.inFlight.pop(row, None)
+        url = self.urls[row]
+        if response.status_code == 304 and self.cache:
+            self._decode(row, self._readCached, url, self.cache.revalidated(url))
+        elif response.status_code == 200:
+            self._decode(row, self._decodeDownload, url, response.content, response.header('ETag'), response.header('Last-Modified'))
+        self._startNext()
+
+    def _decode(self, row, decodeFn, *args):
+        generation = self.generation
+        self.decoder.submit(lambda: self.thumbnailDecoded.emit(row, generation, decodeFn(*args)))
+
+    # These two run on the decode threads, and return (url, image or None, new cache entry or None)
+
+    def _readCached(self, url, path):
+        image = QImage(path)
+        if image.isNull():
+            return (url, None, None)
+        return (url, image.convertToFormat(QImage.Format_ARGB32_Premultiplied), None)
+
+    def _decodeDownload(self, url, imageBytes, etag, lastModified):
+        image = QImage.fromData(imageBytes)
+        if image.isNull():
+            return (url, None, None)
+
+        size = ScribbleMapsThumbnailCache.THUMB_SIZE
+        image = image.scaled(size, size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        entry = self.cache.write(url, image, etag, lastModified) if self.cache else None
+        return (url, image, entry)
+
+    def _decodeFinished(self, row, generation, result):
+        (url, image, entry) = result
+        # The file's written either way, so the cache keeps it even if the list has moved on since
+        if self.cache:
+            if entry is not None:
+                self.cache.stored(entry)
+            elif image is None:
+                self.cache.forget(url)
+
+        if generation == self.generation and image is not None:
+            self.thumbnailLoaded.emit(row, image)
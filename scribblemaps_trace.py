@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+/***************************************************************************
+ ScribbleMapsConnector
+ This plugin allows you to visualize your Scribble Maps data.
+ copyright (C) 2020 by Scribble Maps
+ ***************************************************************************/
+
+/***************************************************************************
+ *                                                                         *
+ *   This program is free software; you can redistribute it and/or modify  *
+ *   it under the terms of the GNU General Public License as published by  *
+ *   the Free Software Foundation; either version 2 of the License, or     *
+ *   (at your option) any later version.                                   *
+ *                                                                         *
+ ***************************************************************************/
+"""
+
+from qgis.core import *
+
+import os
+import json
+import time
+import threading
+
+class ScribbleMapsSpan:
+    # One timed phase of an operation. Use it as a context manager around work that starts and ends in one place,
+    # or keep it and call finish() from whichever callback ends the phase. Counts like bytes and features can be
+    # added along the way with set().
+
+    def __init__(self, tracer, name, args, root):
+        self.tracer = tracer
+        self.name = name
+        self.args = dict(args)
+        self.root = root
+        self.threadId = threading.get_ident()
+        self.start = time.perf_counter()
+        self.duration = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        if excValue is not None:
+            self.args["error"] = str(excValue)
+        self.finish()
+
+    def set(self, **args):
+        self.args.update(args)
+        return self
+
+    def finish(self, **args):
+        # Only the first call counts, so error and success paths can both finish a span safely
+        if self.duration is not None:
+            return
+        self.args.update(args)
+        self.duration = time.perf_counter() - self.start
+        self.tracer._record(self)
+
+class ScribbleMapsTracer:
+    # Times the phases of auth, list, load and publish operations. Every finished span goes to its own tab in the
+    # QGIS log panel; if scribblemaps/traceFile is set, spans are also kept (up to maxEvents) and written there as a
+    # Chrome trace (chrome://tracing, Perfetto) each time a top-level operation finishes.
+
+    LOG_TAG = 'Scribble Maps Trace'
+
+    def __init__(self, traceFile=None, maxEvents=20000):
+        self.traceFile = traceFile
+        self.maxEvents = maxEvents
+        self.events = []
+        self.lock = threading.Lock()
+        self.epoch = time.perf_counter()
+        self.pid = os.getpid()
+
+    def span(self, name, root=False, **args):
+        return ScribbleMapsSpan(self, name, args, root)
+
+    def _record(self, span):
+        details = ', '.join('{}={}'.format(key, value) for (key, value) in sorted(span.args.items()))
+        QgsMessageLog.logMessage('{}{}: {:.1f} ms{}'.format('' if span.root else '  ', span.name, span.duration * 1000, (' (' + details + ')') if details else ''), self.LOG_TAG, Qgis.Info)
+
+        if not self.traceFile:
+            return
+        event = {
+            'name': span.name,
+            'ph': 'X',
+            'ts': int((span.start - self.epoch) * 1e6),
+            'dur': int(span.duration * 1e6),
+            'pid': self.pid,
+            'tid': span.threadId,
+            'args': span.args
+        }
+        with self.lock:
+            self.events.append(event)
+            if len(self.events) > self.maxEvents:
+                del self.events[:len(self.events) - self.maxEvents]
+        if span.root:
+            self.flush()
+
+    def flush(self):
+        if not self.traceFile:
+            return
+        with self.lock:
+            events = list(self.events)
+        tempPath = self.traceFile + '.tmp'
+        try:
+            with open(tempPath, 'w') as traceFile:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, traceFile, default=str)
+            os.replace(tempPath, self.traceFile)
+        except OSError as e:
+            QgsMessageLog.logMessage('Unable to write trace file ' + self.traceFile + ': ' + str(e), self.LOG_TAG, Qgis.Warning)